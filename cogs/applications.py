@@ -2,6 +2,7 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
+from utils.guild_registry import guild_registry
 from utils.config import (
     APPLICATIONS_CHANNEL_ID,
     APPLICATION_PANEL_TITLE,
@@ -70,7 +71,7 @@ class Applications(commands.Cog):
         # ROLE MENTION HELPER
         # =========================
         def role_mention(name: str) -> str:
-            role = discord.utils.get(guild.roles, name=name)
+            role = guild_registry(guild).role(name)
             return role.mention if role else f"@{name}"
 
         # =========================
@@ -3,6 +3,7 @@ from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
 
+from utils.guild_registry import guild_registry
 from utils.config import (
     NFL_TEAMS,
     TEAM_COLORS,
@@ -12,6 +13,7 @@ from utils.config import (
 )
 
 from utils.helpers import find_text_channel_fuzzy
+from utils.permissions import Cap, requires
 
 
 class Appoint(commands.Cog):
@@ -30,6 +32,7 @@ class Appoint(commands.Cog):
         team_role="Select the team role"
     )
     @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @requires(Cap.SFG, "❌ Only users with the **SFG** role can use this command.")
     async def appoint(
         self,
         interaction: discord.Interaction,
@@ -52,13 +55,6 @@ class Appoint(commands.Cog):
                 ephemeral=True
             )
 
-        # ✅ Only SFG role
-        if not any(r.name == "SFG" for r in issuer.roles):
-            return await interaction.followup.send(
-                "❌ Only users with the **SFG** role can use this command.",
-                ephemeral=True
-            )
-
         # ✅ Ensure valid team role
         if team_role.name not in NFL_TEAMS:
             return await interaction.followup.send(
@@ -74,7 +70,7 @@ class Appoint(commands.Cog):
                 ephemeral=True
             )
 
-        fo_role = discord.utils.get(guild.roles, name="Franchise Owner")
+        fo_role = guild_registry(guild).role("Franchise Owner")
         if not fo_role:
             return await interaction.followup.send(
                 "❌ Role not found: **Franchise Owner**",
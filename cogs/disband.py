@@ -3,6 +3,7 @@ from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
 
+from utils.roster_index import ROSTERS
 from utils.config import (
     NFL_TEAMS,
     TEAM_COLORS,
@@ -12,6 +13,7 @@ from utils.config import (
 )
 
 from utils.helpers import find_text_channel_fuzzy
+from utils.permissions import Cap, requires
 
 
 class Disband(commands.Cog):
@@ -30,6 +32,7 @@ class Disband(commands.Cog):
         reason="Why is this team being disbanded?"
     )
     @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @requires(Cap.SFG, "❌ Only users with the **SFG** role can use this command.")
     async def disband(
         self,
         interaction: discord.Interaction,
@@ -52,13 +55,6 @@ class Disband(commands.Cog):
                 ephemeral=True
             )
 
-        # ✅ Only SFG role
-        if not any(r.name == "SFG" for r in issuer.roles):
-            return await interaction.followup.send(
-                "❌ Only users with the **SFG** role can use this command.",
-                ephemeral=True
-            )
-
         # ✅ Ensure it's actually a valid team role
         if team_role.name not in NFL_TEAMS:
             return await interaction.followup.send(
@@ -83,7 +79,7 @@ class Disband(commands.Cog):
             r for r in guild.roles if r.name in mgmt_role_names
         ]
 
-        members_to_update = list(team_role.members)
+        members_to_update = ROSTERS.roster(guild, team_role.name)
 
         for member in members_to_update:
             roles_to_remove = []
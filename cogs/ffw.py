@@ -3,6 +3,7 @@ from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
 
+from utils.guild_registry import guild_registry
 from utils.config import (
     GUILD_ID,
     NFL_TEAMS,
@@ -17,32 +18,15 @@ from utils.standings import (
     update_game_result,
     post_or_update_standings,
 )
-
-
-def normalize_team_name(name: str) -> str:
-    return (
-        name.replace(" ", "")
-            .replace(".", "")
-            .replace("-", "")
-            .lower()
-    )
+from utils.permissions import Cap, requires
 
 
 def get_team_emoji(guild: discord.Guild, team_name: str) -> str:
-    if not guild:
+    if not guild or not TEAM_EMOJI_NAME.get(team_name):
         return ""
 
-    emoji_name = TEAM_EMOJI_NAME.get(team_name)
-    if not emoji_name:
-        return ""
-
-    normalized_lookup = normalize_team_name(emoji_name)
-
-    for emoji in guild.emojis:
-        if normalize_team_name(emoji.name) == normalized_lookup:
-            return str(emoji)
-
-    return ""
+    emoji = guild_registry(guild).team_emoji(team_name)
+    return str(emoji) if emoji else ""
 
 
 class FFW(commands.Cog):
@@ -58,6 +42,7 @@ class FFW(commands.Cog):
         losing_team="Team taking the forfeit loss"
     )
     @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @requires(Cap.SFG, "❌ Only users with the **SFG** role can use this command.")
     async def ffw(
         self,
         interaction: discord.Interaction,
@@ -74,12 +59,6 @@ class FFW(commands.Cog):
         if not isinstance(issuer, discord.Member):
             return await interaction.followup.send("Couldn’t verify roles.", ephemeral=True)
 
-        if not any(r.name == "SFG" for r in issuer.roles):
-            return await interaction.followup.send(
-                "❌ Only users with the **SFG** role can use this command.",
-                ephemeral=True
-            )
-
         if winning_team.name not in NFL_TEAMS:
             return await interaction.followup.send(
                 "❌ The winning team role is not a valid team.",
@@ -102,7 +81,7 @@ class FFW(commands.Cog):
         loser = losing_team.name
 
         try:
-            update_game_result(winner, loser, 14, 0)
+            game = update_game_result(winner, loser, 14, 0, source="ffw")
         except Exception as e:
             return await interaction.followup.send(
                 f"❌ Failed to update standings.\n```{type(e).__name__}: {e}```",
@@ -160,7 +139,7 @@ class FFW(commands.Cog):
             embed.set_thumbnail(url=SFG_LOGO_URL)
 
         embed.set_footer(
-            text="SFG League Operations",
+            text=f"SFG League Operations • Game #{game['seq']}",
             icon_url=SFG_LOGO_URL
         )
 
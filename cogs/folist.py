@@ -3,6 +3,8 @@ from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
 
+from utils.guild_registry import guild_registry
+from utils.roster_index import ROSTERS
 from utils.config import (
     NFL_TEAMS,
     SFG_LOGO_URL,
@@ -36,7 +38,7 @@ class FOList(commands.Cog):
                 ephemeral=True
             )
 
-        fo_role = discord.utils.get(guild.roles, name="Franchise Owner")
+        fo_role = guild_registry(guild).role("Franchise Owner")
         if not fo_role:
             return await interaction.followup.send(
                 "❌ Role not found: **Franchise Owner**",
@@ -54,10 +56,7 @@ class FOList(commands.Cog):
             owner_text = "N/A"
 
             if team_role:
-                owners = [
-                    m.mention for m in fo_role.members
-                    if team_role in m.roles
-                ]
+                owners = [m.mention for m in ROSTERS.staff_of(guild, team_role.name, "Franchise Owner")]
                 if owners:
                     owner_text = ", ".join(owners)
 
@@ -1,80 +1,13 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import json
-from pathlib import Path
+import asyncio
 
 from utils.config import GUILD_ID
 from utils.standings import update_game_result, post_or_update_standings
+from utils.schedule_index import schedule_index, mark_played
 
-from services.stats_sheet import (
-    append_qb_statline,
-    append_wr_statline,
-    append_db_statline,
-    append_de_statline,
-    commit_all_stats,
-)
-
-
-# =========================
-# SCHEDULE FILE
-# =========================
-BASE_DIR = Path(__file__).resolve().parent.parent
-SCHEDULE_FILE = BASE_DIR / "data" / "schedule.json"
-
-
-def load_schedule():
-    if SCHEDULE_FILE.exists():
-        with open(SCHEDULE_FILE, "r") as f:
-            return json.load(f)
-    return None
-
-
-def normalize_team(name: str):
-    return name.strip()
-
-
-def is_valid_game(team_a, team_b):
-    data = load_schedule()
-    if not data:
-        return False
-
-    team_a = normalize_team(team_a)
-    team_b = normalize_team(team_b)
-
-    current_week = str(data.get("current_week", 1))
-    games = data.get("weeks", {}).get(current_week, [])
-
-    for a, b in games:
-        if {normalize_team(a), normalize_team(b)} == {team_a, team_b}:
-            return True
-
-    return False
-
-
-def already_played(team_a, team_b):
-    data = load_schedule()
-    if not data:
-        return False
-
-    matchup = sorted([normalize_team(team_a), normalize_team(team_b)])
-    return matchup in data.get("played", [])
-
-
-def mark_played(team_a, team_b):
-    data = load_schedule()
-    if not data:
-        return
-
-    played = data.setdefault("played", [])
-
-    matchup = sorted([normalize_team(team_a), normalize_team(team_b)])
-
-    if matchup not in played:
-        played.append(matchup)
-
-    with open(SCHEDULE_FILE, "w") as f:
-        json.dump(data, f, indent=4)
+from services.report_parser import MAX_REPORT_BYTES, parse_report
 
 
 class GameReport(commands.Cog):
@@ -132,13 +65,17 @@ class GameReport(commands.Cog):
         # =========================
         # SCHEDULE VALIDATION
         # =========================
-        if not is_valid_game(team1_name, team2_name):
+        index = schedule_index()
+
+        if not index.is_current_week_game(team1_name, team2_name):
+            opponent = index.opponent(team1_name)
+            hint = f" {team1_name} plays {opponent} this week." if opponent else ""
             return await interaction.followup.send(
-                "❌ This matchup is not on the schedule.",
+                f"❌ This matchup is not on the schedule.{hint}",
                 ephemeral=True
             )
 
-        if already_played(team1_name, team2_name):
+        if index.already_played(team1_name, team2_name):
             return await interaction.followup.send(
                 "❌ This game has already been reported.",
                 ephemeral=True
@@ -147,15 +84,15 @@ class GameReport(commands.Cog):
         # =========================
         # JSON PARSE
         # =========================
+        if json_file.size > MAX_REPORT_BYTES:
+            return await interaction.followup.send(
+                f"❌ Invalid JSON file.\n`File is too large (max {MAX_REPORT_BYTES // 1024} KB).`",
+                ephemeral=True
+            )
+
         try:
             raw = await json_file.read()
-            text = raw.decode("utf-8", errors="ignore")
-
-            start = text.find("{")
-            if start == -1:
-                raise ValueError("No JSON found.")
-
-            game_data = json.loads(text[start:])
+            statlines = await parse_report(raw)
 
         except Exception as e:
             return await interaction.followup.send(
@@ -167,64 +104,16 @@ class GameReport(commands.Cog):
             # =========================
             # UPDATE STANDINGS
             # =========================
-            update_game_result(team1_name, team2_name, score1, score2)
+            game = update_game_result(team1_name, team2_name, score1, score2, source="gamereport")
             await post_or_update_standings(guild)
 
             # =========================
             # PROCESS STATS
             # =========================
-            for player in game_data.values():
-
-                qb = player.get("qb", {})
-                wr = player.get("wr", {})
-                db = player.get("db", {})
-                de = player.get("def", {})
-                other = player.get("other", {})
-
-                name = (
-                    other.get("display")
-                    or other.get("name")
-                    or "Unknown"
-                )
-
-                team_name = other.get("team", "Free Agent")
-
-                if qb.get("yds", 0) > 0:
-                    append_qb_statline(
-                        name, team_name,
-                        qb.get("qbr", qb.get("rtng", 0)),
-                        qb.get("comp", 0),
-                        qb.get("yds", 0),
-                        qb.get("td", 0),
-                        qb.get("int", qb.get("ints", 0))
-                    )
-
-                if wr.get("yds", 0) > 0:
-                    append_wr_statline(
-                        name, team_name,
-                        wr.get("rec", 0),
-                        wr.get("yds", 0),
-                        wr.get("td", 0),
-                        wr.get("fum", 0)
-                    )
-
-                if db.get("int", 0) > 0 or db.get("defl", 0) > 0:
-                    append_db_statline(
-                        name, team_name,
-                        db.get("defl", 0),
-                        db.get("int", 0),
-                        db.get("rtng", 0)
-                    )
-
-                if de.get("sack", 0) > 0:
-                    append_de_statline(
-                        name, team_name,
-                        de.get("sack", 0),
-                        de.get("safe", 0),
-                        de.get("ffum", 0)
-                    )
-
-            commit_all_stats()
+            # players are credited to their Discord members (Bloxlink, saved links, names)
+            await self.bot.process_report_stats(guild, statlines, game)
+            from services.stats_sheet import commit_all_stats
+            await asyncio.to_thread(commit_all_stats)
 
             # =========================
             # MARK GAME AS PLAYED
@@ -261,7 +150,7 @@ class GameReport(commands.Cog):
             )
 
             embed.set_footer(
-                text=f"Submitted by {interaction.user.display_name}"
+                text=f"Game #{game['seq']} • Submitted by {interaction.user.display_name}"
             )
 
             files = [
@@ -281,7 +170,7 @@ class GameReport(commands.Cog):
             )
 
         await interaction.followup.send(
-            "✅ Game report processed successfully.",
+            f"✅ Game report processed successfully (game #{game['seq']}).",
             ephemeral=True
         )
 
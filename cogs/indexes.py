@@ -0,0 +1,139 @@
+import discord
+from discord.ext import commands
+
+from utils.config import GUILD_ID, NFL_TEAMS
+from utils.guild_registry import REGISTRIES, invalidate_guild
+from utils.member_index import MEMBER_NAMES
+from utils.permissions import PERMISSIONS
+from utils.roster_index import MANAGEMENT_TIERS, ROSTERS
+
+
+class Indexes(commands.Cog):
+    """Keeps the in-memory guild indexes (member names, rosters, roles / emojis / channels, permissions) in step with gateway events."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    def _ours(self, guild: discord.Guild) -> bool:
+        return guild is not None and guild.id == GUILD_ID
+
+    # =========================
+    # BUILD
+    # =========================
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # role / emoji / channel maps rebuild lazily from the fresh cache
+        REGISTRIES.clear()
+        PERMISSIONS.clear()
+
+        guild = self.bot.get_guild(GUILD_ID)
+        if guild is None:
+            return
+
+        MEMBER_NAMES.build(guild)
+        ROSTERS.build(guild)
+        stats = MEMBER_NAMES.memory_stats()
+        print(
+            f"📇 Member name index: {stats['members']} members, {stats['names']} names, "
+            f"~{stats['approx_bytes'] // 1024} KB{'' if MEMBER_NAMES.complete else ' (member list not fully chunked)'}"
+        )
+        print(
+            f"🏈 Roster index: {len(ROSTERS.teams_by_member)} players on {len(ROSTERS.rosters)} teams"
+            f"{'' if ROSTERS.ready else ' (member list not fully chunked, using role scans)'}"
+        )
+
+    # =========================
+    # MEMBER EVENTS
+    # =========================
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        if self._ours(member.guild) and MEMBER_NAMES.ready:
+            MEMBER_NAMES.add(member)
+        if self._ours(member.guild) and ROSTERS.ready:
+            ROSTERS.add(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        PERMISSIONS.invalidate_member(member.guild.id, member.id)
+        if self._ours(member.guild) and MEMBER_NAMES.ready:
+            MEMBER_NAMES.remove(member.id)
+        if self._ours(member.guild) and ROSTERS.ready:
+            ROSTERS.remove(member.id)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles != after.roles:
+            PERMISSIONS.invalidate_member(after.guild.id, after.id)
+        if self._ours(after.guild) and MEMBER_NAMES.ready:
+            MEMBER_NAMES.update(after)
+        if self._ours(after.guild) and ROSTERS.ready:
+            ROSTERS.update(after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        # username / global name changes arrive here, not as member updates
+        guild = self.bot.get_guild(GUILD_ID)
+        if guild is None or not MEMBER_NAMES.ready:
+            return
+
+        member = guild.get_member(after.id)
+        if member is not None:
+            MEMBER_NAMES.update(member)
+
+    # =========================
+    # GUILD REGISTRY
+    # =========================
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        invalidate_guild(role.guild.id, roles=True)
+        PERMISSIONS.invalidate_guild(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        invalidate_guild(role.guild.id, roles=True)
+        PERMISSIONS.invalidate_guild(role.guild.id)
+        self._refile_roster(role.guild, role.name)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        # position-only moves change which duplicate name wins, so rebuild on those too
+        if before.name != after.name or before.position != after.position:
+            invalidate_guild(after.guild.id, roles=True)
+        # names and permission bits both feed member capability masks
+        if before.name != after.name or before.permissions != after.permissions:
+            PERMISSIONS.invalidate_guild(after.guild.id)
+        # a reorder changes which team role comes first for a member
+        self._refile_roster(after.guild, before.name, after.name)
+
+    @commands.Cog.listener()
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        # the owner implicitly holds every permission, so ADMIN/MODERATOR moves with it
+        if before.owner_id != after.owner_id:
+            PERMISSIONS.invalidate_guild(after.id)
+
+    def _refile_roster(self, guild: discord.Guild, *role_names: str):
+        # team and management roles are rare to rename or delete; just rebuild
+        watched = set(NFL_TEAMS) | set(MANAGEMENT_TIERS)
+        if self._ours(guild) and ROSTERS.ready and watched.intersection(role_names):
+            ROSTERS.build(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_emojis_update(self, guild: discord.Guild, before, after):
+        invalidate_guild(guild.id, emojis=True)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        invalidate_guild(channel.guild.id, channels=True)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        invalidate_guild(channel.guild.id, channels=True)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        if before.name != after.name or before.position != after.position or before.category != after.category:
+            invalidate_guild(after.guild.id, channels=True)
+
+
+async def setup(bot):
+    await bot.add_cog(Indexes(bot))
@@ -0,0 +1,101 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+from typing import Optional
+
+from utils.config import GUILD_ID, SFG_LOGO_URL
+
+# value is "POS:stat" — the column in services.stats_sheet.STAT_COLUMNS
+LEADER_STATS = {
+    "QB:yds": "QB Passing Yards",
+    "QB:td": "QB Passing TDs",
+    "QB:comp": "QB Completions",
+    "QB:int": "QB Interceptions Thrown",
+    "QB:qbr": "QB Rating",
+    "WR:yds": "WR Receiving Yards",
+    "WR:td": "WR Receiving TDs",
+    "WR:rec": "WR Receptions",
+    "WR:fum": "WR Fumbles",
+    "DB:int": "DB Interceptions",
+    "DB:defl": "DB Deflections",
+    "DB:rtng": "DB Rating",
+    "DE:sack": "DE Sacks",
+    "DE:ff": "DE Forced Fumbles",
+    "DE:safe": "DE Safeties",
+}
+
+
+class Leaders(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    # =========================
+    # /leaders
+    # =========================
+    @app_commands.command(
+        name="leaders",
+        description="Show the season leaders for a stat."
+    )
+    @app_commands.describe(
+        stat="Stat to rank by",
+        count="How many players to show",
+        from_week="Optional: only count games from this week on",
+        to_week="Optional: only count games up to this week",
+        per_game="Rank by per-game average instead of the season total",
+    )
+    @app_commands.choices(
+        stat=[app_commands.Choice(name=label, value=value) for value, label in LEADER_STATS.items()]
+    )
+    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    async def leaders(
+        self,
+        interaction: discord.Interaction,
+        stat: app_commands.Choice[str],
+        count: app_commands.Range[int, 1, 25] = 10,
+        from_week: Optional[app_commands.Range[int, 1, 31]] = None,
+        to_week: Optional[app_commands.Range[int, 1, 31]] = None,
+        per_game: bool = False,
+    ):
+        # stats_sheet (NumPy) loads on first use rather than with the cog
+        from services.stats_sheet import top_players, stat_leaders
+
+        pos, column = stat.value.split(":")
+
+        title = f"📊 {stat.name} Leaders"
+        if per_game:
+            title += " (per game)"
+
+        if from_week is None and to_week is None and not per_game:
+            # season totals are kept ranked already
+            top = top_players(pos, column, count)
+        else:
+            weeks = None
+            if from_week is not None or to_week is not None:
+                weeks = (from_week or 1, to_week or 31)
+                if weeks[0] > weeks[1]:
+                    return await interaction.response.send_message(
+                        "❌ `from_week` must be before `to_week`.",
+                        ephemeral=True
+                    )
+                title += f" — Weeks {weeks[0]}–{weeks[1]}" if to_week else f" — Week {weeks[0]} on"
+            top = stat_leaders(pos, column, count, weeks=weeks, per_game=per_game)
+
+        embed = discord.Embed(
+            title=title,
+            color=discord.Color.blue(),
+        )
+        embed.set_thumbnail(url=SFG_LOGO_URL)
+
+        if not top:
+            embed.description = "No stats recorded for that range yet."
+        else:
+            embed.description = "\n".join(
+                f"**{i}.** {p['player']} ({p['team']}) — **{p[column]}**"
+                for i, (_, p) in enumerate(top, start=1)
+            )
+
+        await interaction.response.send_message(embed=embed)
+
+
+async def setup(bot):
+    await bot.add_cog(Leaders(bot))
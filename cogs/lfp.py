@@ -3,6 +3,8 @@ from discord import app_commands
 from discord.ext import commands
 from datetime import datetime
 
+from utils.guild_registry import guild_registry
+from utils.roster_index import ROSTERS
 from utils.config import GUILD_ID
 from utils.helpers import find_text_channel_fuzzy
 from utils.constants import NFL_TEAMS, TEAM_COLORS
@@ -31,11 +33,14 @@ class LFP(commands.Cog):
                 ephemeral=True
             )
 
-        # ✅ FLEXIBLE TEAM DETECTION
-        team_role = next(
-            (r for r in member.roles if any(team in r.name for team in NFL_TEAMS)),
-            None
-        )
+        # ✅ FLEXIBLE TEAM DETECTION (exact team role first, then any role naming a team)
+        team = ROSTERS.team_of(member)
+        team_role = guild_registry(guild).role(team) if team else None
+        if not team_role:
+            team_role = next(
+                (r for r in member.roles if any(team in r.name for team in NFL_TEAMS)),
+                None
+            )
 
         if not team_role:
             return await interaction.followup.send(
@@ -5,7 +5,8 @@ from datetime import datetime, timedelta
 
 from utils.config import GUILD_ID
 from utils.constants import SCHEDULE_CHANNEL_ID
-from utils.standings import TEAM_EMOJIS, load_standings
+from utils.standings import TEAM_EMOJIS, standings_view
+from utils.permissions import Cap, requires
 from cogs.schedule import load_schedule, save_schedule
 
 
@@ -44,7 +45,7 @@ def point_diff(stats: dict) -> int:
 
 
 def get_seed_map(schedule_data: dict) -> dict[str, int]:
-    standings = load_standings()
+    standings = standings_view()
     season_teams = get_schedule_teams(schedule_data)
 
     ranked = sorted(
@@ -61,7 +62,7 @@ def get_seed_map(schedule_data: dict) -> dict[str, int]:
 
 
 def get_record(team: str) -> str:
-    standings = load_standings()
+    standings = standings_view()
     stats = get_stats(team, standings)
 
     wins = int(stats.get("wins", 0))
@@ -130,11 +131,9 @@ class NextWeek(commands.Cog):
 
     @app_commands.command(name="nextweek", description="Advance to next week")
     @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @requires(Cap.SFG, "No permission.")
     async def nextweek(self, interaction: discord.Interaction):
 
-        if "sfg" not in [r.name.lower() for r in interaction.user.roles]:
-            return await interaction.response.send_message("No permission.", ephemeral=True)
-
         data = load_schedule()
 
         current = int(data.get("current_week", 1))
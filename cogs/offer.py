@@ -3,8 +3,9 @@ from discord import app_commands
 from discord.ext import commands
 from datetime import datetime
 
+from utils.guild_registry import guild_registry
+from utils.roster_index import ROSTERS
 from utils.config import (
-    NFL_TEAMS,
     TEAM_COLORS,
     TEAM_THUMBNAILS,
     SFG_LOGO_URL,
@@ -38,10 +39,7 @@ class Offer(commands.Cog):
             )
 
         # 🔒 Check coach role
-        coach_team = next(
-            (r.name for r in author.roles if r.name in NFL_TEAMS),
-            None
-        )
+        coach_team = ROSTERS.team_of(author)
 
         if not coach_team:
             return await interaction.followup.send(
@@ -50,7 +48,7 @@ class Offer(commands.Cog):
             )
 
         # 🔒 Get team role
-        team_role = discord.utils.get(guild.roles, name=coach_team)
+        team_role = guild_registry(guild).role(coach_team)
 
         if not team_role:
             return await interaction.followup.send(
@@ -59,13 +57,11 @@ class Offer(commands.Cog):
             )
 
         # 🔒 Check if player already signed
-        for t in NFL_TEAMS:
-            role = discord.utils.get(guild.roles, name=t)
-            if role and role in user.roles:
-                return await interaction.followup.send(
-                    "Cant send offer, player is already signed.",
-                    ephemeral=True
-                )
+        if ROSTERS.team_of(user):
+            return await interaction.followup.send(
+                "Cant send offer, player is already signed.",
+                ephemeral=True
+            )
 
         # 🎨 Embed
         color = TEAM_COLORS.get(coach_team, 0x2F3136)
@@ -2,8 +2,8 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
-from typing import Optional
 
+from utils.roster_index import ROSTERS
 from utils.config import (
     NFL_TEAMS,
     TEAM_COLORS,
@@ -45,24 +45,18 @@ class Roster(commands.Cog):
         team_name = team_role.name
         emoji = TEAM_EMOJIS.get(team_name, "")
 
-        players = team_role.members
+        players = ROSTERS.roster(guild, team_name)
 
         color = TEAM_COLORS.get(team_name, 0x2F3136)
         thumb_url = TEAM_THUMBNAILS.get(team_name)
 
-        owner_role = discord.utils.get(guild.roles, name="Franchise Owner")
-        president_role = discord.utils.get(guild.roles, name="Team President")
-        gm_role = discord.utils.get(guild.roles, name="General Manager")
-
-        def staff_for_team(role: Optional[discord.Role]) -> str:
-            if not role:
-                return "N/A"
-            matched = [m.mention for m in role.members if team_role in m.roles]
+        def staff_for_team(tier: str) -> str:
+            matched = [m.mention for m in ROSTERS.staff_of(guild, team_name, tier)]
             return ", ".join(matched) if matched else "N/A"
 
-        owners = staff_for_team(owner_role)
-        presidents = staff_for_team(president_role)
-        gms = staff_for_team(gm_role)
+        owners = staff_for_team("Franchise Owner")
+        presidents = staff_for_team("Team President")
+        gms = staff_for_team("General Manager")
 
         # 🔥 CLEAN ROSTER LIST
         if players:
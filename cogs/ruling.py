@@ -3,6 +3,7 @@ from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
 
+from utils.guild_registry import guild_registry
 from utils.config import (
     GUILD_ID,
     SFG_LOGO_URL,
@@ -10,6 +11,7 @@ from utils.config import (
     SUSPENDED_ROLE_NAME,
     BLACKLIST_ROLE_NAME
 )
+from utils.permissions import Cap, requires
 
 
 class Ruling(commands.Cog):
@@ -37,6 +39,7 @@ class Ruling(commands.Cog):
         ]
     )
     @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @requires(Cap.MODERATOR, "❌ No permission.")
     async def ruling(
         self,
         interaction: discord.Interaction,
@@ -56,16 +59,6 @@ class Ruling(commands.Cog):
         if not isinstance(issuer, discord.Member):
             return await interaction.followup.send("Couldn’t verify roles.", ephemeral=True)
 
-        # =========================
-        # PERMISSIONS
-        # =========================
-        perms = issuer.guild_permissions
-        if not (perms.administrator or perms.ban_members or perms.manage_guild):
-            return await interaction.followup.send(
-                "❌ No permission.",
-                ephemeral=True
-            )
-
         if user.id == issuer.id:
             return await interaction.followup.send(
                 "❌ You can't punish yourself.",
@@ -105,7 +98,7 @@ class Ruling(commands.Cog):
         try:
 
             if punishment.value == "Suspension":
-                role = discord.utils.get(guild.roles, name=SUSPENDED_ROLE_NAME)
+                role = guild_registry(guild).role(SUSPENDED_ROLE_NAME)
 
                 if not role:
                     return await interaction.followup.send(
@@ -118,7 +111,7 @@ class Ruling(commands.Cog):
 
 
             elif punishment.value == "Blacklist":
-                role = discord.utils.get(guild.roles, name=BLACKLIST_ROLE_NAME)
+                role = guild_registry(guild).role(BLACKLIST_ROLE_NAME)
 
                 if not role:
                     return await interaction.followup.send(
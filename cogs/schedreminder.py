@@ -1,23 +1,23 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from pathlib import Path
-import json
 from datetime import datetime, timedelta
 
+from utils.guild_registry import guild_registry
+from utils.roster_index import ROSTERS
 from utils.config import GUILD_ID, SFG_LOGO_URL
-
-SCHEDULE_FILE = Path(__file__).resolve().parent.parent / "data" / "schedule.json"
+from utils.storage import STORAGE, SCHEDULE_FILE, SQLITE_FILE
 
 LOGS_CHANNEL_ID = 1488388876262314194
 SUPPORT_SERVER = "https://discord.gg/sMpccTTX3"
 
 
 def load_schedule():
-    if SCHEDULE_FILE.exists():
-        with open(SCHEDULE_FILE, "r") as f:
-            return json.load(f)
-    return None
+    return STORAGE.load_schedule()
+
+
+def schedule_location():
+    return SQLITE_FILE if STORAGE.name == "sqlite" else SCHEDULE_FILE
 
 
 class ScheduleView(discord.ui.View):
@@ -112,7 +112,8 @@ class ScheduleReminder(commands.Cog):
     @app_commands.guilds(discord.Object(id=GUILD_ID))
     async def schedulepath(self, interaction: discord.Interaction):
         await interaction.response.send_message(
-            f"Looking for schedule here:\n`{SCHEDULE_FILE}`\n\nExists: `{SCHEDULE_FILE.exists()}`",
+            f"Looking for schedule here ({STORAGE.name}):\n`{schedule_location()}`\n\n"
+            f"Exists: `{schedule_location().exists()}`",
             ephemeral=True
         )
 
@@ -128,7 +129,7 @@ class ScheduleReminder(commands.Cog):
 
         if not data:
             return await interaction.followup.send(
-                f"No schedule found.\n\nLooking here:\n`{SCHEDULE_FILE}`",
+                f"No schedule found.\n\nLooking here:\n`{schedule_location()}`",
                 ephemeral=True
             )
 
@@ -154,8 +155,8 @@ class ScheduleReminder(commands.Cog):
         failed = []
 
         for team_a, team_b in games:
-            role_a = discord.utils.get(guild.roles, name=team_a)
-            role_b = discord.utils.get(guild.roles, name=team_b)
+            role_a = guild_registry(guild).role(team_a)
+            role_b = guild_registry(guild).role(team_b)
 
             if not role_a:
                 failed.append(f"{team_a} role not found.")
@@ -165,21 +166,8 @@ class ScheduleReminder(commands.Cog):
                 failed.append(f"{team_b} role not found.")
                 continue
 
-            owner_a = next(
-                (
-                    m for m in role_a.members
-                    if any(r.name == "Franchise Owner" for r in m.roles)
-                ),
-                None
-            )
-
-            owner_b = next(
-                (
-                    m for m in role_b.members
-                    if any(r.name == "Franchise Owner" for r in m.roles)
-                ),
-                None
-            )
+            owner_a = next(iter(ROSTERS.staff_of(guild, team_a, "Franchise Owner")), None)
+            owner_b = next(iter(ROSTERS.staff_of(guild, team_b, "Franchise Owner")), None)
 
             matchup = f"{team_a} vs {team_b}"
 
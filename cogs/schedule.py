@@ -1,74 +1,45 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import json
+import copy
 import random
-from pathlib import Path
+from typing import Optional
 from datetime import datetime, timedelta
 
-from utils.config import NFL_TEAMS, GUILD_ID
+from utils.guild_registry import guild_registry
+from utils.roster_index import ROSTERS
+from utils.config import GUILD_ID
 from utils.constants import SCHEDULE_CHANNEL_ID
-from utils.standings import TEAM_EMOJIS, load_standings
-
-
-SCHEDULE_FILE = Path(__file__).resolve().parent.parent / "data" / "schedule.json"
+from utils.standings import TEAM_EMOJIS, standings_view
+from utils.storage import STORAGE
+from utils.permissions import Cap, requires
+from utils import schedule_gen
 
 
 # =========================
 # LOAD / SAVE
 # =========================
 def load_schedule():
-    if SCHEDULE_FILE.exists():
-        with open(SCHEDULE_FILE, "r") as f:
-            return json.load(f)
-    return None
+    # callers edit and save it back, so hand out a copy of the cached one
+    return copy.deepcopy(STORAGE.load_schedule())
 
 
 def save_schedule(data):
-    with open(SCHEDULE_FILE, "w") as f:
-        json.dump(data, f, indent=4)
+    STORAGE.save_schedule(data)
 
 
 # =========================
 # GENERATE SCHEDULE
 # =========================
-def generate_schedule(teams, weeks=10):
-    teams = teams.copy()
-    random.shuffle(teams)
-
-    schedule = {str(w): [] for w in range(1, weeks + 1)}
-    matchups_played = set()
-
-    for week in range(1, weeks + 1):
-        available = teams.copy()
-        random.shuffle(available)
-
-        while len(available) >= 2:
-            t1 = available.pop()
-            t2 = None
-
-            for i, opp in enumerate(available):
-                matchup = tuple(sorted([t1, opp]))
-                if matchup not in matchups_played:
-                    t2 = opp
-                    available.pop(i)
-                    break
-
-            if t2 is None:
-                t2 = available.pop()
-
-            matchup = tuple(sorted([t1, t2]))
-            matchups_played.add(matchup)
-            schedule[str(week)].append([t1, t2])
-
-    return schedule
+def generate_schedule(teams, weeks=10, seed=None, strengths=None):
+    return schedule_gen.generate_schedule(teams, weeks=weeks, seed=seed, strengths=strengths)
 
 
 # =========================
 # BUILD WEEK EMBED
 # =========================
 def build_week_embed(week: str, games: list, data: dict):
-    standings = load_standings() or {}
+    standings = standings_view()
     teams_data = standings.get("teams", {})
 
     # Seed teams by wins, then point differential
@@ -203,13 +174,18 @@ class Schedule(commands.Cog):
     )
     @app_commands.describe(
         team_count="How many active teams to use",
-        deadline_hours="How many hours teams have to complete their games"
+        deadline_hours="How many hours teams have to complete their games",
+        weeks="Regular season length (default 10)",
+        seed="Reuse a seed to get the same schedule again"
     )
+    @requires(Cap.SFG, "You must have the SFG role to use this.")
     async def genschedule(
         self,
         interaction: discord.Interaction,
         team_count: app_commands.Choice[int],
-        deadline_hours: app_commands.Range[int, 1, 336]
+        deadline_hours: app_commands.Range[int, 1, 336],
+        weeks: app_commands.Range[int, 1, 31] = 10,
+        seed: Optional[int] = None
     ):
         guild = interaction.guild
         user = interaction.user
@@ -220,29 +196,14 @@ class Schedule(commands.Cog):
                 ephemeral=True
             )
 
-        user_role_names = [role.name.lower().strip() for role in user.roles]
-        if "sfg" not in user_role_names:
-            return await interaction.response.send_message(
-                "You must have the SFG role to use this.",
-                ephemeral=True
-            )
-
-        owner_role = discord.utils.get(guild.roles, name="Franchise Owner")
+        owner_role = guild_registry(guild).role("Franchise Owner")
         if owner_role is None:
             return await interaction.response.send_message(
                 "Franchise Owner role not found.",
                 ephemeral=True
             )
 
-        active_teams = []
-        for team_name in NFL_TEAMS:
-            role = discord.utils.get(guild.roles, name=team_name)
-            if role is None:
-                continue
-
-            has_owner = any(owner_role in member.roles for member in role.members)
-            if has_owner:
-                active_teams.append(team_name)
+        active_teams = ROSTERS.active_teams(guild)
 
         if len(active_teams) < team_count.value:
             return await interaction.response.send_message(
@@ -250,11 +211,24 @@ class Schedule(commands.Cog):
                 ephemeral=True
             )
 
-        selected_teams = random.sample(active_teams, team_count.value)
-        schedule = generate_schedule(selected_teams, weeks=10)
+        if seed is None:
+            seed = random.randrange(1_000_000)
+
+        rng = random.Random(seed)
+        selected_teams = rng.sample(active_teams, team_count.value)
+
+        strengths = schedule_gen.strengths_from_standings(
+            standings_view().get("teams", {}),
+            selected_teams
+        )
+        schedule = generate_schedule(selected_teams, weeks=weeks, seed=seed, strengths=strengths)
+        quality = schedule_gen.schedule_quality(schedule, strengths)
+
+        print(f"📅 Generated {weeks}-week schedule for {len(selected_teams)} teams (seed {seed}): {quality}")
 
         data = {
             "season": 1,
+            "seed": seed,
             "teams": selected_teams,
             "weeks": schedule,
             "messages": {},
@@ -281,7 +255,7 @@ class Schedule(commands.Cog):
         save_schedule(data)
 
         await interaction.response.send_message(
-            "✅ Schedule generated. Week 1 has been posted.",
+            f"✅ Schedule generated (seed `{seed}`). Week 1 has been posted.",
             ephemeral=True
         )
 
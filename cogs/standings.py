@@ -1,19 +1,34 @@
+import asyncio
 import discord
 from discord import app_commands
 from discord.ext import commands
 from typing import Optional
 
 from utils.config import GUILD_ID
+from utils.permissions import Cap, requires
 
 from utils.standings import (
     load_standings,
-    save_standings,
     post_or_update_standings,
     reset_standings,
+    void_game_result,
+    standings_at_week,
+    build_standings_embed,
     STANDINGS_LOCK,
 )
 
 
+async def refresh_stats_totals():
+    """Totals come from statlines; rebuild them after a void or a new season."""
+    from services.stats_sheet import recompute_totals, commit_all_stats
+
+    try:
+        await asyncio.to_thread(recompute_totals)
+        await asyncio.to_thread(commit_all_stats)
+    except Exception as e:
+        print(f"⚠️ Stats recompute failed: {type(e).__name__}: {e}")
+
+
 class Standings(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -26,7 +41,12 @@ class Standings(commands.Cog):
         description="Post or refresh the current SFG standings."
     )
     @app_commands.guilds(discord.Object(id=GUILD_ID))
-    async def standings_cmd(self, interaction: discord.Interaction):
+    @app_commands.describe(week="Optional: preview the standings as of the end of this week")
+    async def standings_cmd(
+        self,
+        interaction: discord.Interaction,
+        week: Optional[int] = None,
+    ):
 
         guild = interaction.guild
         if not guild:
@@ -37,6 +57,19 @@ class Standings(commands.Cog):
 
         await interaction.response.defer(ephemeral=True)
 
+        # past weeks are replayed from the game ledger and shown privately
+        if week is not None:
+            data = standings_at_week(week)
+            if data is None:
+                return await interaction.followup.send(
+                    "❌ No game ledger for this season yet.",
+                    ephemeral=True
+                )
+
+            embed = build_standings_embed(data)
+            embed.title = f"{embed.title} — After Week {week}"
+            return await interaction.followup.send(embed=embed, ephemeral=True)
+
         # ✅ DO NOT FILTER HERE — utils handles it
         await post_or_update_standings(guild)
 
@@ -54,6 +87,7 @@ class Standings(commands.Cog):
     )
     @app_commands.guilds(discord.Object(id=GUILD_ID))
     @app_commands.describe(season="Optional: set season number manually")
+    @requires(Cap.LEAGUE_STAFF, "❌ Only **SFG** or server admins can use `/resetstandings`.")
     async def resetstandings(
         self,
         interaction: discord.Interaction,
@@ -66,22 +100,6 @@ class Standings(commands.Cog):
                 ephemeral=True
             )
 
-        if not isinstance(interaction.user, discord.Member):
-            return await interaction.response.send_message(
-                "Permission check failed.",
-                ephemeral=True
-            )
-
-        # 🔒 PERMISSIONS
-        is_sfg = any(r.name.lower() == "sfg" for r in interaction.user.roles)
-        perms = interaction.user.guild_permissions
-
-        if not (is_sfg or perms.administrator or perms.manage_guild):
-            return await interaction.response.send_message(
-                "❌ Only **SFG** or server admins can use `/resetstandings`.",
-                ephemeral=True
-            )
-
         await interaction.response.defer(ephemeral=True)
 
         async with STANDINGS_LOCK:
@@ -96,23 +114,64 @@ class Standings(commands.Cog):
             else:
                 new_season = int(data.get("season", 1)) + 1
 
-            # reset standings
-            reset_standings()
-
-            data = load_standings()
-            data["season"] = new_season
-            data["standings_message_id"] = msg_id
-
-            save_standings(data)
+            # reset standings (starts a new season in the game ledger)
+            reset_standings(season=new_season, standings_message_id=msg_id)
 
         # update message
         await post_or_update_standings(guild)
+        await refresh_stats_totals()
 
         await interaction.followup.send(
             f"✅ Standings reset. Now starting **Season {new_season}**.",
             ephemeral=True
         )
 
+    # =========================
+    # /voidresult
+    # =========================
+    @app_commands.command(
+        name="voidresult",
+        description="Void a reported game by its game number (SFG/Admin only)."
+    )
+    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.describe(
+        game="Game number from the score post footer",
+        reason="Why is this result being voided?"
+    )
+    @requires(Cap.LEAGUE_STAFF, "❌ Only **SFG** or server admins can use `/voidresult`.")
+    async def voidresult(
+        self,
+        interaction: discord.Interaction,
+        game: int,
+        reason: str,
+    ):
+        guild = interaction.guild
+        if not guild or not isinstance(interaction.user, discord.Member):
+            return await interaction.response.send_message(
+                "Server-only command.",
+                ephemeral=True
+            )
+
+        await interaction.response.defer(ephemeral=True)
+
+        try:
+            async with STANDINGS_LOCK:
+                entry = void_game_result(
+                    game,
+                    source=f"voidresult:{interaction.user.id}",
+                    reason=reason,
+                )
+        except ValueError as e:
+            return await interaction.followup.send(f"❌ {e}", ephemeral=True)
+
+        await post_or_update_standings(guild)
+        await refresh_stats_totals()
+
+        await interaction.followup.send(
+            f"✅ Voided game #{game}: **{entry['t1']} {entry['s1']} - {entry['s2']} {entry['t2']}**.",
+            ephemeral=True
+        )
+
     @app_commands.command(
         name="refreshstandings",
         description="Refresh the standings embed without resetting records."
@@ -16,17 +16,20 @@ from utils.config import (
     TWITCH_LOGO_URL
 )
 
+from utils.guild_registry import guild_registry
 from utils.helpers import get_team_role
 from utils.config import STREAMS_CHANNEL_ID
 from utils.standings import TEAM_EMOJIS
 from utils.autocomplete import nfl_team_autocomplete
+from utils.storage import STORAGE
+from utils.permissions import Cap, requires
 
 
 # =========================
 # GLOBALS
 # =========================
 URL_REGEX = re.compile(r"^https?://")
-stream_cooldowns = {}
+STREAM_COOLDOWN_SCOPE = "stream"
 
 
 class Stream(commands.Cog):
@@ -54,6 +57,7 @@ class Stream(commands.Cog):
         ]
     )
     @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @requires(Cap.STREAMER, f"❌ You need the **{STREAMER_ROLE_NAME}** role to use `/stream`.")
     async def stream(
         self,
         interaction: discord.Interaction,
@@ -72,20 +76,11 @@ class Stream(commands.Cog):
         if not isinstance(member, discord.Member):
             return await interaction.followup.send("Couldn’t verify roles.", ephemeral=True)
 
-        # =========================
-        # ROLE CHECK
-        # =========================
-        if not any(r.name == STREAMER_ROLE_NAME for r in member.roles):
-            return await interaction.followup.send(
-                f"❌ You need the **{STREAMER_ROLE_NAME}** role to use `/stream`.",
-                ephemeral=True
-            )
-
         # =========================
         # COOLDOWN
         # =========================
         now = time.time()
-        last = stream_cooldowns.get(member.id, 0)
+        last = STORAGE.get_cooldown(STREAM_COOLDOWN_SCOPE, member.id)
 
         if now - last < STREAM_COOLDOWN_SECONDS:
             remaining = int(STREAM_COOLDOWN_SECONDS - (now - last))
@@ -165,16 +160,16 @@ class Stream(commands.Cog):
         )
 
         # Optional: reactions (only if emojis exist as real emojis)
-        for emoji in guild.emojis:
-            if emoji.name.lower() == team1.lower():
-                await msg.add_reaction(emoji)
-            if emoji.name.lower() == team2.lower():
+        reg = guild_registry(guild)
+        for team in (team1, team2):
+            emoji = reg.emoji_named(team)
+            if emoji:
                 await msg.add_reaction(emoji)
 
         # =========================
         # SET COOLDOWN
         # =========================
-        stream_cooldowns[member.id] = now
+        STORAGE.set_cooldown(STREAM_COOLDOWN_SCOPE, member.id, now)
 
         # =========================
         # RESPONSE
@@ -5,26 +5,23 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
+from utils.guild_registry import guild_registry
+from utils.roster_index import ROSTERS
+from utils.permissions import Cap, has_cap, management_rank
 from utils.config import GUILD_ID
 from utils.constants import (
-    NFL_TEAMS,
     TEAM_COLORS,
     TEAM_THUMBNAILS,
     SFG_LOGO_URL,
     ROSTER_LIMIT,
 )
 from utils.helpers import log_transaction
+from utils.storage import STORAGE
 
 
-DEMAND_COOLDOWNS: dict[int, float] = {}
+DEMAND_COOLDOWN_SCOPE = "demand"
 DEMAND_COOLDOWN_SECONDS = 48 * 60 * 60
 
-MANAGEMENT_ROLE_NAMES = [
-    "Franchise Owner",
-    "Team President",
-    "General Manager",
-]
-
 PROMOTABLE_ROLE_NAMES = [
     "Team President",
     "General Manager",
@@ -59,24 +56,19 @@ class Team(commands.Cog):
     # HELPERS
     # =========================
     def get_member_team_role(self, member: discord.Member) -> discord.Role | None:
-        return next((r for r in member.roles if r.name in NFL_TEAMS), None)
+        team = ROSTERS.team_of(member)
+        return guild_registry(member.guild).role(team) if team else None
 
     def get_member_team_name(self, member: discord.Member) -> str:
         role = self.get_member_team_role(member)
         return role.name if role else ""
 
     def has_management_role(self, member: discord.Member) -> bool:
-        return any(r.name in MANAGEMENT_ROLE_NAMES for r in member.roles)
+        return has_cap(member, Cap.MANAGEMENT)
 
     def get_highest_management_name(self, member: discord.Member) -> str | None:
         # hierarchy by power
-        if any(r.name == "Franchise Owner" for r in member.roles):
-            return "Franchise Owner"
-        if any(r.name == "Team President" for r in member.roles):
-            return "Team President"
-        if any(r.name == "General Manager" for r in member.roles):
-            return "General Manager"
-        return None
+        return management_rank(member)
 
     def can_manage_role(self, actor: discord.Member, target_role_name: str) -> bool:
         actor_rank = self.get_highest_management_name(actor)
@@ -210,7 +202,7 @@ class Team(commands.Cog):
                 ephemeral=True
             )
 
-        target_role = discord.utils.get(guild.roles, name=role_name)
+        target_role = guild_registry(guild).role(role_name)
         if not target_role:
             return await interaction.response.send_message(
                 f"Role not found: {role_name}",
@@ -292,7 +284,7 @@ class Team(commands.Cog):
                 ephemeral=True
             )
 
-        target_role = discord.utils.get(guild.roles, name=role_name)
+        target_role = guild_registry(guild).role(role_name)
         if not target_role:
             return await interaction.response.send_message(
                 f"Role not found: {role_name}",
@@ -344,7 +336,7 @@ class Team(commands.Cog):
             )
 
         now = time.time()
-        last_used = DEMAND_COOLDOWNS.get(user.id, 0)
+        last_used = STORAGE.get_cooldown(DEMAND_COOLDOWN_SCOPE, user.id)
 
         if now - last_used < DEMAND_COOLDOWN_SECONDS:
             remaining = int(DEMAND_COOLDOWN_SECONDS - (now - last_used))
@@ -363,10 +355,10 @@ class Team(commands.Cog):
             )
 
         team_name = team_role.name
-        roster_before = len(team_role.members)
+        roster_before = len(ROSTERS.roster(guild, team_role.name))
         roster_after = max(0, roster_before - 1)
 
-        DEMAND_COOLDOWNS[user.id] = now
+        STORAGE.set_cooldown(DEMAND_COOLDOWN_SCOPE, user.id, now)
         await user.remove_roles(team_role)
 
         embed = self.build_team_embed(
@@ -9,19 +9,17 @@ import datetime
 from typing import Optional, Tuple, Any, Dict, List
 from pathlib import Path
 
+# everything below is what a cold start pays before the bot exists
+_IMPORTS_STARTED = time.perf_counter()
+
 from dotenv import load_dotenv
 
 import discord
 from discord.ext import commands
 from discord import app_commands
 
-from services.stats_sheet import (
-    append_qb_statline,
-    append_wr_statline,
-    append_db_statline,
-    append_de_statline,
-    update_playerstats_top15,
-)
+from services.member_resolver import resolve_members
+from services.bloxlink import BloxlinkClient, BloxlinkError, BloxlinkResult, UNKNOWN
 
 from utils.config import (
     GUILD_ID,
@@ -44,16 +42,35 @@ from utils.config import (
     NFL_TEAMS,
     TEAM_COLORS,
     TEAM_THUMBNAILS,
-    TEAM_EMOJI_NAME,
     GAMETIME_TIME_CHOICES,
 )
 from utils.standings import (
     STANDINGS_LOCK,
     load_standings,
     save_standings,
+    update_game_result as record_game_result,
     post_or_update_standings,
+    start_standings_sync,
+    flush_standings,
 )
-from utils.helpers import log_transaction, find_text_channel_fuzzy, normalize_channel_name
+from utils.helpers import log_transaction, find_text_channel_fuzzy
+from utils.guild_registry import guild_registry
+from utils.roster_index import ROSTERS
+from utils.command_sync import sync_if_changed
+from utils.permissions import Cap, MissingCapability, has_cap, requires
+from utils.storage import STORAGE, DATA_DIR
+from utils.async_cache import AsyncTTLCache
+from utils.link_store import LinkStore
+from utils.member_index import MEMBER_NAMES
+from utils.team_matcher import TEAM_DETECTOR
+from services.fuzzy_match import Suggestion, suggest_members
+from services.report_parser import (
+    start_report_pool,
+    shutdown_report_pool,
+)
+from utils.extensions import Extension, load_extensions, print_startup_report
+
+MAIN_IMPORTS_MS = (time.perf_counter() - _IMPORTS_STARTED) * 1000
 
 # ✅ Load .env file
 load_dotenv()
@@ -88,14 +105,29 @@ GUILD_OBJ = discord.Object(id=GUILD_ID)
 
 ACTIVE_GAMEREPORTS: set[int] = set()
 
-ROBLOX_DISCORD_CACHE_FILE = "roblox_discord_cache.json"
-
 # =========================
 # BLOXLINK (CACHED) + ONE SHARED SESSION
 # =========================
-ROBLOX_BY_DISCORD_CACHE: dict[int, Tuple[int, float]] = {}
-DISCORD_BY_ROBLOX_CACHE: dict[int, Tuple[int, float]] = {}
+# None ("not linked") is cached too, for less time, so unlinked players
+# don't cost an API call on every report. Both caches persist across restarts.
 CACHE_TTL_SECONDS = 900  # 15 minutes
+NEGATIVE_CACHE_TTL_SECONDS = 300
+BLOXLINK_CACHE_MAX = 5000
+
+ROBLOX_BY_DISCORD_CACHE = AsyncTTLCache(
+    "roblox_by_discord",
+    maxsize=BLOXLINK_CACHE_MAX,
+    ttl=CACHE_TTL_SECONDS,
+    negative_ttl=NEGATIVE_CACHE_TTL_SECONDS,
+    path=DATA_DIR / "bloxlink_roblox_by_discord.json",
+)
+DISCORD_BY_ROBLOX_CACHE = AsyncTTLCache(
+    "discord_by_roblox",
+    maxsize=BLOXLINK_CACHE_MAX,
+    ttl=CACHE_TTL_SECONDS,
+    negative_ttl=NEGATIVE_CACHE_TTL_SECONDS,
+    path=DATA_DIR / "bloxlink_discord_by_roblox.json",
+)
 
 HTTP_SESSION: Optional[aiohttp.ClientSession] = None
 
@@ -106,81 +138,96 @@ async def get_http_session() -> aiohttp.ClientSession:
         HTTP_SESSION = aiohttp.ClientSession(timeout=timeout)
     return HTTP_SESSION
 
-async def bloxlink_discord_to_roblox_id(guild_id: int, discord_id: int) -> Optional[int]:
-    if not BLOXLINK_API_KEY:
-        return None
-
-    url = f"https://api.blox.link/v4/public/guilds/{guild_id}/discord-to-roblox/{discord_id}"
-    session = await get_http_session()
-    async with session.get(url, headers={"Authorization": BLOXLINK_API_KEY}) as resp:
-        if resp.status != 200:
-            return None
-        data = await resp.json()
+BLOXLINK = BloxlinkClient(BLOXLINK_API_KEY, get_http_session)
 
-    for key in ("robloxID", "robloxId", "roblox_id"):
-        if key in data and str(data[key]).isdigit():
-            return int(data[key])
 
-    user = data.get("user") or {}
-    for key in ("robloxID", "robloxId", "id"):
-        if key in user and str(user[key]).isdigit():
-            return int(user[key])
+def _linked_id(result: BloxlinkResult) -> Optional[int]:
+    """LINKED -> id, NOT_LINKED -> None; UNKNOWN raises so the caches skip it."""
+    if result.status == UNKNOWN:
+        raise BloxlinkError(result.reason or "no answer from Bloxlink")
+    return result.id
 
-    return None
+async def bloxlink_discord_to_roblox_id(guild_id: int, discord_id: int) -> Optional[int]:
+    if not BLOXLINK_API_KEY:
+        return None
+    return _linked_id(await BLOXLINK.discord_to_roblox(guild_id, discord_id))
 
 async def bloxlink_roblox_to_discord_id(guild_id: int, roblox_id: int) -> Optional[int]:
     if not BLOXLINK_API_KEY:
         return None
+    return _linked_id(await BLOXLINK.roblox_to_discord(guild_id, roblox_id))
 
-    url = f"https://api.blox.link/v4/public/guilds/{guild_id}/roblox-to-discord/{roblox_id}"
-    session = await get_http_session()
-    async with session.get(url, headers={"Authorization": BLOXLINK_API_KEY}) as resp:
-        if resp.status != 200:
-            print(f"Bloxlink API error: {resp.status}")
-            return None
-        
+async def get_cached_roblox_id(guild_id: int, discord_id: int) -> Optional[int]:
+    return await ROBLOX_BY_DISCORD_CACHE.get_or_load(
+        discord_id, lambda: bloxlink_discord_to_roblox_id(guild_id, discord_id)
+    )
+
+async def get_cached_discord_id(guild_id: int, roblox_id: int) -> Optional[int]:
+    return await DISCORD_BY_ROBLOX_CACHE.get_or_load(
+        roblox_id, lambda: bloxlink_roblox_to_discord_id(guild_id, roblox_id)
+    )
+
+async def persist_bloxlink_caches():
+    for cache in (ROBLOX_BY_DISCORD_CACHE, DISCORD_BY_ROBLOX_CACHE):
         try:
-            data = await resp.json()
-        except Exception as e:
-            text = await resp.text()
-            print("Bloxlink returned non-JSON response:")
-            print(text[:500])
-            return None
+            await cache.persist()
+        except OSError as e:
+            print(f"⚠️ Could not save {cache.name} cache: {e}")
 
-    for key in ("discordID", "discordId", "discord_id"):
-        if key in data and str(data[key]).isdigit():
-            return int(data[key])
+# lookups made since the last save are written out this often (and on shutdown)
+BLOXLINK_PERSIST_SECONDS = 300
 
-    user = data.get("user") or {}
-    for key in ("discordID", "discordId", "id"):
-        if key in user and str(user[key]).isdigit():
-            return int(user[key])
+async def _persist_bloxlink_loop():
+    while True:
+        await asyncio.sleep(BLOXLINK_PERSIST_SECONDS)
+        await persist_bloxlink_caches()
 
-    for key in ("discord", "discord_id"):
-        if key in data and str(data[key]).isdigit():
-            return int(data[key])
+async def _warm_stat_totals():
+    def warm():
+        from services.stats_sheet import warm_totals
+        warm_totals()
 
-    return None
+    try:
+        await asyncio.to_thread(warm)
+    except Exception as e:
+        print(f"⚠️ Loading stat totals failed: {type(e).__name__}: {e}")
 
-async def get_cached_roblox_id(guild_id: int, discord_id: int) -> Optional[int]:
-    now = time.time()
-    cached = ROBLOX_BY_DISCORD_CACHE.get(discord_id)
-    if cached and cached[1] > now:
-        return cached[0]
-    rid = await bloxlink_discord_to_roblox_id(guild_id, discord_id)
-    if rid:
-        ROBLOX_BY_DISCORD_CACHE[discord_id] = (rid, now + CACHE_TTL_SECONDS)
-    return rid
+def bloxlink_stats_lines() -> list[str]:
+    return [
+        f"📇 Bloxlink cache: {ROBLOX_BY_DISCORD_CACHE.stats()}",
+        f"📇 Bloxlink cache: {DISCORD_BY_ROBLOX_CACHE.stats()}",
+        f"🔗 Bloxlink client: {BLOXLINK.stats()}",
+    ]
 
-async def get_cached_discord_id(guild_id: int, roblox_id: int) -> Optional[int]:
-    now = time.time()
-    cached = DISCORD_BY_ROBLOX_CACHE.get(roblox_id)
-    if cached and cached[1] > now:
-        return cached[0]
-    did = await bloxlink_roblox_to_discord_id(guild_id, roblox_id)
-    if did:
-        DISCORD_BY_ROBLOX_CACHE[roblox_id] = (did, now + CACHE_TTL_SECONDS)
-    return did
+# =========================
+# EXTENSIONS
+# =========================
+# Loaded in waves by utils.extensions; `after` only where one cog imports
+# another. Load failures are reported and skipped, as before.
+EXTENSIONS = (
+    Extension("cogs.indexes"),
+    Extension("cogs.offer"),
+    Extension("cogs.team"),
+    Extension("cogs.rulebook"),
+    Extension("cogs.standings"),
+    Extension("cogs.members"),
+    Extension("cogs.lfp"),
+    Extension("cogs.gamereport"),
+    Extension("cogs.panel"),
+    Extension("cogs.roster"),
+    Extension("cogs.applications"),
+    Extension("cogs.disband"),
+    Extension("cogs.appoint"),
+    Extension("cogs.folist"),
+    Extension("cogs.stream"),
+    Extension("cogs.gametime"),
+    Extension("cogs.ruling"),
+    Extension("cogs.schedule"),
+    Extension("cogs.nextweek", after=("cogs.schedule",)),
+    Extension("cogs.schedreminder"),
+    Extension("cogs.ffw"),
+    Extension("cogs.leaders"),
+)
 
 # =========================
 # BOT CLASS (GUILD SYNC)
@@ -194,164 +241,55 @@ class SFGBot(commands.Bot):
         )
 
     async def setup_hook(self):
-        print("🔄 Loading cogs...")
         from utils.views import StreamClaimView
         self.add_view(StreamClaimView())
 
-        # =========================
-        # LOAD COGS
-        # =========================
-
-        try:
-            await self.load_extension("cogs.offer")
-            print("✅ Loaded cog: offer.py")
-        except Exception as e:
-            print(f"❌ Failed to load offer.py: {e}")
+        # standings saves push to GitHub from a background worker
+        start_standings_sync()
 
-        try:
-            await self.load_extension("cogs.team")
-            print("✅ Loaded cog: team.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load team.py: {e}")
-            traceback.print_exc()
+        # report exports are parsed in worker processes
+        start_report_pool()
 
-        try:
-            await self.load_extension("cogs.rulebook")
-            print("✅ Loaded cog: rulebook.py")
-        except Exception as e:
-            print(f"❌ Failed to load rulebook.py: {e}")
+        # Bloxlink answers from the last run that haven't expired yet
+        for cache in (ROBLOX_BY_DISCORD_CACHE, DISCORD_BY_ROBLOX_CACHE):
+            print(f"📇 Loaded {cache.load()} cached {cache.name} lookups")
 
-        try:
-            await self.load_extension("cogs.standings")
-            print("✅ Loaded cog: standings.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load standings.py: {e}")
-            traceback.print_exc()
+        # links picked up outside a report are written out on a timer
+        ROBLOX_LINKS.start_flusher()
+        self.bloxlink_persister = asyncio.create_task(_persist_bloxlink_loop(), name="bloxlink-cache-persist")
 
-        try:
-            await self.load_extension("cogs.members")
-            print("✅ Loaded cog: members.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load members.py: {e}")
-            traceback.print_exc()
-
-        try:
-            await self.load_extension("cogs.lfp")
-            print("✅ Loaded cog: lfp.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load lfp.py: {e}")
-            traceback.print_exc()
-
-        try:
-            await self.load_extension("cogs.gamereport")
-            print("✅ Loaded cog: gamereport.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load gamereport.py: {e}")
-            traceback.print_exc()
-
-        try:
-            await self.load_extension("cogs.panel")
-            print("✅ Loaded cog: panel.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load panel.py: {e}")
-            traceback.print_exc()
-
-        try:
-            await self.load_extension("cogs.roster")
-            print("✅ Loaded cog: roster.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load roster.py: {e}")
-            traceback.print_exc()
-        
-        try:
-            await self.load_extension("cogs.applications")
-            print("✅ Loaded cog: applications.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load applications.py: {e}")
-            traceback.print_exc()
+        # stat totals (NumPy + the whole statlines log) load off the startup path
+        self.stats_warmer = asyncio.create_task(_warm_stat_totals(), name="stats-warm")
 
-        try:
-            await self.load_extension("cogs.disband")
-            print("✅ Loaded cog: disband.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load disband.py: {e}")
-            traceback.print_exc()
-
-        try:
-            await self.load_extension("cogs.appoint")
-            print("✅ Loaded cog: appoint.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load appoint.py: {e}")
-            traceback.print_exc()
+        # =========================
+        # LOAD COGS
+        # =========================
+        print("🔄 Loading cogs...")
+        self.startup_report = await load_extensions(self, EXTENSIONS)
+        print_startup_report(self.startup_report, imports_ms=MAIN_IMPORTS_MS)
 
-        try:
-            await self.load_extension("cogs.folist")
-            print("✅ Loaded cog: folist.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load folist.py: {e}")
-            traceback.print_exc()
+    async def process_report_stats(self, guild: discord.Guild, statlines, game: dict) -> int:
+        # cogs can't import main; /gamereport reaches the Bloxlink resolver through the bot
+        return await process_report_stats(guild, statlines, game)
 
+    async def close(self):
+        # push any standings still waiting on the debounce window
         try:
-            await self.load_extension("cogs.stream")
-            print("✅ Loaded cog: stream.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load stream.py: {e}")
-            traceback.print_exc()
-        try:
-            await self.load_extension("cogs.gametime")
-            print("✅ Loaded cog: gametime.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load gametime.py: {e}")
-            traceback.print_exc()
-        try:
-            await self.load_extension("cogs.ruling")
-            print("✅ Loaded cog: ruling.py")
+            await flush_standings()
         except Exception as e:
-            import traceback
-            print(f"❌ Failed to load ruling.py: {e}")
-            traceback.print_exc()
+            print(f"⚠️ Standings flush on shutdown failed: {type(e).__name__}: {e}")
+
+        shutdown_report_pool()
+        if getattr(self, "bloxlink_persister", None):
+            self.bloxlink_persister.cancel()
+        await persist_bloxlink_caches()
+        for line in bloxlink_stats_lines():
+            print(line)
         try:
-            await self.load_extension("cogs.schedule")
-            print("✅ Loaded cog: schedule.py")
+            await ROBLOX_LINKS.close()
         except Exception as e:
-            import traceback
-            print(f"❌ Failed to load schedule.py: {e}")
-            traceback.print_exc()
-        try:
-            await self.load_extension("cogs.nextweek")
-            print("✅ Loaded cog: nextweek.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load nextweek.py: {e}")
-            traceback.print_exc()
-        try:
-            await self.load_extension("cogs.schedreminder")
-            print("✅ Loaded cog: schedreminder.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load schedreminder.py: {e}")
-            traceback.print_exc()
-        try:
-            await self.load_extension("cogs.ffw")
-            print("✅ Loaded cog: ffw.py")
-        except Exception as e:
-            import traceback
-            print(f"❌ Failed to load ffw.py: {e}")
-            traceback.print_exc()
-        
+            print(f"⚠️ Link store flush on shutdown failed: {type(e).__name__}: {e}")
+        await super().close()
 
 # =========================
 # CREATE BOT INSTANCE
@@ -360,6 +298,18 @@ class SFGBot(commands.Bot):
 bot = SFGBot()
 
 
+@bot.tree.error
+async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    # requires() has already told the user why
+    if isinstance(error, MissingCapability):
+        return
+
+    import traceback
+    command = interaction.command.qualified_name if interaction.command else "?"
+    print(f"❌ /{command} failed: {type(error).__name__}: {error}")
+    traceback.print_exception(type(error), error, error.__traceback__)
+
+
 # =========================
 # ON READY (SYNC COMMANDS)
 # =========================
@@ -371,9 +321,71 @@ async def on_ready():
 
     guild = discord.Object(id=GUILD_ID)
 
-    synced = await bot.tree.sync(guild=guild)
+    # on_ready also fires after every reconnect; only sync when the tree changed
+    try:
+        sync = await sync_if_changed(bot.tree, guild)
+        if sync["synced"]:
+            print(
+                f"🏠 Guild Synced: {sync['commands']} commands in {sync['sync_ms']:.0f} ms "
+                f"(fingerprint {sync['fingerprint'][:12]})"
+            )
+        else:
+            print(
+                f"🏠 Command tree unchanged ({sync['commands']} commands, fingerprint {sync['fingerprint'][:12]}): "
+                f"sync skipped, hashed in {sync['hash_ms']:.1f} ms, saved ~{sync['sync_ms']:.0f} ms"
+            )
+    except Exception as e:
+        print(f"❌ Command sync failed: {type(e).__name__}: {e}")
 
-    print(f"🏠 Guild Synced: {len(synced)} commands")
+    # drop stale links; member-based pruning only with a complete member list
+    live_guild = bot.get_guild(GUILD_ID)
+    members = [m.id for m in live_guild.members] if live_guild and live_guild.chunked else None
+    try:
+        removed = ROBLOX_LINKS.compact(keep_discord_ids=members)
+        print(f"🔗 Roblox links: {len(ROBLOX_LINKS)} kept, {removed} compacted")
+    except Exception as e:
+        print(f"⚠️ Link compaction failed: {type(e).__name__}: {e}")
+
+# =========================
+# /SYNCCOMMANDS
+# =========================
+
+@bot.tree.command(
+    name="synccommands",
+    description="SFG only: force a slash command sync for this server."
+)
+@app_commands.guilds(discord.Object(id=GUILD_ID))
+@requires(Cap.SFG, "❌ Only users with the **SFG** role can use this command.")
+async def synccommands(interaction: discord.Interaction):
+    await interaction.response.defer(ephemeral=True)
+
+    try:
+        sync = await sync_if_changed(bot.tree, discord.Object(id=GUILD_ID), force=True)
+    except Exception as e:
+        return await interaction.followup.send(f"❌ Sync failed: {type(e).__name__}: {e}", ephemeral=True)
+
+    print(f"🏠 Forced guild sync by {interaction.user}: {sync['commands']} commands in {sync['sync_ms']:.0f} ms")
+    await interaction.followup.send(
+        f"✅ Synced **{sync['commands']}** commands in **{sync['sync_ms']:.0f} ms** "
+        f"(fingerprint `{sync['fingerprint'][:12]}`).",
+        ephemeral=True
+    )
+
+# =========================
+# /BLOXLINKSTATS
+# =========================
+
+@bot.tree.command(
+    name="bloxlinkstats",
+    description="Staff only: Bloxlink cache and client stats."
+)
+@app_commands.guilds(discord.Object(id=GUILD_ID))
+@requires(Cap.LEAGUE_STAFF, "❌ Only **SFG** or server admins can use `/bloxlinkstats`.")
+async def bloxlinkstats(interaction: discord.Interaction):
+    await interaction.response.send_message(
+        "```\n" + "\n".join(bloxlink_stats_lines()) + "\n```",
+        ephemeral=True
+    )
 
 # =========================================================
 # TEAM KEY NORMALIZATION (emoji/case/font insensitive)
@@ -504,42 +516,13 @@ def build_standings_embed(guild: discord.Guild, data: Dict[str, Any]) -> discord
 # =========================================================
 # TEAM DETECTION (best-effort)
 # =========================================================
-def _flatten_strings(obj: Any) -> List[str]:
-    out: List[str] = []
-    if isinstance(obj, dict):
-        for v in obj.values():
-            out.extend(_flatten_strings(v))
-    elif isinstance(obj, list):
-        for v in obj:
-            out.extend(_flatten_strings(v))
-    elif isinstance(obj, str):
-        out.append(obj)
-    return out
-
 def _detect_teams_from_report(report: Any) -> Tuple[Optional[str], Optional[str]]:
     """
-    Searches the JSON payload for NFL team names and returns the top 2 matches.
+    Searches the JSON payload for NFL team names (full, nickname or emoji
+    name) and returns the top 2 matches.
     Works if the export contains team names anywhere as strings.
     """
-    strings = _flatten_strings(report)
-    if not strings:
-        return None, None
-
-    counts: Dict[str, int] = {t: 0 for t in NFL_TEAMS}
-    for s in strings:
-        s_low = s.lower()
-        for t in NFL_TEAMS:
-            if t.lower() in s_low:
-                counts[t] += 1
-
-    hits = [(t, c) for t, c in counts.items() if c > 0]
-    hits.sort(key=lambda x: x[1], reverse=True)
-
-    if len(hits) >= 2:
-        return hits[0][0], hits[1][0]
-    if len(hits) == 1:
-        return hits[0][0], None
-    return None, None
+    return TEAM_DETECTOR.top_two(report)
 
 def _detect_user_team_from_roles(guild: discord.Guild, member: discord.Member) -> Optional[str]:
     """
@@ -557,49 +540,19 @@ def _detect_user_team_from_roles(guild: discord.Guild, member: discord.Member) -
 # =========================
 # HELPERS
 # =========================
-def load_roblox_discord_cache():
-    if not os.path.exists(ROBLOX_DISCORD_CACHE_FILE):
-        return {
-            "discord_to_roblox": {},
-            "roblox_to_discord": {}
-        }
-
+def load_roblox_discord_cache() -> LinkStore:
+    store = LinkStore(STORAGE)
     try:
-        with open(ROBLOX_DISCORD_CACHE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        return {
-            "discord_to_roblox": data.get("discord_to_roblox", {}),
-            "roblox_to_discord": data.get("roblox_to_discord", {})
-        }
-    except Exception:
-        return {
-            "discord_to_roblox": {},
-            "roblox_to_discord": {}
-        }
-
-
-def save_roblox_discord_cache(cache):
-    with open(ROBLOX_DISCORD_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2)
+        return store.load()
+    except Exception as e:
+        print(f"⚠️ Could not load Roblox/Discord links: {type(e).__name__}: {e}")
+        return store
 
-roblox_discord_cache = load_roblox_discord_cache()
+ROBLOX_LINKS = load_roblox_discord_cache()
 
 def update_roblox_discord_cache(discord_member, roblox_id, roblox_username, roblox_display_name=None):
-    discord_id = str(discord_member.id)
-    roblox_id_str = str(roblox_id)
-
-    roblox_discord_cache["discord_to_roblox"][discord_id] = {
-        "discord_id": discord_member.id,
-        "discord_name": discord_member.name,
-        "discord_display_name": getattr(discord_member, "display_name", discord_member.name),
-        "roblox_id": roblox_id,
-        "roblox_username": roblox_username,
-        "roblox_display_name": roblox_display_name or roblox_username
-    }
-
-    roblox_discord_cache["roblox_to_discord"][roblox_id_str] = discord_member.id
-    save_roblox_discord_cache(roblox_discord_cache)
+    # memory only; ROBLOX_LINKS.flush() writes the batch
+    ROBLOX_LINKS.upsert(discord_member, roblox_id, roblox_username, roblox_display_name)
 
 def resolve_discord_member_from_roblox(guild, roblox_id=None, roblox_username=None, roblox_display_name=None):
     if guild is None:
@@ -607,44 +560,21 @@ def resolve_discord_member_from_roblox(guild, roblox_id=None, roblox_username=No
 
     # 1. Roblox ID cache lookup
     if roblox_id is not None:
-        cached_discord_id = roblox_discord_cache["roblox_to_discord"].get(str(roblox_id))
+        cached_discord_id = ROBLOX_LINKS.discord_id_for_roblox(roblox_id)
         if cached_discord_id:
-            member = guild.get_member(int(cached_discord_id))
+            member = guild.get_member(cached_discord_id)
             if member:
                 return member
 
     # 2. Cached username/display name lookup
-    for discord_id, entry in roblox_discord_cache["discord_to_roblox"].items():
-        cached_username = str(entry.get("roblox_username", "")).lower()
-        cached_display = str(entry.get("roblox_display_name", "")).lower()
-
-        if roblox_username and cached_username == roblox_username.lower():
-            member = guild.get_member(int(discord_id))
-            if member:
-                return member
-
-        if roblox_display_name and cached_display == roblox_display_name.lower():
-            member = guild.get_member(int(discord_id))
-            if member:
-                return member
-
-    # 3. Live Discord fallback
-    search_values = set()
-    if roblox_username:
-        search_values.add(roblox_username.lower())
-    if roblox_display_name:
-        search_values.add(roblox_display_name.lower())
-
-    for member in guild.members:
-        names_to_check = {
-            member.name.lower(),
-            member.display_name.lower()
-        }
-
-        if search_values & names_to_check:
+    for discord_id in ROBLOX_LINKS.discord_ids_for_name(roblox_username, roblox_display_name):
+        member = guild.get_member(discord_id)
+        if member:
             return member
 
-    return None
+    # 3. Live Discord fallback (name index kept by cogs/indexes.py); a name two
+    #    members share matches nobody, so the player goes to link suggestions
+    return MEMBER_NAMES.find_member(guild, roblox_username, roblox_display_name)
 
 
 async def nfl_team_autocomplete(interaction: discord.Interaction, current: str):
@@ -659,126 +589,56 @@ async def nfl_team_autocomplete(interaction: discord.Interaction, current: str):
     return [app_commands.Choice(name=t, value=t) for t in matches[:25]]
 
 def get_member_team_role(member: discord.Member) -> Optional[discord.Role]:
-    return next((r for r in member.roles if r.name in NFL_TEAMS), None)
+    team = ROSTERS.team_of(member)
+    return guild_registry(member.guild).role(team) if team else None
 
 def get_team_role(guild: discord.Guild, team_name: str) -> discord.Role | None:
     if not guild:
         return None
-    return discord.utils.get(guild.roles, name=team_name)
-
-def get_team_emoji(guild: discord.Guild, team_name: str) -> str:
-    """
-    Uses TEAM_EMOJI_NAME mapping, e.g.:
-    "Detroit" -> "DetroitLions"
-    """
-    if not guild:
-        return ""
-
-    emoji_name = TEAM_EMOJI_NAME.get(team_name)
-    if not emoji_name:
-        return ""
-
-    emoji = discord.utils.get(guild.emojis, name=emoji_name)
-    return str(emoji) if emoji else ""
+    return guild_registry(guild).role(team_name)
 
 def get_member_team_name(member: discord.Member) -> str:
-    r = get_member_team_role(member)
-    return r.name if r else ""
+    return ROSTERS.team_of(member) or ""
 
 def has_any_management_role(guild: discord.Guild, member: discord.Member) -> bool:
-    for name in ("Franchise Owner", "Team President", "General Manager"):
-        role = discord.utils.get(guild.roles, name=name)
-        if role and role in member.roles:
-            return True
-    return False
-
-
-def normalize_team_name(name: str) -> str:
-    return (
-        name.replace(" ", "")
-            .replace(".", "")
-            .replace("-", "")
-            .lower()
-    )
+    return has_cap(member, Cap.MANAGEMENT)
 
 
 def get_team_emoji(guild: discord.Guild, team_name: str) -> str:
+    """
+    Team emoji via GuildRegistry.team_emoji, e.g.:
+    "Detroit Lions" -> "DetroitLions"
+    """
     if not guild:
         return ""
 
-    lookup = TEAM_EMOJI_NAME.get(team_name, team_name)
-    normalized_lookup = normalize_team_name(lookup)
-
-    # DEBUG: print a few emoji names the bot can see
-    print("EMOJIS BOT SEES (first 25):", [e.name for e in guild.emojis[:25]])
-    print("LOOKING FOR:", lookup, "=>", normalized_lookup)
-
-    for emoji in guild.emojis:
-        if normalize_team_name(emoji.name) == normalized_lookup:
-            print("MATCHED EMOJI:", emoji.name)
-            return str(emoji)
-
-    print("NO EMOJI MATCH FOR:", team_name)
-    return ""
+    emoji = guild_registry(guild).team_emoji(team_name)
+    return str(emoji) if emoji else ""
 
 def can_submit_gamereport(guild: discord.Guild, member: discord.Member) -> bool:
-    for name in ("Franchise Owner", "Team President"):
-        role = discord.utils.get(guild.roles, name=name)
-        if role and role in member.roles:
-            return True
-    return False
+    return has_cap(member, Cap.GAME_REPORTER)
 
 def resolve_text_channel_by_id(guild: discord.Guild, channel_id: int) -> Optional[discord.TextChannel]:
     ch = guild.get_channel(channel_id)
     return ch if isinstance(ch, discord.TextChannel) else None
 
-async def send_logs(guild: discord.Guild, message: str):
+async def send_logs(guild: discord.Guild, message: str, view: Optional[discord.ui.View] = None):
     ch = resolve_text_channel_by_id(guild, LOGS_CHANNEL_ID)
     if ch:
-        await ch.send(message)
-
-def _norm_name(s: str) -> str:
-    s = (s or "").strip().lower()
-    s = re.sub(r"\s+", "", s)
-    s = re.sub(r"[^a-z0-9_\.]", "", s)
-    return s
-
-def build_member_name_index(guild: discord.Guild) -> dict[str, int]:
-    idx: dict[str, int] = {}
-    for m in guild.members:
-        idx[_norm_name(m.display_name)] = m.id
-        idx[_norm_name(m.name)] = m.id
-        gn = getattr(m, "global_name", None)
-        if gn:
-            idx[_norm_name(str(gn))] = m.id
-    return idx
+        await ch.send(message, view=view)
 
 def get_team_emoji_obj(guild: discord.Guild, team_name: str) -> Optional[discord.Emoji]:
     """
     Returns the discord.Emoji object for the team so we can add it as a reaction.
-    Uses TEAM_EMOJI_NAME + normalize_team_name() like your get_team_emoji().
+    Same GuildRegistry lookup as get_team_emoji().
     """
     if not guild:
         return None
-
-    lookup = TEAM_EMOJI_NAME.get(team_name, team_name)
-    normalized_lookup = normalize_team_name(lookup)
-
-    for emoji in guild.emojis:
-        if normalize_team_name(emoji.name) == normalized_lookup:
-            return emoji
-
-    return None
+    return guild_registry(guild).team_emoji(team_name)
 
 def find_streams_channel(guild: discord.Guild, target_name: str) -> Optional[discord.TextChannel]:
-    target_norm = normalize_channel_name(target_name)
-    for ch in guild.text_channels:
-        if normalize_channel_name(ch.name) == target_norm:
-            return ch
-    return None
+    return guild_registry(guild).text_channel(target_name)
 
-def has_role_name(member: discord.Member, role_name: str) -> bool:
-    return any(r.name == role_name for r in member.roles)
 
 from datetime import datetime, timedelta, timezone
 
@@ -818,9 +678,6 @@ def _parse_when_to_dt(when: str) -> datetime:
 
 
 
-def _has_role(member: discord.Member, role_name: str) -> bool:
-    return any(r.name == role_name for r in member.roles)
-
 def _set_streamer_field(embed: discord.Embed, streamer_mention: str) -> discord.Embed:
     """
     Adds/updates a 'Streamer:' section on the embed.
@@ -847,7 +704,7 @@ class StreamClaimView(discord.ui.View):
             return await interaction.response.send_message("Server-only.", ephemeral=True)
 
         # Must have Streamer role
-        if not _has_role(interaction.user, STREAMER_ROLE_NAME):
+        if not has_cap(interaction.user, Cap.STREAMER):
             return await interaction.response.send_message(
                 f"❌ You need the **{STREAMER_ROLE_NAME}** role to claim streams.",
                 ephemeral=True
@@ -876,7 +733,8 @@ class StreamClaimView(discord.ui.View):
 # =========================
 # STREAM COOLDOWN (add once in helpers)
 # =========================
-stream_cooldowns: dict[int, float] = {}  # key = discord user id, value = last-used unix time
+# last-used unix time per discord user id, kept in STORAGE under this scope
+STREAM_COOLDOWN_SCOPE = "stream"
 
 # =========================
 # STREAM HELPERS (add once)
@@ -909,6 +767,7 @@ async def nfl_team_autocomplete(interaction: discord.Interaction, current: str):
         app_commands.Choice(name="Twitch", value="Twitch"),
     ]
 )
+@requires(Cap.STREAMER, f"❌ You need the **{STREAMER_ROLE_NAME}** role to use `/stream`.")
 async def stream(
     interaction: discord.Interaction,
     team1: str,
@@ -924,16 +783,9 @@ async def stream(
     if not isinstance(member, discord.Member):
         return await interaction.response.send_message("Couldn’t verify roles.", ephemeral=True)
 
-    # Streamer role gate
-    if not has_role_name(member, STREAMER_ROLE_NAME):
-        return await interaction.response.send_message(
-            f"❌ You need the **{STREAMER_ROLE_NAME}** role to use `/stream`.",
-            ephemeral=True
-        )
-
     # 24h cooldown
     now = time.time()
-    last = stream_cooldowns.get(member.id, 0)
+    last = STORAGE.get_cooldown(STREAM_COOLDOWN_SCOPE, member.id)
     if now - last < STREAM_COOLDOWN_SECONDS:
         remaining = int(STREAM_COOLDOWN_SECONDS - (now - last))
         h, m = divmod(remaining // 60, 60)
@@ -1003,7 +855,7 @@ async def stream(
         await msg.add_reaction(e2_obj)
 
     # Set cooldown after success
-    stream_cooldowns[member.id] = now
+    STORAGE.set_cooldown(STREAM_COOLDOWN_SCOPE, member.id, now)
 
     await interaction.response.send_message(
         f"✅ Stream posted in {streams_ch.mention}.",
@@ -1039,69 +891,174 @@ def extract_json_object(raw: str) -> dict:
         raise ValueError("No JSON object found in file/text.")
     return json.loads(raw[start:end + 1])
 
-def extract_players(report: dict) -> list[dict]:
+def report_statlines(p, name: str) -> list:
     """
-    Football Fusion export format:
-      top-level dict keyed by Roblox userId strings ("123456789": {...})
+    Statlines for one report player (a services.report_parser statline),
+    under `name` and the team the export lists them on.
     """
-    players: list[dict] = []
-    if not isinstance(report, dict):
-        return players
+    from services.stats_sheet import qb_statline, wr_statline, db_statline, de_statline
 
-    for roblox_id_str, pdata in report.items():
-        if not isinstance(pdata, dict):
-            continue
-        if not str(roblox_id_str).isdigit():
+    rid = p.roblox_id or None
+    player_lines = []
+
+    if p.has_qb():
+        player_lines.append(qb_statline(name, p.team, p.qb_qbr, p.qb_comp, p.qb_yds, p.qb_td, p.qb_int, rid))
+
+    if p.has_wr():
+        player_lines.append(wr_statline(name, p.team, p.wr_rec, p.wr_yds, p.wr_td, p.wr_fum, rid))
+
+    if p.has_db():
+        player_lines.append(db_statline(name, p.team, p.db_swats, p.db_int, p.db_dbr, rid))
+
+    if p.has_de():
+        player_lines.append(de_statline(name, p.team, p.de_sacks, p.de_safeties, p.de_ff, rid))
+
+    return player_lines
+
+# =========================
+# FUZZY LINK SUGGESTIONS
+# =========================
+# unmatched players offered to staff per report
+MAX_SUGGESTION_POSTS = 10
+
+
+def can_confirm_links(member: discord.Member) -> bool:
+    return has_cap(member, Cap.LEAGUE_STAFF)
+
+
+class LinkSuggestionButton(discord.ui.Button):
+    def __init__(self, suggestion: Suggestion, row: int):
+        super().__init__(
+            label=f"{suggestion.member.display_name[:60]} ({suggestion.score:.0%})",
+            style=discord.ButtonStyle.primary,
+            row=row,
+        )
+        self.suggestion = suggestion
+
+    async def callback(self, interaction: discord.Interaction):
+        await self.view.confirm(interaction, self.suggestion.member)
+
+
+class LinkSuggestionView(discord.ui.View):
+    """
+    One click links the Roblox player to the picked member. Their stats were
+    recorded with the report; the link only renames them.
+    """
+
+    def __init__(self, player: dict, game: dict, suggestions: list[Suggestion]):
+        super().__init__(timeout=None)  # stays until restart (non-persistent, but no auto-timeout)
+        self.player = player
+        self.game_id = game["seq"]
+        self.done = False
+
+        for i, suggestion in enumerate(suggestions):
+            self.add_item(LinkSuggestionButton(suggestion, row=i // 5))
+
+    async def _staff_only(self, interaction: discord.Interaction) -> bool:
+        if not isinstance(interaction.user, discord.Member) or not can_confirm_links(interaction.user):
+            await interaction.response.send_message("❌ Staff only.", ephemeral=True)
+            return False
+        if self.done:
+            await interaction.response.send_message("❌ Already handled.", ephemeral=True)
+            return False
+        return True
+
+    async def confirm(self, interaction: discord.Interaction, member: discord.Member):
+        if not await self._staff_only(interaction):
+            return
+        self.done = True
+
+        p = self.player
+        rid = p["roblox_id"]
+        name = p.get("roblox_username") or str(rid)
+
+        await interaction.response.edit_message(
+            content=f"⏳ Linking **{name}** → {member.mention}…", view=None
+        )
+
+        update_roblox_discord_cache(
+            member,
+            roblox_id=rid,
+            roblox_username=p.get("roblox_username", ""),
+            roblox_display_name=p.get("roblox_display", ""),
+        )
+
+        from services.stats_sheet import credit_player, commit_all_stats
+
+        try:
+            await ROBLOX_LINKS.flush_async()
+            await asyncio.to_thread(credit_player, rid, member.display_name)
+        except Exception as e:
+            self.done = False
+            return await interaction.edit_original_response(
+                content=f"❌ Linking **{name}** failed: {type(e).__name__}: {e}", view=self
+            )
+
+        # the renamed position rows and any PlayerStats block they appear in
+        try:
+            await asyncio.to_thread(commit_all_stats)
+        except Exception as e:
+            print(f"⚠ Stats sheet update failed: {type(e).__name__}: {e}")
+
+        await interaction.edit_original_response(
+            content=(
+                f"✅ **{name}** linked to {member.mention} by {interaction.user.mention}"
+                f" — their stats (incl. game #{self.game_id}) now show under {member.display_name}."
+            )
+        )
+
+    @discord.ui.button(label="None of these", style=discord.ButtonStyle.secondary, row=4)
+    async def dismiss(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if not await self._staff_only(interaction):
+            return
+        self.done = True
+
+        name = self.player.get("roblox_username") or str(self.player["roblox_id"])
+        await interaction.response.edit_message(
+            content=f"🚫 No link for **{name}** (dismissed by {interaction.user.mention}).", view=None
+        )
+
+
+async def post_link_suggestions(guild: discord.Guild, players: list[dict], game: dict):
+    """Posts ranked fuzzy matches for each unmatched player to the logs channel."""
+    posted = 0
+    for p in players:
+        if posted >= MAX_SUGGESTION_POSTS:
+            break
+
+        suggestions = suggest_members(
+            guild,
+            MEMBER_NAMES,
+            ROBLOX_LINKS,
+            p.get("roblox_username"),
+            p.get("roblox_display"),
+        )
+        if not suggestions:
             continue
 
-        roblox_id = int(roblox_id_str)
-
-        other = pdata.get("other", {}) if isinstance(pdata.get("other"), dict) else {}
-        qb = pdata.get("qb", {}) if isinstance(pdata.get("qb"), dict) else {}
-        wr = pdata.get("wr", {}) if isinstance(pdata.get("wr"), dict) else {}
-        db = pdata.get("db", {}) if isinstance(pdata.get("db"), dict) else {}
-        de = pdata.get("def", {}) if isinstance(pdata.get("def"), dict) else {}
-
-        name = str(other.get("name", "")).strip()
-        display = str(other.get("display", "")).strip()
-        roblox_username = name or display or str(roblox_id)
-
-        players.append({
-            "roblox_id": roblox_id,
-            "roblox_username": roblox_username,
-            "roblox_display": display or name or roblox_username,
-
-            # QB
-            "qb_qbr": float(qb.get("rtng", 0) or 0),
-            "qb_comp": int(qb.get("comp", 0) or 0),
-            "qb_yds": int(qb.get("yds", 0) or 0),
-            "qb_td": int(qb.get("td", 0) or 0),
-            "qb_int": int(qb.get("int", 0) or 0),
-
-            # WR
-            "wr_rec": int(wr.get("catch", 0) or 0),
-            "wr_yds": int(wr.get("yds", 0) or 0),
-            "wr_td": int(wr.get("td", 0) or 0),
-            "wr_fum": int(wr.get("fum", 0) or wr.get("fumble", 0) or 0),
-
-            # DB
-            "db_swats": int(db.get("defl", 0) or 0),
-            "db_int": int(db.get("int", 0) or 0),
-            "db_dbr": float(db.get("rtng", 0) or 0),
-
-            # DE
-            "de_sacks": int(de.get("sack", 0) or 0),
-            "de_safeties": int(de.get("safe", 0) or 0),
-            "de_ff": int(de.get("ffum", 0) or 0),
-        })
-    return players
-
-async def process_stats_to_sheets(interaction: discord.Interaction, report: dict, game_id: int) -> int:
-    guild = interaction.guild
-    players = extract_players(report)
+        lines = "\n".join(
+            f"• {s.member.mention} — {s.score:.0%} ({s.via}: `{s.matched}`)" for s in suggestions
+        )
+        await send_logs(
+            guild,
+            f"🔎 **Possible match for `{p.get('roblox_username') or p['roblox_id']}`** (game #{game['seq']})\n{lines}",
+            view=LinkSuggestionView(p, game, suggestions),
+        )
+        posted += 1
+
+async def process_report_stats(guild: discord.Guild, statlines, game: dict) -> int:
+    """
+    Records every player in a parsed report (services.report_parser
+    statlines) with the team the export lists. A player whose Discord member
+    is found is recorded under the member's name and linked; the rest keep
+    their Roblox name and are offered to staff as link suggestions.
+    Returns how many players had stats recorded.
+    """
+    from services.stats_sheet import record_statlines
 
     updated = 0
     missing: list[str] = []
+    unmatched: list[dict] = []
     errors: list[str] = []
 
     if not BLOXLINK_API_KEY:
@@ -1112,94 +1069,74 @@ async def process_stats_to_sheets(interaction: discord.Interaction, report: dict
             "Fallback name-matching is enabled (less accurate)."
         )
 
-    for p in players:
-        rid = p["roblox_id"]
-        try:
-            roblox_username = p.get("roblox_username", "")
-            roblox_display_name = p.get("roblox_display", "")
+    # every player's member up front: Bloxlink lookups run concurrently and
+    # member-cache misses go out as one gateway request
+    resolved = await resolve_members(
+        guild,
+        [p.roblox_id for p in statlines],
+        lambda rid: get_cached_discord_id(guild.id, rid),
+    )
 
+    lines = []
+    for p in statlines:
+        rid = p.roblox_id or None
+        name = p.name
+        try:
+            # without a Roblox id there is nothing to link; keep the export's name
             member = None
-
-            discord_id = await get_cached_discord_id(guild.id, rid)
-            if discord_id:
-                member = guild.get_member(discord_id)
-                if member is None:
-                    try:
-                        member = await guild.fetch_member(discord_id)
-                    except discord.NotFound:
-                        member = None
-
-            if member is None:
-                member = resolve_discord_member_from_roblox(
+            if rid:
+                member = resolved.get(rid) or resolve_discord_member_from_roblox(
                     guild,
                     roblox_id=rid,
-                    roblox_username=roblox_username,
-                    roblox_display_name=roblox_display_name
+                    roblox_username=p.roblox_username,
+                    roblox_display_name=p.roblox_display
                 )
 
             if member:
                 update_roblox_discord_cache(
                     member,
                     roblox_id=rid,
-                    roblox_username=roblox_username,
-                    roblox_display_name=roblox_display_name
-                )
-            
-            if not member:
-                missing.append(roblox_username or str(rid))
-                continue
-
-            team_name = get_member_team_name(member) or "Free Agent"
-            wrote_any = False
-
-            # QB
-            if (p["qb_comp"] > 0 or p["qb_yds"] > 0 or p["qb_td"] > 0 or p["qb_int"] > 0 or p["qb_qbr"] > 0):
-                await asyncio.to_thread(
-                    append_qb_statline,
-                    game_id, member.id, member.display_name, team_name,
-                    p["qb_qbr"], p["qb_comp"], p["qb_yds"], p["qb_td"], p["qb_int"]
-                )
-                wrote_any = True
-
-            # WR
-            if (p["wr_rec"] > 0 or p["wr_yds"] > 0 or p["wr_td"] > 0 or p["wr_fum"] > 0):
-                await asyncio.to_thread(
-                    append_wr_statline,
-                    game_id, member.id, member.display_name, team_name,
-                    p["wr_rec"], p["wr_yds"], p["wr_td"], p["wr_fum"]
-                )
-                wrote_any = True
-
-            # DB
-            if (p["db_swats"] > 0 or p["db_int"] > 0 or p["db_dbr"] > 0):
-                await asyncio.to_thread(
-                    append_db_statline,
-                    game_id, member.id, member.display_name, team_name,
-                    p["db_swats"], p["db_int"], p["db_dbr"]
-                )
-                wrote_any = True
-
-            # DE
-            if (p["de_sacks"] > 0 or p["de_safeties"] > 0 or p["de_ff"] > 0):
-                await asyncio.to_thread(
-                    append_de_statline,
-                    game_id, member.id, member.display_name, team_name,
-                    p["de_sacks"], p["de_safeties"], p["de_ff"]
+                    roblox_username=p.roblox_username,
+                    roblox_display_name=p.roblox_display
                 )
-                wrote_any = True
+                name = member.display_name
+            elif rid:
+                missing.append(p.roblox_username or str(rid))
+                unmatched.append(p._asdict())
 
-            if wrote_any:
+            player_lines = report_statlines(p, name)
+
+            if player_lines:
+                lines += player_lines
                 updated += 1
 
         except Exception as e:
-            errors.append(f"{p.get('roblox_username') or rid}: {type(e).__name__}: {e}")
+            errors.append(f"{p.roblox_username or rid}: {type(e).__name__}: {e}")
+
+    # every link this report matched, in one write
+    try:
+        await ROBLOX_LINKS.flush_async()
+    except Exception as e:
+        errors.append(f"saving Roblox links: {type(e).__name__}: {e}")
+
+    # one storage write for the whole report
+    if lines:
+        try:
+            await asyncio.to_thread(
+                record_statlines, lines, game=game["seq"], week=game.get("week"), season=game.get("season")
+            )
+        except Exception as e:
+            errors.append(f"recording stats: {type(e).__name__}: {e}")
+            updated = 0
 
     if missing:
         await send_logs(
             guild,
-            "⚠ **Game Report – No Discord match for these players**\n"
+            "⚠ **Game Report – No Discord match for these players** (recorded under their Roblox name)\n"
             "```\n" + "\n".join(missing[:50]) + "\n```"
         )
+        # after the report's stats are recorded, so a confirm renames them
+        await post_link_suggestions(guild, unmatched, game)
 
     if errors:
         await send_logs(
@@ -1208,15 +1145,6 @@ async def process_stats_to_sheets(interaction: discord.Interaction, report: dict
             "```\n" + "\n".join(errors[:15]) + "\n```"
         )
 
-    # refresh PlayerStats Top 15
-    try:
-        await asyncio.to_thread(update_playerstats_top15)
-    except Exception as e:
-        await send_logs(
-            guild,
-            f"⚠ PlayerStats update failed: {type(e).__name__}: {e}"
-        )
-
     return updated
 
 # =========================
@@ -1302,16 +1230,16 @@ class TeamSelect(discord.ui.Select):
         # =========================
         # UPDATE STANDINGS (NO DEADLOCK)
         # =========================
-        standings = None
         if your_team != "Your Team":
-            async with STANDINGS_LOCK:
-                standings = load_standings()
-                update_game_result(standings, your_team, your_score, opponent, opp_score)  # <-- comma, not ;
-                save_standings(standings)
+            try:
+                async with STANDINGS_LOCK:
+                    record_game_result(your_team, opponent, your_score, opp_score, source="gamereport")
+            except ValueError as e:
+                await send_logs(guild, f"⚠ Standings not updated: {e}")
 
             # ✅ IMPORTANT: Discord API call OUTSIDE the lock
             try:
-                await post_or_update_standings(guild, standings)
+                await post_or_update_standings(guild)
             except Exception as e:
                 await send_logs(
                     guild,
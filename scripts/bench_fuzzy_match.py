@@ -0,0 +1,105 @@
+"""
+Times fuzzy suggestions for unmatched report players against a synthetic
+10k-member guild with 3k linked Roblox accounts.
+
+    python scripts/bench_fuzzy_match.py
+
+"scan" scores every indexed name with difflib, which is what a fuzzy
+search without the trigram index would have to do.
+"""
+import difflib
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.fuzzy_match import suggest_members  # noqa: E402
+from utils.link_store import LinkStore  # noqa: E402
+from utils.member_index import MemberNameIndex  # noqa: E402
+
+MEMBERS = 10_000
+LINKED = 3_000
+QUERIES = 500
+
+SYLLABLES = ["ka", "zu", "mi", "ro", "tex", "blox", "qb", "dash", "nova", "ly", "jay", "xx", "pro", "tt", "sky"]
+
+
+def fake_name(rng):
+    name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+    if rng.random() < 0.5:
+        name += str(rng.randint(1, 9999))
+    return name
+
+
+def typo(rng, name):
+    i = rng.randrange(len(name))
+    op = rng.choice("swap drop add".split())
+    if op == "drop":
+        return name[:i] + name[i + 1:]
+    if op == "add":
+        return name[:i] + rng.choice(string.ascii_lowercase) + name[i:]
+    return name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+
+
+class FakeGuild:
+    def __init__(self, members):
+        self.id = 1
+        self.members = members
+        self.chunked = True
+        self._by_id = {m.id: m for m in members}
+
+    def get_member(self, member_id):
+        return self._by_id.get(member_id)
+
+
+class NullStorage:
+    def load_links(self):
+        return {}
+
+
+def main():
+    rng = random.Random(7)
+    members = []
+    for i in range(MEMBERS):
+        name = fake_name(rng)
+        members.append(SimpleNamespace(
+            id=10_000 + i, name=name, display_name=name.title(), global_name=None, bot=False,
+        ))
+    guild = FakeGuild(members)
+
+    started = time.perf_counter()
+    names = MemberNameIndex()
+    names.build(guild)
+    links = LinkStore(NullStorage())
+    for i, m in enumerate(rng.sample(members, LINKED)):
+        links.upsert(m, 500 + i, fake_name(rng))
+    build_ms = (time.perf_counter() - started) * 1000
+
+    targets = [rng.choice(members) for _ in range(QUERIES)]
+    queries = [typo(rng, m.name) for m in targets]
+
+    started = time.perf_counter()
+    hits = 0
+    for q, m in zip(queries, targets):
+        hits += any(s.member.name == m.name for s in suggest_members(guild, names, links, q))
+    index_ms = (time.perf_counter() - started) * 1000 / QUERIES
+
+    all_names = list(names.names)
+    started = time.perf_counter()
+    for q in queries[:20]:
+        sorted(all_names, key=lambda n: -difflib.SequenceMatcher(None, q, n).quick_ratio())[:3]
+    scan_ms = (time.perf_counter() - started) * 1000 / 20
+
+    print(f"members {MEMBERS}, indexed names {len(names.names)}, linked roblox names {len(links.fuzzy)}")
+    print(f"build (member + link indexes): {build_ms:.1f} ms")
+    print(f"per query, trigram index:      {index_ms:.3f} ms (right name suggested for {hits}/{QUERIES} typos)")
+    print(f"per query, difflib scan:       {scan_ms:.3f} ms")
+    print(f"member index memory: {names.memory_stats()}")
+
+
+if __name__ == "__main__":
+    main()
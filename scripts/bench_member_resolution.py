@@ -0,0 +1,155 @@
+"""
+Times resolving a game report's players to guild members: the old serial
+loop against services.member_resolver.resolve_members.
+
+    python scripts/bench_member_resolution.py [--players 20] [--latency-ms 120]
+
+Bloxlink is a local aiohttp stand-in serving roblox-to-discord with the
+injected latency. The guild is a fake whose member cache holds only some
+of the players; fetch_member and query_members each cost one gateway/REST
+round trip of the same latency.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.member_resolver import resolve_members  # noqa: E402
+
+
+class FakeMember:
+    def __init__(self, member_id):
+        self.id = member_id
+        self.display_name = f"member{member_id}"
+
+
+class FakeGuild:
+    def __init__(self, member_ids, cached_ratio, latency, rng):
+        self.id = 1
+        self.latency = latency
+        self.all = {i: FakeMember(i) for i in member_ids}
+        self.cached = {i: m for i, m in self.all.items() if rng.random() < cached_ratio}
+        self.calls = {"fetch_member": 0, "query_members": 0}
+
+    def get_member(self, member_id):
+        return self.cached.get(member_id)
+
+    async def fetch_member(self, member_id):
+        self.calls["fetch_member"] += 1
+        await asyncio.sleep(self.latency)
+        return self.all[member_id]
+
+    async def query_members(self, query=None, *, limit=5, user_ids=None, presences=False, cache=True):
+        self.calls["query_members"] += 1
+        await asyncio.sleep(self.latency)
+        return [self.all[i] for i in user_ids if i in self.all]
+
+
+async def start_standin(links, latency):
+    """Serves /v4/public/guilds/{guild}/roblox-to-discord/{roblox_id}."""
+    stats = {"requests": 0, "in_flight": 0, "max_in_flight": 0}
+
+    async def roblox_to_discord(request):
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        try:
+            await asyncio.sleep(latency)
+            did = links.get(int(request.match_info["roblox_id"]))
+            if did is None:
+                return web.json_response({"error": "User not found"}, status=404)
+            return web.json_response({"discordIDs": [str(did)], "discordID": str(did)})
+        finally:
+            stats["in_flight"] -= 1
+
+    app = web.Application()
+    app.router.add_get("/v4/public/guilds/{guild}/roblox-to-discord/{roblox_id}", roblox_to_discord)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}", stats
+
+
+def make_lookup(session, base):
+    """Same request/parse shape as main.bloxlink_roblox_to_discord_id."""
+    async def lookup(roblox_id):
+        async with session.get(f"{base}/v4/public/guilds/1/roblox-to-discord/{roblox_id}") as resp:
+            if resp.status != 200:
+                return None
+            data = await resp.json()
+        did = data.get("discordID")
+        return int(did) if did and str(did).isdigit() else None
+    return lookup
+
+
+async def serial(guild, roblox_ids, lookup):
+    """The loop process_stats_to_sheets used to run."""
+    out = {}
+    for rid in roblox_ids:
+        member = None
+        discord_id = await lookup(rid)
+        if discord_id:
+            member = guild.get_member(discord_id)
+            if member is None:
+                member = await guild.fetch_member(discord_id)
+        out[rid] = member
+    return out
+
+
+async def main_async(args):
+    rng = random.Random(args.seed)
+    roblox_ids = [1_000_000 + i for i in range(args.players)]
+    # a few duplicate rows, as when a player rejoins mid-game
+    roblox_ids += rng.sample(roblox_ids, max(1, args.players // 10))
+    links = {rid: 5_000 + i for i, rid in enumerate(roblox_ids[:args.players]) if rng.random() < args.linked}
+
+    latency = args.latency_ms / 1000
+    runner, base, server_stats = await start_standin(links, latency)
+
+    print(f"{args.players} players (+{len(roblox_ids) - args.players} duplicate rows), "
+          f"{len(links)} linked, {args.latency_ms} ms per round trip")
+    print(f"{'mode':<12}{'ms':>9}{'bloxlink':>10}{'peak':>6}{'fetch':>7}{'query':>7}{'resolved':>10}")
+
+    async with aiohttp.ClientSession() as session:
+        lookup = make_lookup(session, base)
+
+        for mode in ("serial", "concurrent"):
+            guild = FakeGuild(links.values(), args.cached, latency, random.Random(args.seed))
+            server_stats.update(requests=0, max_in_flight=0)
+
+            started = time.perf_counter()
+            if mode == "serial":
+                resolved = await serial(guild, roblox_ids, lookup)
+            else:
+                resolved = await resolve_members(guild, roblox_ids, lookup, concurrency=args.concurrency)
+            elapsed = (time.perf_counter() - started) * 1000
+
+            print(f"{mode:<12}{elapsed:>9.0f}{server_stats['requests']:>10}{server_stats['max_in_flight']:>6}"
+                  f"{guild.calls['fetch_member']:>7}{guild.calls['query_members']:>7}"
+                  f"{sum(1 for m in resolved.values() if m):>10}")
+
+    await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=120)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--linked", type=float, default=0.9, help="share of players linked in Bloxlink")
+    parser.add_argument("--cached", type=float, default=0.5, help="share of members in the member cache")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
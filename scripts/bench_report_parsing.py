@@ -0,0 +1,130 @@
+"""
+Measures how long /gamereport export parsing blocks the event loop, with
+synthetic 100-player Football Fusion exports.
+
+    python scripts/bench_report_parsing.py [--players 100] [--reports 8]
+
+"inline" is the old path (decode + json.loads + stat loop on the loop);
+"pool" awaits services.report_parser.parse_report. A ticker task stands
+in for the gateway heartbeat and records the worst gap between ticks.
+"""
+import argparse
+import asyncio
+import json
+import pickle
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import report_parser  # noqa: E402
+
+TICK_SECONDS = 0.005
+
+
+def synthetic_export(players: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    report = {}
+
+    for i in range(players):
+        roblox_id = str(1_000_000_000 + rng.randrange(10**9))
+        report[roblox_id] = {
+            "other": {
+                "name": f"player{i}",
+                "display": f"Player {i}",
+                "team": rng.choice(["Dallas Cowboys", "Miami Dolphins", "Chicago Bears", "Free Agent"]),
+                "tackles": rng.randrange(12),
+                "playtime": rng.randrange(3600),
+            },
+            "qb": {"comp": rng.randrange(30), "att": rng.randrange(40), "yds": rng.randrange(400),
+                   "td": rng.randrange(5), "int": rng.randrange(3), "rtng": round(rng.uniform(0, 158.3), 1),
+                   "sacked": rng.randrange(5), "long": rng.randrange(80)},
+            "wr": {"catch": rng.randrange(12), "tgt": rng.randrange(15), "yds": rng.randrange(200),
+                   "td": rng.randrange(3), "fum": rng.randrange(2), "yac": rng.randrange(100),
+                   "long": rng.randrange(80)},
+            "db": {"defl": rng.randrange(6), "int": rng.randrange(3), "rtng": round(rng.uniform(0, 158.3), 1),
+                   "tgt": rng.randrange(10), "comp_allowed": rng.randrange(10)},
+            "def": {"sack": rng.randrange(4), "safe": rng.randrange(2), "ffum": rng.randrange(2),
+                    "tkl": rng.randrange(10), "tfl": rng.randrange(4)},
+            # exports carry per-play history as well; it dominates the file size
+            "plays": [
+                {"q": rng.randrange(1, 5), "t": rng.randrange(900), "type": rng.choice(["pass", "run", "kick"]),
+                 "yds": rng.randrange(-5, 40)}
+                for _ in range(40)
+            ],
+        }
+
+    return ("\ufeff" + json.dumps(report, indent=2)).encode("utf-8")
+
+
+def parse_inline(raw: bytes):
+    """What /gamereport used to do on the event loop."""
+    text = raw.decode("utf-8", errors="ignore")
+    start = text.find("{")
+    game_data = json.loads(text[start:])
+    return report_parser.statlines_from_report(game_data)
+
+
+async def _ticker(stop: asyncio.Event, gaps: list):
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(TICK_SECONDS)
+        now = time.perf_counter()
+        gaps.append(now - last - TICK_SECONDS)
+        last = now
+
+
+async def run(mode: str, payloads: list[bytes]):
+    stop = asyncio.Event()
+    gaps: list[float] = []
+    ticker = asyncio.create_task(_ticker(stop, gaps))
+    await asyncio.sleep(TICK_SECONDS * 2)
+
+    async def submit(raw):
+        if mode == "inline":
+            return parse_inline(raw)
+        return await report_parser.parse_report(raw)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(submit(raw) for raw in payloads))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+
+    assert all(len(r) == len(results[0]) for r in results)
+    return elapsed, max(gaps) if gaps else 0.0
+
+
+async def main_async(args):
+    payloads = [synthetic_export(args.players, seed=i) for i in range(args.reports)]
+    size_kb = len(payloads[0]) / 1024
+    print(f"{args.reports} simultaneous exports, {args.players} players, {size_kb:.0f} KB each")
+
+    # parse once outside timing so both sides see warm imports and workers
+    report_parser.start_report_pool()
+    await report_parser.parse_report(payloads[0])
+
+    print(f"{'mode':<8}{'total ms':>10}{'worst loop stall ms':>22}")
+    for mode in ("inline", "pool"):
+        elapsed, stall = await run(mode, payloads)
+        print(f"{mode:<8}{elapsed * 1000:>10.1f}{stall * 1000:>22.1f}")
+
+    statline = (await report_parser.parse_report(payloads[0]))[0]
+    print(f"\nstatline pickled: {len(pickle.dumps(statline))} bytes "
+          f"vs raw player JSON ~{len(payloads[0]) // args.players} bytes")
+
+    report_parser.shutdown_report_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--reports", type=int, default=8)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
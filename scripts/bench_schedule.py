@@ -0,0 +1,125 @@
+"""
+Times the schedule generator and scores what it produces, against the old
+greedy shuffle, for 16/24/32 teams and 10-31 weeks.
+
+    python scripts/bench_schedule.py [--seeds 20]
+
+Team strengths are random win percentages (seeded), so the SOS columns
+show how evenly strength of schedule is spread across teams.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.config import NFL_TEAMS  # noqa: E402
+from utils.schedule_gen import generate_schedule, schedule_quality  # noqa: E402
+
+TEAM_COUNTS = (16, 24, 32)
+WEEK_COUNTS = (10, 15, 23, 31)
+
+
+def legacy_generate_schedule(teams, weeks=10, seed=None):
+    """The greedy shuffle /genschedule used before the circle method."""
+    rng = random.Random(seed)
+    teams = teams.copy()
+    rng.shuffle(teams)
+
+    schedule = {str(w): [] for w in range(1, weeks + 1)}
+    matchups_played = set()
+
+    for week in range(1, weeks + 1):
+        available = teams.copy()
+        rng.shuffle(available)
+
+        while len(available) >= 2:
+            t1 = available.pop()
+            t2 = None
+
+            for i, opp in enumerate(available):
+                matchup = tuple(sorted([t1, opp]))
+                if matchup not in matchups_played:
+                    t2 = opp
+                    available.pop(i)
+                    break
+
+            if t2 is None:
+                t2 = available.pop()
+
+            matchup = tuple(sorted([t1, t2]))
+            matchups_played.add(matchup)
+            schedule[str(week)].append([t1, t2])
+
+    return schedule
+
+
+def _teams(n):
+    teams = list(NFL_TEAMS)[:n]
+    return teams + [f"Team {i}" for i in range(len(teams), n)]
+
+
+def run_case(n, weeks, seeds):
+    teams = _teams(n)
+    rows = {}
+
+    for label, fn in (("greedy", legacy_generate_schedule), ("circle", generate_schedule)):
+        times = []
+        metrics = []
+        for seed in range(seeds):
+            rng = random.Random(seed)
+            strengths = {t: rng.random() for t in teams}
+
+            started = time.perf_counter()
+            if fn is generate_schedule:
+                schedule = fn(teams, weeks=weeks, seed=seed, strengths=strengths)
+            else:
+                schedule = fn(teams, weeks=weeks, seed=seed)
+            times.append((time.perf_counter() - started) * 1000)
+
+            metrics.append(schedule_quality(schedule, strengths))
+
+        rows[label] = {
+            "ms_median": statistics.median(times),
+            "ms_max": max(times),
+            "rematches": max(m["rematches"] for m in metrics),
+            "min_gap": min(m["min_rematch_gap"] or weeks for m in metrics),
+            "ha_imbalance": max(m["max_home_away_imbalance"] for m in metrics),
+            "sos_stdev": statistics.mean(m["sos_stdev"] for m in metrics),
+        }
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seeds", type=int, default=20, help="schedules per case")
+    args = parser.parse_args()
+
+    header = (
+        f"{'teams':>5} {'weeks':>5} {'engine':>7} {'ms med':>8} {'ms max':>8} "
+        f"{'rematch':>8} {'min gap':>8} {'H/A':>4} {'SOS sd':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for n in TEAM_COUNTS:
+        for weeks in WEEK_COUNTS:
+            for label, r in run_case(n, weeks, args.seeds).items():
+                print(
+                    f"{n:>5} {weeks:>5} {label:>7} {r['ms_median']:>8.2f} {r['ms_max']:>8.2f} "
+                    f"{r['rematches']:>8} {r['min_gap']:>8} {r['ha_imbalance']:>4} {r['sos_stdev']:>7.4f}"
+                )
+
+    print(
+        "\nrematch = worst count over seeds; min gap = fewest weeks between a rematch "
+        "(weeks when none); H/A = worst |home - away| for any team (greedy has no home side, "
+        "so its column only reflects list order)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Counts disk JSON parses per command, with and without the in-memory
+StandingsRepository.
+
+    python scripts/bench_standings_cache.py
+
+"before" re-parses on every read, which is what load_standings() and
+get_schedule_teams() used to do.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import utils.standings as standings  # noqa: E402
+from cogs.nextweek import build_nextweek_embed  # noqa: E402
+from cogs.schedule import build_week_embed, load_schedule  # noqa: E402
+
+RUNS = 50
+
+_real_json_load = json.load
+PARSES = 0
+
+
+def _counting_json_load(*args, **kwargs):
+    global PARSES
+    PARSES += 1
+    return _real_json_load(*args, **kwargs)
+
+
+json.load = _counting_json_load
+
+
+class UncachedRepository(standings.StandingsRepository):
+    """Drops the cache before every read, i.e. the old behaviour."""
+
+    def schedule_teams(self):
+        self.invalidate()
+        return super().schedule_teams()
+
+    def _current(self):
+        self.invalidate()
+        return super()._current()
+
+
+def cmd_nextweek():
+    data = load_schedule()
+    week = str(data.get("current_week", 1))
+    build_nextweek_embed(week, data["weeks"][week], data)
+
+
+def cmd_genschedule_embed():
+    data = load_schedule()
+    build_week_embed("1", data["weeks"]["1"], data)
+
+
+def cmd_standings():
+    data = standings.load_standings()
+    standings.build_standings_embed(data)
+
+
+COMMANDS = {
+    "/nextweek": cmd_nextweek,
+    "/genschedule (week embed)": cmd_genschedule_embed,
+    "/standings": cmd_standings,
+}
+
+
+def run(repo):
+    global PARSES
+    standings.STANDINGS_REPO = repo
+
+    # warm the cache once, like a bot that has been up for a while
+    for fn in COMMANDS.values():
+        fn()
+
+    results = {}
+    for name, fn in COMMANDS.items():
+        PARSES = 0
+        started = time.perf_counter()
+        for _ in range(RUNS):
+            fn()
+        elapsed = time.perf_counter() - started
+        results[name] = (PARSES / RUNS, elapsed / RUNS * 1000)
+    return results
+
+
+def main():
+    before = run(UncachedRepository(standings.STORAGE))
+    after = run(standings.StandingsRepository(standings.STORAGE))
+
+    print(f"{'command':<28}{'parses before':>15}{'parses after':>15}{'ms before':>12}{'ms after':>12}")
+    for name in COMMANDS:
+        b_parses, b_ms = before[name]
+        a_parses, a_ms = after[name]
+        print(f"{name:<28}{b_parses:>15.1f}{a_parses:>15.1f}{b_ms:>12.3f}{a_ms:>12.3f}")
+
+    print(f"\nStorage backend: {standings.STORAGE.name} (set STORAGE_BACKEND=sqlite to compare)")
+
+
+if __name__ == "__main__":
+    main()
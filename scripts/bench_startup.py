@@ -0,0 +1,248 @@
+"""
+Measures cold start: importing main.py and loading every cog in
+main.EXTENSIONS, each run in a fresh interpreter.
+
+    python scripts/bench_startup.py [--runs 5] [--top 15] [--json startup.json]
+
+Each run is a child `python -X importtime` process. The child sets a
+placeholder DISCORD_TOKEN if none is set, and stubs out Client.run so
+importing main.py returns instead of logging in. It then loads the cogs
+into a plain commands.Bot that never connects, so nothing touches the
+network. The parent parses the importtime output (self and cumulative
+import cost per module) and takes the median of each phase across runs.
+It prints a table and writes the whole result as JSON, for comparing one
+release against the next.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# top-level packages whose self import time gets its own line
+GROUPS = ("discord", "aiohttp", "numpy", "gspread", "google", "requests", "dotenv", "utils", "services", "cogs", "main")
+
+
+# =========================
+# CHILD (one cold start)
+# =========================
+def child():
+    started = time.perf_counter()
+
+    import asyncio
+    import resource
+
+    sys.path.insert(0, str(ROOT))
+    os.chdir(ROOT)
+    os.environ.setdefault("DISCORD_TOKEN", "bench-startup-placeholder")
+
+    import discord
+    from discord.ext import commands
+
+    # main.py ends in bot.run(); let the import finish instead
+    discord.Client.run = lambda self, *args, **kwargs: None
+
+    # discord is timed on its own: it has to be imported before main to stub run()
+    import_started = time.perf_counter()
+    import main
+    main_ms = (time.perf_counter() - import_started) * 1000
+
+    from utils.extensions import load_extensions
+
+    async def load():
+        bot = commands.Bot(command_prefix="!", intents=main.intents)
+        report = await load_extensions(bot, main.EXTENSIONS)
+        report["app_commands"] = len(bot.tree.get_commands(guild=main.GUILD_OBJ))
+        report["cogs"] = len(bot.cogs)
+        return report
+
+    report = asyncio.run(load())
+
+    heavy = ("gspread", "google.oauth2", "requests", "services.stats_sheet")
+    result = {
+        "discord_import_ms": (import_started - started) * 1000,
+        "main_import_ms": main_ms,
+        "cogs_ms": report.pop("total_ms"),
+        "total_ms": (time.perf_counter() - started) * 1000,
+        # Linux reports KiB, macOS bytes
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1),
+        "modules": len(sys.modules),
+        "heavy_modules_loaded": [m for m in heavy if m in sys.modules],
+        "cog_report": report,
+    }
+    # stdout is the result; importtime goes to stderr
+    print(json.dumps(result))
+
+
+# =========================
+# PARENT
+# =========================
+def parse_importtime(stderr: str) -> list[dict]:
+    """`import time: self [us] | cumulative | imported package` lines -> dicts (ms)."""
+    out = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, rest = line.split(":", 1)
+            self_us, cumulative_us, name = rest.split("|", 2)
+            out.append({
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            })
+        except ValueError:
+            continue
+    return out
+
+
+def summarize_imports(rows: list[dict], top: int) -> dict:
+    groups = {g: 0.0 for g in GROUPS}
+    groups["other"] = 0.0
+    for r in rows:
+        root = r["module"].split(".", 1)[0]
+        groups[root if root in groups else "other"] += r["self_ms"]
+
+    # a module can show up more than once (e.g. a failed then retried import)
+    worst = {}
+    for r in rows:
+        if r["cumulative_ms"] > worst.get(r["module"], {"cumulative_ms": -1})["cumulative_ms"]:
+            worst[r["module"]] = r
+    slowest = sorted(worst.values(), key=lambda r: r["cumulative_ms"], reverse=True)[:top]
+    return {
+        "total_self_ms": sum(r["self_ms"] for r in rows),
+        "by_package_self_ms": {k: round(v, 1) for k, v in sorted(groups.items(), key=lambda kv: -kv[1])},
+        "slowest_cumulative": [
+            {"module": r["module"], "cumulative_ms": round(r["cumulative_ms"], 1), "self_ms": round(r["self_ms"], 1)}
+            for r in slowest
+        ],
+    }
+
+
+def run_once(top: int) -> dict:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(Path(__file__).resolve()), "--child"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise SystemExit(f"child failed ({proc.returncode}):\n" + "\n".join(errors[-30:]))
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["process_wall_ms"] = wall_ms
+    result["imports"] = summarize_imports(parse_importtime(proc.stderr), top)
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def median_of(runs, key):
+    return round(statistics.median(r[key] for r in runs), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to list (by cumulative import time)")
+    parser.add_argument("--json", type=Path, help="write the result here as well as the table to stdout")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child()
+
+    # the first run warms the OS file cache and .pyc files; it isn't counted
+    run_once(args.top)
+    runs = [run_once(args.top) for _ in range(args.runs)]
+
+    keys = ("process_wall_ms", "discord_import_ms", "main_import_ms", "cogs_ms", "total_ms", "peak_rss_kb")
+    summary = {k: median_of(runs, k) for k in keys}
+
+    # per-cog medians, slowest first
+    cogs = {}
+    for r in runs:
+        for e in r["cog_report"]["extensions"]:
+            cogs.setdefault(e["name"], []).append((e["import_ms"], e["setup_ms"], e["ok"]))
+    per_cog = sorted(
+        (
+            {
+                "name": name,
+                "import_ms": round(statistics.median(v[0] for v in vals), 1),
+                "setup_ms": round(statistics.median(v[1] for v in vals), 1),
+                "ok": all(v[2] for v in vals),
+            }
+            for name, vals in cogs.items()
+        ),
+        key=lambda c: c["import_ms"] + c["setup_ms"],
+        reverse=True,
+    )
+
+    # the median run's import breakdown, so the numbers add up
+    median_run = sorted(runs, key=lambda r: r["total_ms"])[len(runs) // 2]
+    last = runs[-1]
+
+    result = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": args.runs,
+            "timestamp": int(time.time()),
+        },
+        "median": summary,
+        "cogs_loaded": last["cog_report"]["loaded"],
+        "cogs_failed": last["cog_report"]["failed"],
+        "app_commands": last["cog_report"]["app_commands"],
+        "modules": last["modules"],
+        "heavy_modules_loaded": last["heavy_modules_loaded"],
+        "per_cog": per_cog,
+        "imports": median_run["imports"],
+        "runs": [{k: round(r[k], 1) for k in keys} for r in runs],
+    }
+
+    print(f"startup, median of {args.runs} cold runs (commit {result['meta']['commit'] or '?'})")
+    for k in keys:
+        unit = "KB" if k.endswith("_kb") else "ms"
+        print(f"  {k:<24}{summary[k]:>10.1f} {unit}")
+    print(f"  cogs {result['cogs_loaded']}/{len(per_cog)} loaded, {result['app_commands']} guild app commands, "
+          f"{result['modules']} modules")
+    print(f"  heavy imports at startup: {', '.join(result['heavy_modules_loaded']) or 'none'}")
+
+    print("\nself import time by package (ms)")
+    for pkg, ms in result["imports"]["by_package_self_ms"].items():
+        if ms >= 0.1:
+            print(f"  {pkg:<12}{ms:>9.1f}")
+
+    print(f"\nslowest {args.top} imports (cumulative ms)")
+    for r in result["imports"]["slowest_cumulative"]:
+        print(f"  {r['module']:<44}{r['cumulative_ms']:>9.1f}")
+
+    print("\nslowest cogs (import / setup ms)")
+    for c in per_cog[:10]:
+        print(f"  {c['name']:<24}{c['import_ms']:>8.1f}{c['setup_ms']:>8.1f}{'' if c['ok'] else '  FAILED'}")
+
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"\nwrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
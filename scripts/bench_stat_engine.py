@@ -0,0 +1,98 @@
+"""
+Times "top passers, weeks 3-6" and a full season-totals rebuild over
+synthetic statlines, with the old per-dict loops and with
+utils.stat_engine.
+
+    python scripts/bench_stat_engine.py [--statlines 5000] [--players 400]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.stat_engine import StatEngine, player_key  # noqa: E402
+
+COLUMNS = {"QB": ("qbr", "comp", "yds", "td", "int")}
+TEAMS = ["Dallas Cowboys", "Miami Dolphins", "Chicago Bears", "Detroit Lions"]
+
+
+def synthetic_statlines(count: int, players: int, seed: int = 0):
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        rid = rng.randrange(1, players + 1)
+        lines.append({
+            "pos": "QB", "rid": rid, "player": f"player{rid}", "team": rng.choice(TEAMS),
+            "game": i // 20 + 1, "week": (i // 20) % 10 + 1, "season": 1,
+            "stats": {"qbr": round(rng.uniform(0, 158.3), 1), "comp": rng.randrange(30),
+                      "yds": rng.randrange(400), "td": rng.randrange(5), "int": rng.randrange(3)},
+        })
+    return lines
+
+
+def dict_totals(lines, weeks=None):
+    """The old shape: one dict per player, += per statline."""
+    totals = {}
+    for line in lines:
+        if weeks and not weeks[0] <= line["week"] <= weeks[1]:
+            continue
+        key = player_key(line["rid"], line["player"])
+        p = totals.setdefault(key, {"player": line["player"], "qbr": 0, "comp": 0, "yds": 0, "td": 0, "int": 0})
+        for field, value in line["stats"].items():
+            if field == "qbr":
+                p[field] = value
+            else:
+                p[field] += value
+    return totals
+
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--statlines", type=int, default=5000)
+    parser.add_argument("--players", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    lines = synthetic_statlines(args.statlines, args.players)
+    engine = StatEngine(COLUMNS)
+    engine.load(lines)
+
+    def dict_window():
+        totals = dict_totals(lines, weeks=(3, 6))
+        return sorted(totals.values(), key=lambda p: p["yds"], reverse=True)[:15]
+
+    def engine_window():
+        return engine.leaders("QB", "yds", 15, season=1, weeks=(3, 6))
+
+    assert [p["yds"] for p in dict_window()] == [r["yds"] for _, r in engine_window()]
+
+    def engine_rebuild():
+        e = StatEngine(COLUMNS)
+        e.load(lines)
+        return e.player_rows("QB", season=1)
+
+    print(f"{args.statlines} statlines, {args.players} players (median of {args.repeat})")
+    print(f"{'query':<28}{'dicts ms':>10}{'numpy ms':>10}")
+    print(f"{'top 15 yds, weeks 3-6':<28}{timed(dict_window, args.repeat):>10.2f}{timed(engine_window, args.repeat):>10.2f}")
+    print(f"{'season totals rebuild':<28}{timed(lambda: dict_totals(lines), args.repeat):>10.2f}"
+          f"{timed(engine_rebuild, args.repeat):>10.2f}")
+    print(f"{'per-game leaders':<28}{'-':>10}"
+          f"{timed(lambda: engine.leaders('QB', 'yds', 15, per_game=True), args.repeat):>10.2f}")
+    print(f"{'team totals':<28}{'-':>10}{timed(lambda: engine.team_rows('QB'), args.repeat):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Times team-mention detection on synthetic Football Fusion exports.
+
+    python scripts/bench_team_detection.py
+
+"before" is the old _detect_teams_from_report: flatten every string into
+a list, then lowercase and substring-test all 32 team names per string.
+"after" is utils.team_matcher.TEAM_DETECTOR, which also knows nicknames
+and emoji names. "agree" checks both pick the export's two teams.
+"""
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.config import NFL_TEAMS  # noqa: E402
+from utils.team_matcher import TEAM_DETECTOR, TeamDetector  # noqa: E402
+
+RUNS = 20
+SIZES = [50, 200, 1000]  # players per export
+
+
+def old_flatten(obj):
+    out = []
+    if isinstance(obj, dict):
+        for v in obj.values():
+            out.extend(old_flatten(v))
+    elif isinstance(obj, list):
+        for v in obj:
+            out.extend(old_flatten(v))
+    elif isinstance(obj, str):
+        out.append(obj)
+    return out
+
+
+def old_detect(report):
+    strings = old_flatten(report)
+    if not strings:
+        return None, None
+
+    counts = {t: 0 for t in NFL_TEAMS}
+    for s in strings:
+        s_low = s.lower()
+        for t in NFL_TEAMS:
+            if t.lower() in s_low:
+                counts[t] += 1
+
+    hits = [(t, c) for t, c in counts.items() if c > 0]
+    hits.sort(key=lambda x: x[1], reverse=True)
+    if len(hits) >= 2:
+        return hits[0][0], hits[1][0]
+    if len(hits) == 1:
+        return hits[0][0], None
+    return None, None
+
+
+def fake_export(rng, players, chat_lines=0):
+    """
+    Export shaped like Football Fusion's: per-player name/display/team and
+    stat blocks (numbers often arrive as strings). `chat_lines` adds a log
+    of long free-text lines, the worst case for a per-character scan.
+    """
+    home, away = rng.sample(NFL_TEAMS, 2)
+
+    def word(n):
+        return "".join(rng.choice(string.ascii_letters) for _ in range(n))
+
+    def stat(hi):
+        value = rng.randint(0, hi)
+        return str(value) if rng.random() < 0.5 else value
+
+    report = {
+        "meta": {"home": home, "away": away, "map": word(8), "server": word(12)},
+        "players": {
+            str(10_000 + i): {
+                "other": {
+                    "name": word(rng.randint(5, 16)),
+                    "display": word(rng.randint(5, 16)),
+                    "team": home if i % 2 else away,
+                },
+                "qb": {"comp": stat(30), "yds": stat(400), "td": stat(5), "int": stat(3), "qbr": stat(158)},
+                "wr": {"rec": stat(12), "yds": stat(200), "td": stat(3), "fum": stat(2)},
+                "db": {"defl": stat(6), "int": stat(3), "rtng": stat(100)},
+                "de": {"sack": stat(4), "safe": stat(1), "ffum": stat(2)},
+            }
+            for i in range(players)
+        },
+    }
+    if chat_lines:
+        report["log"] = [
+            f"{word(30)} {rng.choice([home, away, word(10)])} {word(30)}" for _ in range(chat_lines)
+        ]
+    return report
+
+
+def timed(fn, report):
+    started = time.perf_counter()
+    for _ in range(RUNS):
+        result = fn(report)
+    return result, (time.perf_counter() - started) * 1000 / RUNS
+
+
+def main():
+    rng = random.Random(3)
+
+    print(f"{'export':>16}{'strings':>10}{'before ms':>12}{'after ms':>12}{'speedup':>10}  agree")
+    for players, chat in [(n, 0) for n in SIZES] + [(n, n) for n in SIZES]:
+        report = fake_export(rng, players, chat)
+        label = f"{players}p" + (f" +{chat} chat" if chat else "")
+        n_strings = len(old_flatten(report))
+
+        before, before_ms = timed(old_detect, report)
+        after, after_ms = timed(TEAM_DETECTOR.top_two, report)
+        same = set(before) == set(after) == {report["meta"]["home"], report["meta"]["away"]}
+
+        print(f"{label:>16}{n_strings:>10}{before_ms:>12.2f}{after_ms:>12.2f}{before_ms / after_ms:>9.1f}x  {same}")
+
+    started = time.perf_counter()
+    TeamDetector()
+    print(f"\nautomaton build: {(time.perf_counter() - started) * 1000:.1f} ms, "
+          f"{len(TEAM_DETECTOR.matcher.delta)} states")
+
+
+if __name__ == "__main__":
+    main()
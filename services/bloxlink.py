@@ -0,0 +1,324 @@
+import asyncio
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional
+
+import aiohttp
+
+BLOXLINK_API_BASE = os.getenv("BLOXLINK_API_BASE", "https://api.blox.link/v4/public")
+
+# client-side budget; the rate-limit headers Bloxlink sends tighten it further
+BLOXLINK_RATE_PER_SECOND = float(os.getenv("BLOXLINK_RATE_PER_SECOND", "5"))
+BLOXLINK_BURST = int(os.getenv("BLOXLINK_BURST", "10"))
+
+BLOXLINK_MAX_RETRIES = 3
+RETRY_BASE_SECONDS = 0.5
+RETRY_CAP_SECONDS = 8.0
+
+# consecutive failed lookups before we stop calling Bloxlink for a while
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 30.0
+
+LINKED = "linked"
+NOT_LINKED = "not_linked"
+UNKNOWN = "unknown"
+
+
+class BloxlinkError(Exception):
+    """Bloxlink didn't give an answer (rate limit, outage); nothing should be cached."""
+
+
+class BloxlinkResult(NamedTuple):
+    status: str             # LINKED, NOT_LINKED or UNKNOWN
+    id: Optional[int] = None
+    reason: str = ""
+
+
+# =========================
+# RATE LIMITING
+# =========================
+class TokenBucket:
+    """`rate` tokens per second up to `capacity`; pause() empties it until a deadline."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> float:
+        """Waits for a token; returns how long it waited."""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    delay = self.paused_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    delay = (1 - self.tokens) / self.rate
+
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def pause(self, seconds: float):
+        now = time.monotonic()
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = 0.0
+        self.updated = max(self.updated, self.paused_until)
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures; while open every call is
+    refused until `cooldown` passes, then one probe is let through.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.probing:
+            self.probing = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.probing = False
+        if self.opened_at is not None or self.failures >= self.threshold:
+            if self.opened_at is None:
+                print(f"⚠️ Bloxlink circuit open after {self.failures} failures; pausing lookups {self.cooldown:.0f}s")
+            self.opened_at = time.monotonic()
+
+
+# =========================
+# RESPONSE PARSING
+# =========================
+def _find_id(data: Dict[str, Any], keys, user_keys, extra_keys=()) -> Optional[int]:
+    for key in keys:
+        value = data.get(key)
+        # v4 answers roblox-to-discord with a list of every linked account
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if value is not None and str(value).isdigit():
+            return int(value)
+
+    user = data.get("user") or {}
+    for key in user_keys:
+        if key in user and str(user[key]).isdigit():
+            return int(user[key])
+
+    for key in extra_keys:
+        if key in data and str(data[key]).isdigit():
+            return int(data[key])
+
+    return None
+
+
+def _retry_after(resp: aiohttp.ClientResponse) -> Optional[float]:
+    """Seconds to wait from Retry-After (delta or HTTP date) or X-RateLimit-Reset-After."""
+    value = resp.headers.get("Retry-After")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    for header in ("X-RateLimit-Reset-After", "X-RateLimit-Reset"):
+        value = resp.headers.get(header)
+        if value:
+            try:
+                seconds = float(value)
+            except ValueError:
+                continue
+            # some APIs send an epoch timestamp here rather than a delta
+            if seconds > 10**9:
+                seconds -= time.time()
+            return max(0.0, seconds)
+
+    return None
+
+
+# =========================
+# CLIENT
+# =========================
+class BloxlinkClient:
+    """
+    Bloxlink v4 lookups over a shared aiohttp session. Every call returns a
+    BloxlinkResult; UNKNOWN means we couldn't find out (and may retry later),
+    as opposed to NOT_LINKED.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        session_factory: Callable[[], Awaitable[aiohttp.ClientSession]],
+        base_url: str = BLOXLINK_API_BASE,
+        rate: float = BLOXLINK_RATE_PER_SECOND,
+        burst: int = BLOXLINK_BURST,
+        max_retries: int = BLOXLINK_MAX_RETRIES,
+    ):
+        self.api_key = api_key
+        self.session_factory = session_factory
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(BREAKER_THRESHOLD, BREAKER_COOLDOWN_SECONDS)
+
+        self.metrics = {
+            "requests": 0,
+            "linked": 0,
+            "not_linked": 0,
+            "unknown": 0,
+            "rate_limited": 0,
+            "retries": 0,
+            "short_circuited": 0,
+            "throttled_seconds": 0.0,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.metrics, "breaker": self.breaker.state, "tokens": round(self.bucket.tokens, 2)}
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter, so a burst of failed lookups doesn't retry in lockstep
+        return random.uniform(0, min(RETRY_CAP_SECONDS, RETRY_BASE_SECONDS * 2 ** attempt))
+
+    def _note_headers(self, resp: aiohttp.ClientResponse):
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.strip() == "0":
+            wait = _retry_after(resp)
+            if wait:
+                self.bucket.pause(wait)
+
+    def _done(self, result: BloxlinkResult) -> BloxlinkResult:
+        self.metrics[result.status] += 1
+        if result.status == UNKNOWN:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return result
+
+    async def _lookup(self, path: str, parse: Callable[[Dict[str, Any]], Optional[int]]) -> BloxlinkResult:
+        if not self.api_key:
+            return BloxlinkResult(UNKNOWN, reason="no API key")
+
+        if not self.breaker.allow():
+            self.metrics["short_circuited"] += 1
+            return BloxlinkResult(UNKNOWN, reason="circuit open")
+
+        url = f"{self.base_url}/{path}"
+        reason = ""
+        delay = 0.0
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.metrics["retries"] += 1
+                # sleep outside the request so the connection goes back to the pool
+                await asyncio.sleep(delay)
+
+            self.metrics["throttled_seconds"] += await self.bucket.acquire()
+            self.metrics["requests"] += 1
+
+            delay = self._backoff(attempt)
+            try:
+                session = await self.session_factory()
+                async with session.get(url, headers={"Authorization": self.api_key}) as resp:
+                    self._note_headers(resp)
+
+                    if resp.status == 200:
+                        try:
+                            data = await resp.json(content_type=None)
+                        except ValueError:
+                            text = await resp.text()
+                            print(f"Bloxlink returned non-JSON response: {text[:200]}")
+                            reason = "non-JSON response"
+                            continue
+
+                        found = parse(data) if isinstance(data, dict) else None
+                        if found is None:
+                            return self._done(BloxlinkResult(NOT_LINKED, reason="no id in response"))
+                        return self._done(BloxlinkResult(LINKED, found))
+
+                    if resp.status == 404:
+                        return self._done(BloxlinkResult(NOT_LINKED))
+
+                    if resp.status == 429:
+                        self.metrics["rate_limited"] += 1
+                        wait = _retry_after(resp)
+                        if wait is not None:
+                            # the bucket holds every caller back, not just this one
+                            self.bucket.pause(wait)
+                            delay = 0.0
+                        reason = "rate limited"
+                        continue
+
+                    if resp.status >= 500:
+                        reason = f"HTTP {resp.status}"
+                        continue
+
+                    # 400/401/403: retrying won't change the answer
+                    print(f"Bloxlink API error: {resp.status}")
+                    return self._done(BloxlinkResult(UNKNOWN, reason=f"HTTP {resp.status}"))
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                reason = f"{type(e).__name__}: {e}"
+
+        print(f"⚠️ Bloxlink lookup gave up after {self.max_retries + 1} tries ({reason})")
+        return self._done(BloxlinkResult(UNKNOWN, reason=reason))
+
+    async def roblox_to_discord(self, guild_id: int, roblox_id: int) -> BloxlinkResult:
+        return await self._lookup(
+            f"guilds/{guild_id}/roblox-to-discord/{roblox_id}",
+            lambda data: _find_id(
+                data,
+                ("discordIDs", "discordID", "discordId", "discord_id"),
+                ("discordID", "discordId", "id"),
+                ("discord",),
+            ),
+        )
+
+    async def discord_to_roblox(self, guild_id: int, discord_id: int) -> BloxlinkResult:
+        return await self._lookup(
+            f"guilds/{guild_id}/discord-to-roblox/{discord_id}",
+            lambda data: _find_id(
+                data,
+                ("robloxID", "robloxId", "roblox_id"),
+                ("robloxID", "robloxId", "id"),
+            ),
+        )
@@ -0,0 +1,56 @@
+from typing import NamedTuple, Optional
+
+import discord
+
+# suggestions shown per unmatched player (one button each)
+SUGGESTION_LIMIT = 3
+
+# Dice score under which a name isn't worth suggesting
+MIN_SUGGESTION_SCORE = 0.45
+
+
+class Suggestion(NamedTuple):
+    member: discord.Member
+    score: float
+    via: str        # "discord name" or "roblox link"
+    matched: str    # the indexed name that matched
+
+
+def suggest_members(
+    guild: discord.Guild,
+    member_names,
+    link_store,
+    roblox_username: Optional[str] = None,
+    roblox_display_name: Optional[str] = None,
+    limit: int = SUGGESTION_LIMIT,
+    min_score: float = MIN_SUGGESTION_SCORE,
+) -> list[Suggestion]:
+    """
+    Ranked guesses for a report player nobody could match exactly, from the
+    trigram indexes over member names (utils.member_index) and over the
+    Roblox names we've linked before (utils.link_store) - the latter catches
+    players who moved to a new Roblox account under a similar name.
+    """
+    best: dict[int, tuple[float, str, str]] = {}
+
+    def offer(member_id, score, via, matched):
+        if member_id not in best or score > best[member_id][0]:
+            best[member_id] = (score, via, matched)
+
+    for name in dict.fromkeys(n for n in (roblox_username, roblox_display_name) if n):
+        for member_id, score, matched in member_names.similar(name, limit * 2, min_score):
+            offer(member_id, score, "discord name", matched)
+        for member_id, score, matched in link_store.similar(name, limit * 2, min_score):
+            offer(member_id, score, "roblox link", matched)
+
+    out = []
+    for member_id, (score, via, matched) in sorted(best.items(), key=lambda x: (-x[1][0], x[0])):
+        member = guild.get_member(member_id)
+        if member is None or member.bot:
+            continue
+
+        out.append(Suggestion(member, score, via, matched))
+        if len(out) >= limit:
+            break
+
+    return out
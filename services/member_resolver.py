@@ -0,0 +1,105 @@
+import asyncio
+import os
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+import discord
+
+# Bloxlink lookups in flight at once for one report
+BLOXLINK_CONCURRENCY = int(os.getenv("BLOXLINK_CONCURRENCY", "8"))
+
+# the gateway takes at most 100 user ids per member request
+QUERY_MEMBERS_CHUNK = 100
+
+DiscordIdLookup = Callable[[int], Awaitable[Optional[int]]]
+
+
+async def lookup_discord_ids(
+    roblox_ids: Iterable[int],
+    lookup: DiscordIdLookup,
+    concurrency: int = BLOXLINK_CONCURRENCY,
+) -> Dict[int, Optional[int]]:
+    """
+    roblox id -> discord id (None when not linked or the lookup failed),
+    with each distinct id looked up once and at most `concurrency` at a time.
+    """
+    unique = list(dict.fromkeys(int(r) for r in roblox_ids if r))
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(rid):
+        async with sem:
+            try:
+                return await lookup(rid)
+            except Exception as e:
+                print(f"⚠️ Bloxlink lookup failed for {rid}: {type(e).__name__}: {e}")
+                return None
+
+    results = await asyncio.gather(*(one(rid) for rid in unique))
+    return dict(zip(unique, results))
+
+
+async def fetch_members(
+    guild: discord.Guild,
+    discord_ids: Iterable[int],
+    concurrency: int = BLOXLINK_CONCURRENCY,
+) -> Dict[int, discord.Member]:
+    """
+    Members for the given ids: the cache first, then one gateway request per
+    100 misses. Falls back to concurrent fetch_member calls when the gateway
+    request isn't available (no members intent, shard not ready).
+    """
+    found: Dict[int, discord.Member] = {}
+    misses = []
+
+    for did in dict.fromkeys(discord_ids):
+        member = guild.get_member(did)
+        if member is not None:
+            found[did] = member
+        else:
+            misses.append(did)
+
+    for start in range(0, len(misses), QUERY_MEMBERS_CHUNK):
+        chunk = misses[start:start + QUERY_MEMBERS_CHUNK]
+        try:
+            members = await guild.query_members(user_ids=chunk, limit=len(chunk), cache=True)
+        except (discord.ClientException, asyncio.TimeoutError) as e:
+            print(f"⚠️ query_members unavailable ({type(e).__name__}); fetching members one by one")
+            found.update(await _fetch_each(guild, misses[start:], concurrency))
+            break
+
+        found.update({m.id: m for m in members})
+
+    return found
+
+
+async def _fetch_each(guild: discord.Guild, discord_ids, concurrency: int) -> Dict[int, discord.Member]:
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(did):
+        async with sem:
+            try:
+                return await guild.fetch_member(did)
+            except (discord.NotFound, discord.HTTPException):
+                return None
+
+    members = await asyncio.gather(*(one(did) for did in discord_ids))
+    return {m.id: m for m in members if m is not None}
+
+
+async def resolve_members(
+    guild: discord.Guild,
+    roblox_ids: Iterable[int],
+    lookup: DiscordIdLookup,
+    concurrency: int = BLOXLINK_CONCURRENCY,
+) -> Dict[int, Optional[discord.Member]]:
+    """
+    roblox id -> guild member for every player in a report, resolved up
+    front: Bloxlink lookups fan out under a semaphore, then member misses
+    are batched. Unresolved ids map to None.
+    """
+    discord_ids = await lookup_discord_ids(roblox_ids, lookup, concurrency)
+    members = await fetch_members(guild, [d for d in discord_ids.values() if d], concurrency)
+
+    return {
+        rid: members.get(did) if did else None
+        for rid, did in discord_ids.items()
+    }
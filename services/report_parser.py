@@ -0,0 +1,217 @@
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, NamedTuple, Optional
+
+# Football Fusion exports are a few KB per player; anything far past this
+# is not an export.
+MAX_REPORT_BYTES = int(os.getenv("MAX_REPORT_BYTES", str(2 * 1024 * 1024)))
+MAX_REPORT_PLAYERS = 200
+
+# 0 parses in a thread instead (hosts that don't allow subprocesses)
+REPORT_PARSE_WORKERS = int(os.getenv("REPORT_PARSE_WORKERS", "2"))
+
+
+class ReportError(ValueError):
+    """The uploaded file is not a usable Football Fusion export."""
+
+
+class PlayerStatline(NamedTuple):
+    roblox_id: int  # 0 when the export key isn't a Roblox user id
+    roblox_username: str
+    roblox_display: str
+    team: str
+
+    qb_qbr: float
+    qb_comp: int
+    qb_yds: int
+    qb_td: int
+    qb_int: int
+
+    wr_rec: int
+    wr_yds: int
+    wr_td: int
+    wr_fum: int
+
+    db_swats: int
+    db_int: int
+    db_dbr: float
+
+    de_sacks: int
+    de_safeties: int
+    de_ff: int
+
+    @property
+    def name(self) -> str:
+        return self.roblox_display or self.roblox_username
+
+    # same thresholds /gamereport has always used for "played this position"
+    def has_qb(self) -> bool:
+        return self.qb_yds > 0
+
+    def has_wr(self) -> bool:
+        return self.wr_yds > 0
+
+    def has_db(self) -> bool:
+        return self.db_int > 0 or self.db_swats > 0
+
+    def has_de(self) -> bool:
+        return self.de_sacks > 0
+
+
+# =========================
+# PARSING (runs in the worker)
+# =========================
+def _int(value) -> int:
+    try:
+        return int(float(value or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _float(value) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _section(pdata: Dict[str, Any], key: str) -> Dict[str, Any]:
+    value = pdata.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+def statline_from_export(key: str, pdata: Dict[str, Any]) -> PlayerStatline:
+    other = _section(pdata, "other")
+    qb = _section(pdata, "qb")
+    wr = _section(pdata, "wr")
+    db = _section(pdata, "db")
+    de = _section(pdata, "def")
+
+    roblox_id = int(key) if str(key).isdigit() else 0
+
+    name = str(other.get("name", "") or "").strip()
+    display = str(other.get("display", "") or "").strip()
+    username = name or display or (str(roblox_id) if roblox_id else "Unknown")
+
+    return PlayerStatline(
+        roblox_id=roblox_id,
+        roblox_username=username,
+        roblox_display=display or username,
+        team=str(other.get("team") or "Free Agent"),
+
+        qb_qbr=_float(qb.get("qbr", qb.get("rtng", 0))),
+        qb_comp=_int(qb.get("comp")),
+        qb_yds=_int(qb.get("yds")),
+        qb_td=_int(qb.get("td")),
+        qb_int=_int(qb.get("int", qb.get("ints", 0))),
+
+        wr_rec=_int(wr.get("rec", wr.get("catch", 0))),
+        wr_yds=_int(wr.get("yds")),
+        wr_td=_int(wr.get("td")),
+        wr_fum=_int(wr.get("fum", wr.get("fumble", 0))),
+
+        db_swats=_int(db.get("defl")),
+        db_int=_int(db.get("int")),
+        db_dbr=_float(db.get("rtng")),
+
+        de_sacks=_int(de.get("sack")),
+        de_safeties=_int(de.get("safe")),
+        de_ff=_int(de.get("ffum")),
+    )
+
+
+def statlines_from_report(report: Dict[str, Any]) -> tuple[PlayerStatline, ...]:
+    return tuple(
+        statline_from_export(key, pdata)
+        for key, pdata in report.items()
+        if isinstance(pdata, dict)
+    )
+
+
+def parse_report_bytes(raw: bytes) -> tuple[PlayerStatline, ...]:
+    """Validates a raw export and returns one statline per player."""
+    if len(raw) > MAX_REPORT_BYTES:
+        raise ReportError(f"File is too large ({len(raw) // 1024} KB, max {MAX_REPORT_BYTES // 1024} KB).")
+
+    # exports are sometimes pasted with a BOM or chat text around them
+    start = raw.find(b"{")
+    end = raw.rfind(b"}")
+    if start == -1 or end <= start:
+        raise ReportError("No JSON found.")
+
+    try:
+        report = json.loads(raw[start:end + 1].decode("utf-8", errors="ignore"))
+    except ValueError as e:
+        raise ReportError(f"Invalid JSON: {e}") from None
+
+    if not isinstance(report, dict):
+        raise ReportError("Export must be a JSON object keyed by player.")
+
+    statlines = statlines_from_report(report)
+    if not statlines:
+        raise ReportError("Export has no players.")
+    if len(statlines) > MAX_REPORT_PLAYERS:
+        raise ReportError(f"Export has {len(statlines)} players (max {MAX_REPORT_PLAYERS}).")
+
+    return statlines
+
+
+# =========================
+# WORKER POOL
+# =========================
+_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _POOL
+
+    if REPORT_PARSE_WORKERS <= 0:
+        return None
+
+    if _POOL is None:
+        # spawn, not fork: the bot process has an event loop and threads
+        _POOL = ProcessPoolExecutor(
+            max_workers=REPORT_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _POOL
+
+
+def start_report_pool():
+    """Starts the workers ahead of the first report so it doesn't pay the spawn cost."""
+    pool = _get_pool()
+    if pool is not None:
+        for _ in range(REPORT_PARSE_WORKERS):
+            pool.submit(len, b"")
+
+
+def shutdown_report_pool():
+    global _POOL
+
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+
+async def parse_report(raw: bytes) -> tuple[PlayerStatline, ...]:
+    """Parses an export off the event loop. Raises ReportError for bad files."""
+    global _POOL
+
+    if len(raw) > MAX_REPORT_BYTES:
+        raise ReportError(f"File is too large ({len(raw) // 1024} KB, max {MAX_REPORT_BYTES // 1024} KB).")
+
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+
+    if pool is not None:
+        try:
+            return await loop.run_in_executor(pool, parse_report_bytes, raw)
+        except BrokenProcessPool:
+            print("⚠️ Report parser pool died; restarting it and parsing in a thread")
+            _POOL = None
+
+    return await asyncio.to_thread(parse_report_bytes, raw)
@@ -1,7 +1,12 @@
 import os
 import json
-import gspread
-from google.oauth2.service_account import Credentials
+import threading
+import time
+
+from utils.storage import STORAGE
+from utils.ledger import SEASON, voided_seqs
+from utils.leaderboard import LeaderboardIndex
+from utils.stat_engine import StatEngine
 
 # =========================
 # GOOGLE CONFIG
@@ -16,22 +21,101 @@ SPREADSHEET_ID = os.getenv("SPREADSHEET_ID")
 # =========================
 # CLIENT / BOOK
 # =========================
+# HTTP requests made to Google, by endpoint kind; a warm commit is one
+# "values:batchUpdate"
+SHEETS_API_CALLS = {"total": 0}
+
+_CLIENT = None
+_BOOK = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _count_requests(http_client):
+    request = http_client.request
+
+    def counted(method, endpoint, *args, **kwargs):
+        last = endpoint.rsplit("/", 1)[-1].split("?")[0]
+        kind = last if ":" in last else method.upper()
+        SHEETS_API_CALLS["total"] += 1
+        SHEETS_API_CALLS[kind] = SHEETS_API_CALLS.get(kind, 0) + 1
+        return request(method, endpoint, *args, **kwargs)
+
+    http_client.request = counted
+
+
 def _client():
-    creds_dict = json.loads(os.getenv("GOOGLE_CREDENTIALS"))
-    creds = Credentials.from_service_account_info(creds_dict, scopes=SCOPES)
-    return gspread.authorize(creds)
+    global _CLIENT
+
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            # gspread + google-auth cost ~350 ms to import; only pay it once
+            # something actually talks to the sheet
+            import gspread
+            from google.oauth2.service_account import Credentials
+
+            creds_dict = json.loads(os.getenv("GOOGLE_CREDENTIALS"))
+            creds = Credentials.from_service_account_info(creds_dict, scopes=SCOPES)
+            _CLIENT = gspread.authorize(creds)
+
+            # gspread < 6 has no http_client; the counter then stays at 0
+            if hasattr(_CLIENT, "http_client"):
+                _count_requests(_CLIENT.http_client)
+
+        return _CLIENT
 
 def _book():
-    return _client().open_by_key(SPREADSHEET_ID)
+    global _BOOK
+
+    client = _client()
+    with _CLIENT_LOCK:
+        if _BOOK is None:
+            _BOOK = client.open_by_key(SPREADSHEET_ID)
+        return _BOOK
+
+def reset_sheets_client():
+    """Drops the cached client/book (e.g. after credentials change)."""
+    global _CLIENT, _BOOK
+
+    with _CLIENT_LOCK:
+        _CLIENT = None
+        _BOOK = None
 
 # =========================
 # MEMORY
 # =========================
+# Every statline of the season lives in ENGINE as NumPy columns. The
+# per-position dicts below are season totals derived from it, keyed by
+# player_key(), for the sheet rows and the leaderboard index.
 QB_DATA = {}
 WR_DATA = {}
 DB_DATA = {}
 DE_DATA = {}
 
+STORES = {"QB": QB_DATA, "WR": WR_DATA, "DB": DB_DATA, "DE": DE_DATA}
+
+# players whose totals changed since the last sheet commit, per position
+_DIRTY = {"QB": set(), "WR": set(), "DB": set(), "DE": set()}
+
+# every stat column per position, ranked as statlines come in; feeds the
+# PlayerStats top 15 and /leaders
+STAT_COLUMNS = {
+    "QB": ("qbr", "comp", "yds", "td", "int"),
+    "WR": ("rec", "yds", "td", "fum"),
+    "DB": ("defl", "int", "rtng"),
+    "DE": ("sack", "safe", "ff"),
+}
+LEADERS = LeaderboardIndex(STAT_COLUMNS)
+ENGINE = StatEngine(STAT_COLUMNS)
+
+# season the totals cover (None = everything recorded)
+_TOTALS_SEASON = None
+
+# the statlines log is read on first use (or by warm_totals), not at import
+_LOADED = False
+
+# statlines arrive from report threads while commands read totals
+_ENGINE_LOCK = threading.RLock()
+
 # =========================
 # HELPERS
 # =========================
@@ -40,148 +124,398 @@ def _short_team(team):
         return team
     return team.split()[-1]
 
-def _get_player(store, name, team):
-    if name not in store:
-        store[name] = {
-            "player": name,
-            "team": _short_team(team),
-            "qbr": 0, "comp": 0, "yds": 0, "td": 0, "int": 0,
-            "rec": 0, "fum": 0,
-            "defl": 0, "rtng": 0,
-            "sack": 0, "safe": 0, "ff": 0
-        }
-    return store[name]
+def _refresh(pos, keys=None):
+    """Re-derives the totals of `keys` (everyone when None) from ENGINE."""
+    rows = ENGINE.player_rows(pos, season=_TOTALS_SEASON, keys=keys)
+    store = STORES[pos]
+
+    for key, row in rows.items():
+        row["team"] = _short_team(row["team"])
+        store[key] = row
+        LEADERS.update(pos, key, row)
+    return rows
+
+# =========================
+# STATLINES
+# =========================
+def qb_statline(player, team, qbr, comp, yds, td, ints, roblox_id=None):
+    return {"pos": "QB", "rid": roblox_id, "player": player, "team": team,
+            "stats": {"qbr": qbr, "comp": comp, "yds": yds, "td": td, "int": ints}}
+
+def wr_statline(player, team, rec, yds, td, fum, roblox_id=None):
+    return {"pos": "WR", "rid": roblox_id, "player": player, "team": team,
+            "stats": {"rec": rec, "yds": yds, "td": td, "fum": fum}}
+
+def db_statline(player, team, defl, ints, rtng, roblox_id=None):
+    return {"pos": "DB", "rid": roblox_id, "player": player, "team": team,
+            "stats": {"defl": defl, "int": ints, "rtng": rtng}}
+
+def de_statline(player, team, sack, safe, ff, roblox_id=None):
+    return {"pos": "DE", "rid": roblox_id, "player": player, "team": team,
+            "stats": {"sack": sack, "safe": safe, "ff": ff}}
+
+def record_statlines(lines, game=None, week=None, season=None):
+    """
+    Persists one game's statlines (a single storage write) and folds them
+    into the totals. `game` is the ledger game number.
+    """
+    tagged = [{"game": game, "season": season, "week": week, **line} for line in lines]
+    _ensure_loaded()
+
+    with _ENGINE_LOCK:
+        touched = {}
+        for pos, key in ENGINE.append(STORAGE.append_statlines(tagged)):
+            touched.setdefault(pos, set()).add(key)
+
+        for pos, keys in touched.items():
+            _DIRTY[pos] |= _refresh(pos, keys).keys()
+
+def credit_player(roblox_id, name):
+    """
+    Shows a Roblox player's totals under `name` (the Discord member they
+    were linked to). Their statlines are keyed by Roblox id, so nothing
+    moves; the rows just change name on the next commit.
+    """
+    _ensure_loaded()
+    with _ENGINE_LOCK:
+        touched = {}
+        for pos, key in ENGINE.rename_player(roblox_id, name):
+            touched.setdefault(pos, set()).add(key)
+
+        for pos, keys in touched.items():
+            _DIRTY[pos] |= _refresh(pos, keys).keys()
+
+def _linked_names():
+    """Roblox id -> the linked member's display name, from the saved links."""
+    try:
+        links = STORAGE.load_links().get("discord_to_roblox", {})
+    except Exception as e:
+        print(f"⚠️ Could not load Roblox/Discord links for stat names: {type(e).__name__}: {e}")
+        return {}
+    return {
+        e["roblox_id"]: e.get("discord_display_name") or e.get("discord_name")
+        for e in links.values()
+        if e.get("roblox_id")
+    }
 
 # =========================
 # ADD STATS
 # =========================
-def append_qb_statline(player, team, qbr, comp, yds, td, ints):
-    p = _get_player(QB_DATA, player, team)
-    p["qbr"] = qbr
-    p["comp"] += comp
-    p["yds"] += yds
-    p["td"] += td
-    p["int"] += ints
-
-def append_wr_statline(player, team, rec, yds, td, fum):
-    p = _get_player(WR_DATA, player, team)
-    p["rec"] += rec
-    p["yds"] += yds
-    p["td"] += td
-    p["fum"] += fum
-
-def append_db_statline(player, team, defl, ints, rtng):
-    p = _get_player(DB_DATA, player, team)
-    p["defl"] += defl
-    p["int"] += ints
-    p["rtng"] = rtng
-
-def append_de_statline(player, team, sack, safe, ff):
-    p = _get_player(DE_DATA, player, team)
-    p["sack"] += sack
-    p["safe"] += safe
-    p["ff"] += ff
+def append_qb_statline(player, team, qbr, comp, yds, td, ints, roblox_id=None, game=None, week=None, season=None):
+    record_statlines([qb_statline(player, team, qbr, comp, yds, td, ints, roblox_id)], game, week, season)
+
+def append_wr_statline(player, team, rec, yds, td, fum, roblox_id=None, game=None, week=None, season=None):
+    record_statlines([wr_statline(player, team, rec, yds, td, fum, roblox_id)], game, week, season)
+
+def append_db_statline(player, team, defl, ints, rtng, roblox_id=None, game=None, week=None, season=None):
+    record_statlines([db_statline(player, team, defl, ints, rtng, roblox_id)], game, week, season)
+
+def append_de_statline(player, team, sack, safe, ff, roblox_id=None, game=None, week=None, season=None):
+    record_statlines([de_statline(player, team, sack, safe, ff, roblox_id)], game, week, season)
+
+# =========================
+# RECOMPUTE
+# =========================
+def _current_season():
+    for entry in reversed(STORAGE.games()):
+        if entry.get("type") == SEASON:
+            return int(entry["season"])
+
+    standings = STORAGE.load_standings() or {}
+    return standings.get("season")
+
+def _rebuild_totals(season=None):
+    global _TOTALS_SEASON, _LOADED
+
+    lines = STORAGE.statlines()
+    voided = voided_seqs(STORAGE.games())
+    names = _linked_names()
+
+    with _ENGINE_LOCK:
+        # untagged lines predate seasons being recorded; the engine keeps them
+        _TOTALS_SEASON = _current_season() if season is None else season
+        ENGINE.load(lines, exclude_games=voided)
+        # players recorded under their Roblox name before they were linked
+        for roblox_id, name in names.items():
+            ENGINE.rename_player(roblox_id, name)
+
+        for store in STORES.values():
+            store.clear()
+        LEADERS.rebuild(STORES)
+
+        for pos in STORES:
+            _refresh(pos)
+        _LOADED = True
+
+def _ensure_loaded():
+    if _LOADED:
+        return
+    with _ENGINE_LOCK:
+        if not _LOADED:
+            _rebuild_totals()
+
+def warm_totals():
+    """Reads the statlines log now, so the first query doesn't pay for it."""
+    _ensure_loaded()
+
+def recompute_totals(season=None):
+    """
+    Rebuilds every total from the stored statlines, leaving out voided
+    games and other seasons. The next commit rewrites the whole sheet.
+    """
+    global _LAST_RECONCILE
+
+    with _SYNC_LOCK:
+        _rebuild_totals(season)
+        _take_dirty()
+        _LAST_RECONCILE = None
 
 # =========================
 # COMMIT TO SHEETS
 # =========================
-def commit_all_stats():
-    book = _book()
+# sheet -> (first row, last row, columns) of each block the bot owns;
+# blocks are rewritten whole, with blank cells standing in for the old clears
+POSITION_BLOCKS = {
+    "QB": ("D", 8, 100, 7),
+    "WR": ("D", 8, 100, 6),
+    "DB": ("D", 8, 100, 5),
+    "DE": ("D", 8, 100, 5),
+}
 
-    qb_sheet = book.worksheet("QB")
-    wr_sheet = book.worksheet("WR")
-    db_sheet = book.worksheet("DB")
-    de_sheet = book.worksheet("DE")
+PLAYERSTATS_BLOCKS = {
+    "QB": ("A", 8, 22, 7),
+    "WR": ("I", 8, 22, 6),
+    "DB": ("A", 26, 40, 6),
+    "DE": ("I", 26, 40, 6),
+}
 
-    # CLEAR
-    qb_sheet.batch_clear(["D8:J100"])
-    wr_sheet.batch_clear(["D8:I100"])
-    db_sheet.batch_clear(["D8:H100"])
-    de_sheet.batch_clear(["D8:H100"])
+TOP_N = 15
 
-    # QB
-    qb_rows = [
-        [p["player"], p["team"], p["qbr"], p["comp"], p["yds"], p["td"], p["int"]]
-        for p in QB_DATA.values()
-    ]
-    if qb_rows:
-        qb_sheet.update("D8", qb_rows, value_input_option="USER_ENTERED")
 
-    # WR
-    wr_rows = [
-        [p["player"], p["team"], p["rec"], p["yds"], p["td"], p["fum"]]
-        for p in WR_DATA.values()
-    ]
-    if wr_rows:
-        wr_sheet.update("D8", wr_rows, value_input_option="USER_ENTERED")
+def _qb_row(p):
+    return [p["player"], p["team"], p["qbr"], p["comp"], p["yds"], p["td"], p["int"]]
 
-    # DB
-    db_rows = [
-        [p["player"], p["team"], p["defl"], p["int"], p["rtng"]]
-        for p in DB_DATA.values()
-    ]
-    if db_rows:
-        db_sheet.update("D8", db_rows, value_input_option="USER_ENTERED")
+def _wr_row(p):
+    return [p["player"], p["team"], p["rec"], p["yds"], p["td"], p["fum"]]
+
+def _db_row(p):
+    return [p["player"], p["team"], p["defl"], p["int"], p["rtng"]]
+
+def _de_row(p):
+    return [p["player"], p["team"], p["sack"], p["safe"], p["ff"]]
+
+
+POSITIONS = {
+    "QB": (QB_DATA, _qb_row, "yds"),
+    "WR": (WR_DATA, _wr_row, "yds"),
+    "DB": (DB_DATA, _db_row, "int"),
+    "DE": (DE_DATA, _de_row, "sack"),
+}
+
+
+def _col_offset(col: str, n: int) -> str:
+    return chr(ord(col) + n)
+
+def _block(sheet, block, rows):
+    col, first, last, width = block
+
+    # grow past the old clear range rather than drop players
+    last = max(last, first + len(rows) - 1)
+    height = last - first + 1
 
-    # DE
-    de_rows = [
-        [p["player"], p["team"], p["sack"], p["safe"], p["ff"]]
-        for p in DE_DATA.values()
+    values = [list(r) + [""] * (width - len(r)) for r in rows]
+    values += [[""] * width for _ in range(height - len(values))]
+
+    return {
+        "range": f"'{sheet}'!{col}{first}:{_col_offset(col, width - 1)}{last}",
+        "values": values,
+    }
+
+def _position_ranges():
+    return [
+        _block(pos, POSITION_BLOCKS[pos], [to_row(p) for p in store.values()])
+        for pos, (store, to_row, _) in POSITIONS.items()
     ]
-    if de_rows:
-        de_sheet.update("D8", de_rows, value_input_option="USER_ENTERED")
 
-    update_playerstats_top15()
+def top_players(pos, stat, n=TOP_N):
+    """The n leaders in one column, as (player key, totals) pairs."""
+    _ensure_loaded()
+    store = STORES[pos]
+    return [(key, store[key]) for key in LEADERS.top(pos, stat, n) if key in store]
+
+def _playerstats_ranges():
+    ranges = {}
+    for pos, (_, to_row, stat) in POSITIONS.items():
+        top = [p for _, p in top_players(pos, stat)]
+        ranges[pos] = _block("PlayerStats", PLAYERSTATS_BLOCKS[pos], [to_row(p) for p in top])
+    return ranges
+
+def build_commit_payload(include_positions: bool = True):
+    data = _position_ranges() if include_positions else []
+    data += list(_playerstats_ranges().values())
+    return {"valueInputOption": "USER_ENTERED", "data": data}
+
+def _send(payload):
+    import gspread
+
+    try:
+        return _book().values_batch_update(payload)
+    except gspread.exceptions.APIError as e:
+        # a stale client (expired token, sheet re-shared) gets one fresh retry
+        if getattr(e, "code", None) not in (401, 403):
+            raise
+        reset_sheets_client()
+        return _book().values_batch_update(payload)
+
+# =========================
+# DELTA SYNC
+# =========================
+# A full rewrite also wipes manual edits and drift; it runs on the first
+# commit after startup (we don't know what the sheet holds) and then at
+# most this often. Every other commit writes only the changed rows.
+STATS_RECONCILE_SECONDS = float(os.getenv("STATS_RECONCILE_SECONDS", "3600"))
+
+_SYNC_LOCK = threading.Lock()
+_ROW_MAP = {pos: {} for pos in POSITIONS}   # position -> player -> sheet row
+_LAST_TOP = {}                              # position -> PlayerStats block last written
+_LAST_RECONCILE = None
+
+SHEETS_SYNC_STATS = {
+    "full_syncs": 0,
+    "delta_syncs": 0,
+    "skipped_syncs": 0,
+    "rows_written": 0,
+}
+
+def _row_range(pos, row):
+    col, _, _, width = POSITION_BLOCKS[pos]
+    return f"'{pos}'!{col}{row}:{_col_offset(col, width - 1)}{row}"
+
+def _delta_ranges(dirty):
+    data = []
+    for pos, names in dirty.items():
+        store, to_row, _ = POSITIONS[pos]
+        width = POSITION_BLOCKS[pos][3]
+        first = POSITION_BLOCKS[pos][1]
+        rows = _ROW_MAP[pos]
+
+        for name in sorted(names):
+            if name not in store:
+                continue
+            if name not in rows:
+                rows[name] = first + len(rows)
+
+            values = to_row(store[name])
+            data.append({
+                "range": _row_range(pos, rows[name]),
+                "values": [values + [""] * (width - len(values))],
+            })
+    return data
+
+def _changed_top_blocks():
+    return {
+        pos: block
+        for pos, block in _playerstats_ranges().items()
+        if _LAST_TOP.get(pos) != block["values"]
+    }
+
+def _take_dirty():
+    """
+    Swaps the dirty sets out under _ENGINE_LOCK, the lock record_statlines
+    adds to them under, so a row dirtied mid-commit lands in the next one.
+    """
+    with _ENGINE_LOCK:
+        dirty = {pos: names for pos, names in _DIRTY.items()}
+        for pos in _DIRTY:
+            _DIRTY[pos] = set()
+    return dirty
+
+def _restore_dirty(dirty):
+    with _ENGINE_LOCK:
+        for pos, names in dirty.items():
+            _DIRTY[pos] |= names
+
+def _reconcile_due():
+    return _LAST_RECONCILE is None or time.monotonic() - _LAST_RECONCILE >= STATS_RECONCILE_SECONDS
+
+def commit_all_stats(full: bool = False):
+    """
+    Sends the rows changed since the last commit, plus any PlayerStats
+    top 15 block that moved, in one batchUpdate. Falls back to rewriting
+    everything when a reconcile is due (or `full` is set).
+    """
+    global _LAST_RECONCILE
+
+    _ensure_loaded()
+    with _SYNC_LOCK:
+        dirty = _take_dirty()
+
+        try:
+            if full or _reconcile_due():
+                _send(build_commit_payload())
+
+                for pos, (store, _, _) in POSITIONS.items():
+                    first = POSITION_BLOCKS[pos][1]
+                    _ROW_MAP[pos] = {name: first + i for i, name in enumerate(store)}
+                _LAST_TOP.clear()
+                _LAST_TOP.update({pos: b["values"] for pos, b in _playerstats_ranges().items()})
+
+                _LAST_RECONCILE = time.monotonic()
+                SHEETS_SYNC_STATS["full_syncs"] += 1
+                SHEETS_SYNC_STATS["rows_written"] += sum(len(s) for s, _, _ in POSITIONS.values())
+                return
+
+            data = _delta_ranges(dirty)
+            tops = _changed_top_blocks()
+            data += list(tops.values())
+
+            if not data:
+                SHEETS_SYNC_STATS["skipped_syncs"] += 1
+                return
+
+            _send({"valueInputOption": "USER_ENTERED", "data": data})
+
+            for pos, block in tops.items():
+                _LAST_TOP[pos] = block["values"]
+            SHEETS_SYNC_STATS["delta_syncs"] += 1
+            SHEETS_SYNC_STATS["rows_written"] += len(data) - len(tops)
+
+        except Exception:
+            # nothing reached the sheet; retry these on the next commit
+            _restore_dirty(dirty)
+            raise
+
+def reconcile_stats():
+    """Full rewrite of every stats block, overwriting manual edits."""
+    commit_all_stats(full=True)
 
 # =========================
 # PLAYERSTATS
 # =========================
 def update_playerstats_top15():
-    sheet = _book().worksheet("PlayerStats")
-
-    sheet.batch_clear([
-        "A8:F22",
-        "I8:N22",
-        "A26:F40",
-        "I26:N40"
-    ])
-
-    def top(data, key):
-        return sorted(data.items(), key=lambda x: x[1][key], reverse=True)[:15]
-
-    qb_top = top(QB_DATA, "yds")
-    wr_top = top(WR_DATA, "yds")
-    db_top = top(DB_DATA, "int")
-    de_top = top(DE_DATA, "sack")
-
-    # QB
-    qb_rows = [
-        [p["player"], p["team"], p["qbr"], p["comp"], p["yds"], p["td"], p["int"]]
-        for _, p in qb_top
-    ]
-    if qb_rows:
-        sheet.update("A8", qb_rows, value_input_option="USER_ENTERED")
+    _ensure_loaded()
+    with _SYNC_LOCK:
+        _send(build_commit_payload(include_positions=False))
+        _LAST_TOP.update({pos: b["values"] for pos, b in _playerstats_ranges().items()})
 
-    # WR (RIGHT SIDE - COLUMN I)
-    wr_rows = [
-        [p["player"], p["team"], p["rec"], p["yds"], p["td"], p["fum"]]
-        for _, p in wr_top
-    ]
-    if wr_rows:
-        sheet.update("I8", wr_rows, value_input_option="USER_ENTERED")
+# =========================
+# QUERIES
+# =========================
+def stat_leaders(pos, stat, n=TOP_N, weeks=None, per_game=False):
+    """
+    Leaders for any week range (lo, hi) and/or per game, computed from the
+    season's statlines rather than the running totals.
+    """
+    _ensure_loaded()
+    with _ENGINE_LOCK:
+        top = ENGINE.leaders(pos, stat, n, season=_TOTALS_SEASON, weeks=weeks, per_game=per_game)
 
-    # DB
-    db_rows = [
-        [p["player"], p["team"], p["defl"], p["int"], p["rtng"]]
-        for _, p in db_top
-    ]
-    if db_rows:
-        sheet.update("A26", db_rows, value_input_option="USER_ENTERED")
+    for _, row in top:
+        row["team"] = _short_team(row["team"])
+    return top
 
-    # DE (RIGHT SIDE - COLUMN I)
-    de_rows = [
-        [p["player"], p["team"], p["sack"], p["safe"], p["ff"]]
-        for _, p in de_top
-    ]
-    if de_rows:
-        sheet.update("I26", de_rows, value_input_option="USER_ENTERED")
\ No newline at end of file
+def team_stats(pos, weeks=None, per_game=False):
+    """team -> that team's combined figures at one position."""
+    _ensure_loaded()
+    with _ENGINE_LOCK:
+        return ENGINE.team_rows(pos, season=_TOTALS_SEASON, weeks=weeks, per_game=per_game)
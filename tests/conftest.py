@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils import schedule_index, standings, storage  # noqa: E402
+
+
+@pytest.fixture
+def league(tmp_path, monkeypatch):
+    """
+    utils.standings wired to a JSON storage under tmp_path, with a
+    two-week schedule and no GitHub mirror.
+    """
+    monkeypatch.setattr(storage, "STANDINGS_FILE", tmp_path / "standings.json")
+    monkeypatch.setattr(storage, "SCHEDULE_FILE", tmp_path / "schedule.json")
+    monkeypatch.setattr(storage, "LEDGER_FILE", tmp_path / "ledger.jsonl")
+    monkeypatch.setattr(storage, "STATLINES_FILE", tmp_path / "statlines.jsonl")
+    monkeypatch.setattr(storage, "ROBLOX_DISCORD_CACHE_FILE", str(tmp_path / "links.json"))
+
+    store = storage.JSONStorage()
+    store.save_schedule({
+        "current_week": 1,
+        "weeks": {
+            "1": [["Chicago Bears", "Detroit Lions"], ["Dallas Cowboys", "Miami Dolphins"]],
+            "2": [["Chicago Bears", "Dallas Cowboys"], ["Detroit Lions", "Miami Dolphins"]],
+        },
+        "played": [],
+    })
+
+    monkeypatch.setattr(standings, "STORAGE", store)
+    monkeypatch.setattr(standings, "STANDINGS_REPO", standings.StandingsRepository(store))
+    monkeypatch.setattr(standings, "GITHUB_TOKEN", None)
+    monkeypatch.setattr(schedule_index, "STORAGE", store)
+    monkeypatch.setattr(schedule_index, "_INDEX", None)
+    monkeypatch.setattr(schedule_index, "_INDEX_VERSION", None)
+
+    return store
+
+
+@pytest.fixture
+def stats(league, monkeypatch):
+    """
+    services.stats_sheet rebuilt over the league storage; sheet writes are
+    captured in the returned list instead of sent.
+    """
+    from services import stats_sheet
+
+    sent = []
+    monkeypatch.setattr(stats_sheet, "STORAGE", league)
+    monkeypatch.setattr(stats_sheet, "_send", sent.append)
+    monkeypatch.setattr(stats_sheet, "_ROW_MAP", {pos: {} for pos in stats_sheet.POSITIONS})
+    monkeypatch.setattr(stats_sheet, "_LAST_TOP", {})
+    stats_sheet.recompute_totals()
+    return sent
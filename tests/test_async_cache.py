@@ -0,0 +1,161 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from utils import async_cache
+from utils.async_cache import AsyncTTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces the cache's wall clock; bump clock.now to move time on."""
+    clock = SimpleNamespace(now=1_000_000.0)
+    monkeypatch.setattr(async_cache, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+def loader(value, calls):
+    async def load():
+        calls.append(value)
+        await asyncio.sleep(0)
+        return value
+    return load
+
+
+# =========================
+# LRU
+# =========================
+def test_the_least_recently_used_entry_is_evicted(clock):
+    cache = AsyncTTLCache("t", maxsize=2)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.peek(1)       # 1 is now the most recently used
+
+    cache.set(3, "c")
+
+    assert cache.peek(2) is None
+    assert (cache.peek(1), cache.peek(3)) == ("a", "c")
+    assert cache.metrics["evictions"] == 1
+
+
+# =========================
+# TTL
+# =========================
+def test_none_is_cached_for_the_shorter_negative_ttl(clock):
+    cache = AsyncTTLCache("t", ttl=100, negative_ttl=10)
+    calls = []
+
+    async def scenario():
+        assert await cache.get_or_load(1, loader(None, calls)) is None
+        assert await cache.get_or_load(2, loader("x", calls)) == "x"
+
+        clock.now += 5
+        await cache.get_or_load(1, loader(None, calls))
+        assert len(calls) == 2 and cache.metrics["negative_hits"] == 1
+
+        clock.now += 10     # past the negative ttl, inside the positive one
+        await cache.get_or_load(1, loader(None, calls))
+        await cache.get_or_load(2, loader("x", calls))
+        assert calls == [None, "x", None]
+
+    asyncio.run(scenario())
+    assert cache.metrics["expirations"] == 1
+
+
+def test_a_loader_that_raises_caches_nothing(clock):
+    cache = AsyncTTLCache("t")
+
+    async def boom():
+        raise RuntimeError("bloxlink down")
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load(1, boom)
+        return await cache.get_or_load(1, loader("x", []))
+
+    assert asyncio.run(scenario()) == "x"
+    assert cache.metrics["load_errors"] == 1
+
+
+# =========================
+# SINGLE-FLIGHT
+# =========================
+def test_concurrent_misses_share_one_load(clock):
+    cache = AsyncTTLCache("t")
+    calls = []
+    release = None
+
+    async def slow():
+        calls.append(1)
+        await release.wait()
+        return "x"
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        waiters = [asyncio.create_task(cache.get_or_load(1, slow)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*waiters)
+
+    assert asyncio.run(scenario()) == ["x"] * 5
+    assert calls == [1]
+    assert (cache.metrics["misses"], cache.metrics["coalesced"]) == (1, 4)
+
+
+def test_waiters_on_a_failed_load_all_get_the_error(clock):
+    cache = AsyncTTLCache("t")
+
+    async def boom():
+        await asyncio.sleep(0)
+        raise RuntimeError("bloxlink down")
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_load(1, boom) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.metrics["loads"] == 0 and len(cache) == 0
+
+
+# =========================
+# PERSISTENCE
+# =========================
+def test_entries_round_trip_through_the_file(clock, tmp_path):
+    path = tmp_path / "cache.json"
+    cache = AsyncTTLCache("t", ttl=100, negative_ttl=10, path=path)
+    cache.set(1, 11)
+    cache.set(2, None)
+    cache.set(3, 33, ttl=1)
+    clock.now += 5      # 3 has expired and isn't written
+
+    asyncio.run(cache.persist())
+
+    fresh = AsyncTTLCache("t", ttl=100, negative_ttl=10, path=path)
+    assert fresh.load() == 2
+    assert (fresh.peek(1), fresh.peek(2, "absent"), fresh.peek(3, "absent")) == (11, None, "absent")
+
+    # expiry times are kept, not restarted by the reload
+    clock.now += 10
+    assert fresh.peek(2, "absent") == "absent"
+    assert fresh.peek(1) == 11
+
+
+def test_persist_skips_the_write_when_nothing_changed(clock, tmp_path):
+    path = tmp_path / "cache.json"
+    cache = AsyncTTLCache("t", path=path)
+    cache.set(1, 11)
+    cache.save()
+    path.unlink()
+
+    asyncio.run(cache.persist())
+
+    assert not path.exists()
+
+
+def test_an_unreadable_file_loads_nothing(clock, tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert AsyncTTLCache("t", path=path).load() == 0
@@ -0,0 +1,231 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from email.utils import formatdate
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from services import bloxlink
+from services.bloxlink import LINKED, NOT_LINKED, UNKNOWN, BloxlinkClient, _retry_after
+
+
+class FakeBloxlink:
+    """
+    A local Bloxlink: roblox id n is linked to discord id n + 1, except
+    multiples of 7, which 404. `mode` and the counters script failures.
+    """
+
+    def __init__(self):
+        self.mode = "ok"
+        self.limit_per_second = 10
+        self.window_start = time.monotonic()
+        self.window_count = 0
+        self.flaky_left = 0
+        self.retry_after_left = 0
+        self.requests = 0
+        self.rejected = 0
+
+    def _rate_limited(self):
+        now = time.monotonic()
+        if now - self.window_start >= 1:
+            self.window_start = now
+            self.window_count = 0
+        self.window_count += 1
+        return self.window_count > self.limit_per_second
+
+    def _too_many(self, seconds):
+        self.rejected += 1
+        return web.json_response(
+            {"error": "You are being rate limited"},
+            status=429,
+            headers={"Retry-After": f"{seconds:.2f}", "X-RateLimit-Remaining": "0"},
+        )
+
+    async def roblox_to_discord(self, request):
+        self.requests += 1
+        await asyncio.sleep(0.005)
+
+        if self.mode == "outage":
+            return web.Response(status=500, text="upstream error")
+        if self.mode == "auth":
+            return web.json_response({"error": "Invalid API key"}, status=401)
+        if self.flaky_left:
+            self.flaky_left -= 1
+            return web.Response(status=503, text="try again")
+        if self.retry_after_left:
+            self.retry_after_left -= 1
+            return self._too_many(0.2)
+        if self._rate_limited():
+            return self._too_many(max(0.05, 1 - (time.monotonic() - self.window_start)))
+
+        roblox_id = int(request.match_info["roblox_id"])
+        if roblox_id % 7 == 0:
+            return web.json_response({"error": "User not found"}, status=404)
+        return web.json_response({"discordIDs": [str(roblox_id + 1)]})
+
+
+@asynccontextmanager
+async def serve(fake):
+    """Yields a BloxlinkClient factory pointed at `fake` on a free local port."""
+    app = web.Application()
+    app.router.add_get("/v4/public/guilds/{guild}/roblox-to-discord/{roblox_id}", fake.roblox_to_discord)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    session = aiohttp.ClientSession()
+
+    async def session_factory():
+        return session
+
+    def client(**kwargs):
+        kwargs.setdefault("rate", 50)
+        kwargs.setdefault("burst", 50)
+        return BloxlinkClient("test-key", session_factory, base_url=f"http://127.0.0.1:{port}/v4/public", **kwargs)
+
+    try:
+        yield client
+    finally:
+        await session.close()
+        await runner.cleanup()
+
+
+@pytest.fixture(autouse=True)
+def short_backoff(monkeypatch):
+    # jittered retries stay under 40 ms so the suite doesn't wait seconds
+    monkeypatch.setattr(bloxlink, "RETRY_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(bloxlink, "RETRY_CAP_SECONDS", 0.04)
+
+
+def run(scenario):
+    fake = FakeBloxlink()
+
+    async def main():
+        async with serve(fake) as client:
+            return await scenario(fake, client)
+
+    return asyncio.run(main())
+
+
+# =========================
+# ANSWERS
+# =========================
+def test_a_linked_player_comes_back_linked():
+    async def scenario(fake, client):
+        return await client().roblox_to_discord(1, 1002)
+
+    assert run(scenario) == (LINKED, 1003, "")
+
+
+def test_404_is_not_linked_rather_than_an_error():
+    async def scenario(fake, client):
+        c = client()
+        return await c.roblox_to_discord(1, 700), c
+
+    result, c = run(scenario)
+    assert (result.status, result.id) == (NOT_LINKED, None)
+    assert c.breaker.failures == 0
+
+
+def test_401_is_unknown_without_retries():
+    async def scenario(fake, client):
+        fake.mode = "auth"
+        c = client()
+        return await c.roblox_to_discord(1, 1002), c, fake.requests
+
+    result, c, requests = run(scenario)
+    assert result.status == UNKNOWN
+    assert requests == 1 and c.metrics["retries"] == 0
+
+
+def test_5xx_is_retried_until_an_answer():
+    async def scenario(fake, client):
+        fake.flaky_left = 2
+        c = client()
+        return await c.roblox_to_discord(1, 1002), c
+
+    result, c = run(scenario)
+    assert result.status == LINKED
+    assert c.metrics["retries"] == 2
+
+
+# =========================
+# RATE LIMITS
+# =========================
+def test_retry_after_holds_the_client_back_and_then_succeeds():
+    async def scenario(fake, client):
+        fake.retry_after_left = 1
+        c = client()
+        started = time.monotonic()
+        result = await c.roblox_to_discord(1, 1002)
+        return result, c, time.monotonic() - started
+
+    result, c, elapsed = run(scenario)
+    assert result.status == LINKED
+    assert c.metrics["rate_limited"] == 1
+    assert elapsed >= 0.19
+    assert c.metrics["throttled_seconds"] >= 0.19
+
+
+def test_a_burst_past_the_server_limit_still_links_everyone():
+    ids = [1000 + i for i in range(24) if (1000 + i) % 7]
+
+    async def scenario(fake, client):
+        c = client()
+        return await asyncio.gather(*(c.roblox_to_discord(1, rid) for rid in ids)), fake.rejected
+
+    results, rejected = run(scenario)
+    assert [(r.status, r.id) for r in results] == [(LINKED, rid + 1) for rid in ids]
+    assert rejected > 0
+
+
+def test_retry_after_parsing():
+    def resp(**headers):
+        return SimpleNamespace(headers=headers)
+
+    assert _retry_after(resp(**{"Retry-After": "1.5"})) == 1.5
+    assert 55 <= _retry_after(resp(**{"Retry-After": formatdate(time.time() + 60, usegmt=True)})) <= 60
+    assert _retry_after(resp(**{"X-RateLimit-Reset-After": "2"})) == 2.0
+    assert 8 <= _retry_after(resp(**{"X-RateLimit-Reset": str(time.time() + 10)})) <= 10
+    assert _retry_after(resp()) is None
+
+
+# =========================
+# CIRCUIT BREAKER
+# =========================
+def test_an_outage_opens_the_breaker_and_stops_calling_the_server():
+    async def scenario(fake, client):
+        fake.mode = "outage"
+        c = client(max_retries=1)
+        results = [await c.roblox_to_discord(1, 1000 + i) for i in range(10)]
+        return results, c, fake.requests
+
+    results, c, requests = run(scenario)
+    assert all(r.status == UNKNOWN for r in results)
+    assert c.breaker.state == "open"
+    # threshold lookups, each tried twice; the rest never left the client
+    assert requests == bloxlink.BREAKER_THRESHOLD * 2
+    assert c.metrics["short_circuited"] == 10 - bloxlink.BREAKER_THRESHOLD
+
+
+def test_a_half_open_breaker_lets_one_probe_through_and_closes_on_success():
+    async def scenario(fake, client):
+        fake.mode = "outage"
+        c = client(max_retries=0)
+        for i in range(bloxlink.BREAKER_THRESHOLD):
+            await c.roblox_to_discord(1, 1000 + i)
+        assert c.breaker.state == "open"
+
+        # cooldown over: the next call is the probe
+        c.breaker.opened_at -= c.breaker.cooldown
+        fake.mode = "ok"
+        result = await c.roblox_to_discord(1, 1002)
+        return result, c
+
+    result, c = run(scenario)
+    assert result.status == LINKED
+    assert c.breaker.state == "closed"
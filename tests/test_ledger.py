@@ -0,0 +1,139 @@
+from utils import schedule_index, standings
+from utils.ledger import RESULT, SEASON, VOID, GameLedger, replay_season
+
+
+def team(name):
+    return standings.standings_view()["teams"][name]
+
+
+def record(data):
+    return (data["wins"], data["losses"], data["pf"], data["pa"])
+
+
+# =========================
+# SNAPSHOT + TAIL REPLAY
+# =========================
+def test_results_after_the_snapshot_are_replayed_on_top_of_it(league):
+    standings.reset_standings()
+    standings.update_game_result("Chicago Bears", "Detroit Lions", 21, 14)
+
+    # fold everything so far into standings.json, then add a tail
+    standings.save_standings(standings.load_standings())
+    assert standings.STANDINGS_REPO.snapshot_seq() == league.last_game_seq()
+
+    standings.update_game_result("Dallas Cowboys", "Miami Dolphins", 7, 10)
+
+    assert league.last_game_seq() > standings.STANDINGS_REPO.snapshot_seq()
+    assert record(team("Chicago Bears")) == (1, 0, 21, 14)
+    assert record(team("Miami Dolphins")) == (1, 0, 10, 7)
+
+
+def test_a_fresh_repository_rebuilds_the_same_table(league):
+    standings.reset_standings()
+    standings.update_game_result("Chicago Bears", "Detroit Lions", 21, 14)
+    standings.update_game_result("Dallas Cowboys", "Miami Dolphins", 7, 10)
+    before = standings.load_standings()["teams"]
+
+    cold = standings.StandingsRepository(league).load()
+
+    assert cold["teams"] == before
+    assert cold["ledger_seq"] == league.last_game_seq()
+
+
+def test_replay_season_stops_at_the_requested_week(league):
+    standings.reset_standings()
+    standings.update_game_result("Chicago Bears", "Detroit Lions", 21, 14, week=1)
+    standings.update_game_result("Chicago Bears", "Dallas Cowboys", 3, 30, week=2)
+
+    week1 = standings.standings_at_week(1)["teams"]
+    assert record(week1["Chicago Bears"]) == (1, 0, 21, 14)
+    assert "Dallas Cowboys" not in week1 or record(week1["Dallas Cowboys"]) == (0, 0, 0, 0)
+
+    assert record(team("Chicago Bears")) == (1, 1, 24, 44)
+
+
+# =========================
+# VOIDS
+# =========================
+def test_void_removes_the_result_and_rebuilds_streaks(league):
+    standings.reset_standings()
+    first = standings.update_game_result("Chicago Bears", "Detroit Lions", 21, 14)
+    standings.update_game_result("Chicago Bears", "Dallas Cowboys", 28, 0, week=2)
+
+    standings.void_game_result(first["seq"], reason="wrong score")
+
+    assert record(team("Chicago Bears")) == (1, 0, 28, 0)
+    assert team("Chicago Bears")["streak"] == 1
+    assert record(team("Detroit Lions")) == (0, 0, 0, 0)
+
+
+def test_void_reopens_the_matchup_for_a_corrected_report(league):
+    standings.reset_standings()
+    game = standings.update_game_result("Chicago Bears", "Detroit Lions", 21, 14)
+    schedule_index.mark_played("Chicago Bears", "Detroit Lions")
+    assert schedule_index.schedule_index().already_played("Detroit Lions", "Chicago Bears")
+
+    standings.void_game_result(game["seq"])
+
+    assert not schedule_index.schedule_index().already_played("Chicago Bears", "Detroit Lions")
+    assert ["Chicago Bears", "Detroit Lions"] not in league.load_schedule()["played"]
+
+
+def test_void_twice_or_unknown_game_is_refused(league):
+    standings.reset_standings()
+    game = standings.update_game_result("Chicago Bears", "Detroit Lions", 21, 14)
+    standings.void_game_result(game["seq"])
+
+    for seq in (game["seq"], 999):
+        try:
+            standings.void_game_result(seq)
+        except ValueError:
+            continue
+        raise AssertionError(f"void of #{seq} was accepted")
+
+
+def test_replay_season_skips_voided_results():
+    entries = [
+        {"seq": 1, "type": SEASON, "season": 1, "base": {}},
+        {"seq": 2, "type": RESULT, "season": 1, "week": 1, "t1": "A", "t2": "B", "s1": 3, "s2": 0},
+        {"seq": 3, "type": RESULT, "season": 1, "week": 1, "t1": "B", "t2": "A", "s1": 7, "s2": 0},
+        {"seq": 4, "type": VOID, "season": 1, "ref": 2},
+    ]
+    teams = replay_season(entries, 1, standings._blank_team_stats)
+
+    assert record(teams["A"]) == (0, 1, 0, 7)
+    assert record(teams["B"]) == (1, 0, 7, 0)
+
+
+# =========================
+# SEQ CONTINUITY
+# =========================
+def test_games_number_after_the_snapshot_when_the_ledger_is_lost(league):
+    standings.reset_standings()
+    for _ in range(3):
+        standings.update_game_result("Chicago Bears", "Detroit Lions", 21, 14)
+    standings.save_standings(standings.load_standings())
+    snapshot_seq = standings.STANDINGS_REPO.snapshot_seq()
+
+    # a redeploy restores standings.json from the mirror but not the ledger
+    league.ledger.path.unlink()
+    standings.STANDINGS_REPO.invalidate()
+    assert league.last_game_seq() == 0
+
+    game = standings.update_game_result("Dallas Cowboys", "Miami Dolphins", 7, 10)
+
+    assert game["seq"] > snapshot_seq
+    assert record(team("Chicago Bears")) == (3, 0, 63, 42)
+    assert record(team("Miami Dolphins")) == (1, 0, 10, 7)
+
+
+def test_entries_after_handles_a_numbering_gap(tmp_path):
+    ledger = GameLedger(tmp_path / "ledger.jsonl")
+    ledger.append_many([{"type": RESULT}, {"type": RESULT}])
+    ledger.append_many([{"type": RESULT} for _ in range(20)], after=20)
+
+    seqs = [e["seq"] for e in ledger.entries()]
+    assert seqs == [1, 2] + list(range(21, 41))
+    assert [e["seq"] for e in ledger.entries_after(20)] == list(range(21, 41))
+    assert [e["seq"] for e in ledger.entries_after(1)] == [2] + list(range(21, 41))
+    assert ledger.get(21)["seq"] == 21 and ledger.get(5) is None
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+from utils.member_index import MemberNameIndex
+
+
+def member(member_id, name, display_name=None):
+    return SimpleNamespace(id=member_id, name=name, display_name=display_name or name, global_name=None)
+
+
+class Guild:
+    def __init__(self, *members):
+        self.id = 1
+        self.chunked = True
+        self.members = list(members)
+
+    def get_member(self, member_id):
+        return next((m for m in self.members if m.id == member_id), None)
+
+
+def test_a_unique_name_finds_its_member():
+    guild = Guild(member(10, "alice"), member(20, "bob"))
+    index = MemberNameIndex()
+    index.build(guild)
+
+    assert index.find_member(guild, "Alice").id == 10
+
+
+def test_a_name_two_members_share_is_ambiguous():
+    guild = Guild(member(10, "alice"), member(20, "alice_alt", "Alice"))
+    index = MemberNameIndex()
+    index.build(guild)
+
+    assert index.find(" alice ") == [10, 20]
+    assert index.find_member(guild, "alice") is None
+    assert index.stats["ambiguous"] == 1
+
+
+def test_two_names_for_different_members_are_ambiguous():
+    guild = Guild(member(10, "alice"), member(20, "bob"))
+    index = MemberNameIndex()
+    index.build(guild)
+
+    assert index.find_member(guild, "alice", "bob") is None
+    assert index.find_member(guild, "alice", "Alice").id == 10
+
+
+def test_the_unindexed_scan_is_ambiguous_too():
+    guild = Guild(member(10, "alice"), member(20, "Alice"))
+    index = MemberNameIndex()
+
+    assert index.find_member(guild, "alice") is None
+    assert index.stats["scan_fallbacks"] == 1
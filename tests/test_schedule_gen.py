@@ -0,0 +1,140 @@
+import random
+import statistics
+from collections import Counter
+
+import pytest
+
+from utils.schedule_gen import _pick_rounds, circle_rounds, generate_schedule, schedule_quality
+
+TEAM_COUNTS = (4, 7, 10, 32)
+
+
+def league_teams(n):
+    return [f"Team {i:02d}" for i in range(n)]
+
+
+def cycle_length(n):
+    return n - 1 if n % 2 == 0 else n
+
+
+def week_counts(n):
+    cycle = cycle_length(n)
+    return (max(1, cycle - 2), cycle, 2 * cycle + 3)
+
+
+def strengths_for(teams, seed=7):
+    rng = random.Random(seed)
+    return {t: rng.random() for t in teams}
+
+
+def cases():
+    for n in TEAM_COUNTS:
+        for weeks in week_counts(n):
+            for with_strengths in (False, True):
+                yield pytest.param(n, weeks, with_strengths, id=f"{n}teams-{weeks}wk-{'sos' if with_strengths else 'plain'}")
+
+
+CASES = list(cases())
+
+
+def build(n, weeks, with_strengths, seed=3):
+    teams = league_teams(n)
+    strengths = strengths_for(teams) if with_strengths else None
+    return teams, generate_schedule(teams, weeks=weeks, seed=seed, strengths=strengths)
+
+
+# =========================
+# GUARANTEES
+# =========================
+@pytest.mark.parametrize("n, weeks, with_strengths", CASES)
+def test_no_team_plays_twice_in_a_week(n, weeks, with_strengths):
+    _, schedule = build(n, weeks, with_strengths)
+
+    assert sorted(schedule, key=int) == [str(w) for w in range(1, weeks + 1)]
+    for games in schedule.values():
+        playing = Counter(t for g in games for t in g)
+        assert max(playing.values()) == 1
+
+
+@pytest.mark.parametrize("n, weeks, with_strengths", CASES)
+def test_each_pair_meets_at_most_once_per_cycle(n, weeks, with_strengths):
+    _, schedule = build(n, weeks, with_strengths)
+    cycle = cycle_length(n)
+
+    for start in range(1, weeks + 1, cycle):
+        block = range(start, min(start + cycle, weeks + 1))
+        pairs = Counter(frozenset(g) for w in block for g in schedule[str(w)])
+        assert max(pairs.values()) == 1
+
+    # a rematch comes exactly one cycle after the previous meeting
+    if weeks > cycle:
+        assert schedule_quality(schedule)["min_rematch_gap"] == cycle
+
+
+@pytest.mark.parametrize("n, weeks, with_strengths", CASES)
+def test_everyone_plays_every_week_or_sits_out_one_bye(n, weeks, with_strengths):
+    teams, schedule = build(n, weeks, with_strengths)
+
+    byes = Counter()
+    for games in schedule.values():
+        idle = set(teams) - {t for g in games for t in g}
+        assert len(games) == n // 2
+        assert len(idle) == n % 2
+        byes.update(idle)
+
+    if n % 2:
+        # a full cycle gives every team exactly one bye
+        full_cycles = weeks // cycle_length(n)
+        assert all(byes[t] >= full_cycles for t in teams)
+        assert max(byes.values()) <= full_cycles + 1
+    else:
+        assert not byes
+
+
+@pytest.mark.parametrize("n, weeks, with_strengths", CASES)
+def test_home_and_away_stay_within_one(n, weeks, with_strengths):
+    teams, schedule = build(n, weeks, with_strengths)
+
+    home = Counter(g[0] for games in schedule.values() for g in games)
+    away = Counter(g[1] for games in schedule.values() for g in games)
+    assert all(abs(home[t] - away[t]) <= 1 for t in teams)
+    assert schedule_quality(schedule)["max_home_away_imbalance"] <= 1
+
+
+def test_the_same_seed_gives_the_same_schedule():
+    teams = league_teams(10)
+    strengths = strengths_for(teams)
+
+    assert generate_schedule(teams, 12, seed=5, strengths=strengths) == generate_schedule(teams, 12, seed=5, strengths=strengths)
+
+
+def test_no_teams_gives_empty_weeks():
+    assert generate_schedule([], weeks=3) == {"1": [], "2": [], "3": []}
+
+
+# =========================
+# SOS REPAIR
+# =========================
+def _sos_spread(rounds, chosen, strengths):
+    opponents = {}
+    for i in chosen:
+        for a, b in rounds[i]:
+            opponents.setdefault(a, []).append(strengths[b])
+            opponents.setdefault(b, []).append(strengths[a])
+    return statistics.pvariance([statistics.mean(v) for v in opponents.values()])
+
+
+@pytest.mark.parametrize("n", TEAM_COUNTS)
+def test_sos_repair_keeps_whole_rounds_and_never_widens_the_spread(n):
+    teams = league_teams(n)
+    strengths = strengths_for(teams)
+    rounds = circle_rounds(teams)
+    k = max(1, len(rounds) // 2)
+
+    # no strengths: the random pick the repair starts from, with the same rng state
+    start = _pick_rounds(rounds, k, 0, None, random.Random(11))
+    repaired = _pick_rounds(rounds, k, 0, strengths, random.Random(11))
+
+    assert len(set(repaired)) == k
+    assert all(0 <= i < len(rounds) for i in repaired)
+    assert _sos_spread(rounds, repaired, strengths) <= _sos_spread(rounds, start, strengths) + 1e-12
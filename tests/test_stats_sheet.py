@@ -0,0 +1,169 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from services import stats_sheet
+from services.stats_sheet import qb_statline
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def link(discord_id, name, roblox_id, roblox_username):
+    return {
+        "discord_id": discord_id,
+        "discord_name": name.lower(),
+        "discord_display_name": name,
+        "roblox_id": roblox_id,
+        "roblox_username": roblox_username,
+        "roblox_display_name": roblox_username,
+        "updated_at": 0,
+    }
+
+
+# =========================
+# LINKED NAMES
+# =========================
+def test_an_unlinked_player_keeps_the_export_name_and_team(stats):
+    stats_sheet.record_statlines([qb_statline("rbx_alice", "Detroit Lions", 90, 10, 100, 1, 0, 111)], game=1)
+
+    row = stats_sheet.QB_DATA["111"]
+    assert (row["player"], row["team"], row["yds"]) == ("rbx_alice", "Lions", 100)
+
+
+def test_credit_player_renames_without_recording_again(stats):
+    stats_sheet.record_statlines([qb_statline("rbx_alice", "Detroit Lions", 90, 10, 100, 1, 0, 111)], game=1)
+    stats_sheet.commit_all_stats()
+
+    stats_sheet.credit_player(111, "Alice")
+
+    row = stats_sheet.QB_DATA["111"]
+    assert (row["player"], row["team"], row["yds"], row["games"]) == ("Alice", "Lions", 100, 1)
+    assert stats_sheet._DIRTY["QB"] == {"111"}
+
+
+def test_linked_names_survive_a_rebuild(stats, league):
+    stats_sheet.record_statlines([qb_statline("rbx_alice", "Detroit Lions", 90, 10, 100, 1, 0, 111)], game=1)
+    league.save_link_batch([link(5, "Alice", 111, "rbx_alice")])
+
+    stats_sheet.recompute_totals()
+
+    assert stats_sheet.QB_DATA["111"]["player"] == "Alice"
+
+
+def test_a_confirmed_link_reaches_the_sheet_as_one_row(stats):
+    stats_sheet.record_statlines([qb_statline("rbx_alice", "Detroit Lions", 90, 10, 100, 1, 0, 111)], game=1)
+    stats_sheet.commit_all_stats()
+    stats.clear()
+
+    stats_sheet.credit_player(111, "Alice")
+    stats_sheet.commit_all_stats()
+
+    rows = [r for r in stats[0]["data"] if r["range"].startswith("'QB'!")]
+    assert rows == [{"range": "'QB'!D8:J8", "values": [["Alice", "Lions", 90.0, 10, 100, 1, 0]]}]
+
+
+# =========================
+# LAZY LOAD
+# =========================
+def test_importing_the_module_does_not_read_the_statlines_log():
+    code = "import services.stats_sheet as s; print(s._LOADED, len(s.ENGINE.tables['QB']))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout.split()
+
+    assert out == ["False", "0"]
+
+
+def test_the_first_query_loads_the_totals(stats, league, monkeypatch):
+    league.append_statlines([{"game": 1, "season": None, "week": 1, **qb_statline("rbx_bob", "Chicago Bears", 80, 8, 60, 0, 1, 222)}])
+    monkeypatch.setattr(stats_sheet, "_LOADED", False)
+
+    top = stats_sheet.top_players("QB", "yds")
+
+    assert [key for key, _ in top] == ["222"]
+    assert stats_sheet._LOADED
+
+
+# =========================
+# DELTA SYNC
+# =========================
+def qb(name, rid, yds):
+    return qb_statline(name, "Detroit Lions", 90, 10, yds, 1, 0, rid)
+
+
+def ranges(payload, sheet):
+    return [r["range"] for r in payload["data"] if r["range"].startswith(f"'{sheet}'!")]
+
+
+def test_the_first_commit_rewrites_everything_and_maps_rows(stats):
+    stats_sheet.record_statlines([qb("a", 1, 10), qb("b", 2, 20)], game=1)
+
+    stats_sheet.commit_all_stats()
+
+    assert stats_sheet.SHEETS_SYNC_STATS["full_syncs"] >= 1
+    assert ranges(stats[0], "QB") == ["'QB'!D8:J100"]
+    assert sorted(stats_sheet._ROW_MAP["QB"]) == ["1", "2"]
+    assert sorted(stats_sheet._ROW_MAP["QB"].values()) == [8, 9]
+
+
+def test_a_delta_commit_sends_only_dirty_rows(stats):
+    stats_sheet.record_statlines([qb("a", 1, 10), qb("b", 2, 20)], game=1)
+    stats_sheet.commit_all_stats()
+    b_row = stats_sheet._ROW_MAP["QB"]["2"]
+    stats.clear()
+
+    stats_sheet.record_statlines([qb("b", 2, 5), qb("c", 3, 1)], game=2)
+    stats_sheet.commit_all_stats()
+
+    # b keeps its row, c is appended after the mapped ones; a isn't sent
+    assert stats_sheet._ROW_MAP["QB"]["3"] == 10
+    assert sorted(ranges(stats[0], "QB")) == sorted([f"'QB'!D{b_row}:J{b_row}", "'QB'!D10:J10"])
+    assert ranges(stats[0], "WR") == []
+    assert stats_sheet._DIRTY["QB"] == set()
+
+
+def test_nothing_dirty_skips_the_send(stats):
+    stats_sheet.record_statlines([qb("a", 1, 10)], game=1)
+    stats_sheet.commit_all_stats()
+    stats.clear()
+    skipped = stats_sheet.SHEETS_SYNC_STATS["skipped_syncs"]
+
+    stats_sheet.commit_all_stats()
+
+    assert stats == []
+    assert stats_sheet.SHEETS_SYNC_STATS["skipped_syncs"] == skipped + 1
+
+
+def test_a_failed_send_puts_the_dirty_rows_back(stats, monkeypatch):
+    stats_sheet.record_statlines([qb("a", 1, 10)], game=1)
+    stats_sheet.commit_all_stats()
+    stats.clear()
+
+    def fail(payload):
+        raise RuntimeError("sheet down")
+
+    stats_sheet.record_statlines([qb("a", 1, 7)], game=2)
+    monkeypatch.setattr(stats_sheet, "_send", fail)
+    with pytest.raises(RuntimeError):
+        stats_sheet.commit_all_stats()
+
+    assert stats_sheet._DIRTY["QB"] == {"1"}
+
+    monkeypatch.setattr(stats_sheet, "_send", stats.append)
+    stats_sheet.commit_all_stats()
+    assert ranges(stats[0], "QB") == ["'QB'!D8:J8"]
+    assert stats[0]["data"][0]["values"][0][4] == 17
+
+
+def test_a_reconcile_rebuilds_the_row_map(stats):
+    stats_sheet.record_statlines([qb("a", 1, 10), qb("b", 2, 20)], game=1)
+    stats_sheet.commit_all_stats()
+    stats_sheet._ROW_MAP["QB"] = {"1": 40, "gone": 41}
+
+    stats_sheet.reconcile_stats()
+
+    assert stats_sheet._ROW_MAP["QB"] == {key: 8 + i for i, key in enumerate(stats_sheet.QB_DATA)}
+    assert sorted(stats_sheet._ROW_MAP["QB"]) == ["1", "2"]
+    assert ranges(stats[-1], "QB") == ["'QB'!D8:J100"]
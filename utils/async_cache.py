@@ -0,0 +1,199 @@
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Union
+
+
+class AsyncTTLCache:
+    """
+    Async get-or-load cache with:
+      * a TTL per entry, and a separate (usually shorter) TTL for None,
+        so "not found" answers are cached too
+      * an LRU bound on the number of entries
+      * single-flight: concurrent misses for one key share one load
+      * optional persistence to a JSON file (keys and values must be JSON
+        scalars; keys come back as the type `key_type` gives them)
+
+    A loader that raises caches nothing; every caller waiting on that load
+    gets the exception.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 4096,
+        ttl: float = 900,
+        negative_ttl: float = 300,
+        path: Optional[Union[str, Path]] = None,
+        key_type: Callable[[str], Hashable] = int,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.path = Path(path) if path else None
+        self.key_type = key_type
+
+        # key -> (value, expiry); wall-clock time so entries survive restarts
+        self._entries: "OrderedDict[Hashable, tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._dirty = False
+
+        self.metrics = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "loads": 0,
+            "load_errors": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ---------- lookups ----------
+    def _fresh(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry[1] <= time.time():
+            del self._entries[key]
+            self.metrics["expirations"] += 1
+            self._dirty = True
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def peek(self, key, default=None):
+        """The cached value without loading (or `default` when absent/expired)."""
+        entry = self._fresh(key)
+        return default if entry is None else entry[0]
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        if ttl is None:
+            ttl = self.ttl if value is not None else self.negative_ttl
+
+        self._entries[key] = (value, time.time() + ttl)
+        self._entries.move_to_end(key)
+        self._dirty = True
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.metrics["evictions"] += 1
+
+    def invalidate(self, key):
+        if self._entries.pop(key, None) is not None:
+            self._dirty = True
+
+    def clear(self):
+        self._entries.clear()
+        self._dirty = True
+
+    async def get_or_load(self, key, loader: Callable[[], Awaitable[Any]]):
+        entry = self._fresh(key)
+        if entry is not None:
+            self.metrics["hits" if entry[0] is not None else "negative_hits"] += 1
+            return entry[0]
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.metrics["coalesced"] += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # the caller that owned the load was cancelled, not us
+                if not pending.cancelled():
+                    raise
+                return await self.get_or_load(key, loader)
+
+        self.metrics["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self.metrics["load_errors"] += 1
+            future.set_exception(e)
+            # nobody else may be waiting; don't log "exception never retrieved"
+            future.exception()
+            raise
+        else:
+            self.metrics["loads"] += 1
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    # ---------- metrics ----------
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.metrics["hits"] + self.metrics["negative_hits"] + self.metrics["misses"] + self.metrics["coalesced"]
+        served = lookups - self.metrics["misses"]
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": round(served / lookups, 3) if lookups else None,
+            **self.metrics,
+        }
+
+    # ---------- persistence ----------
+    def load(self) -> int:
+        """Reads unexpired entries from `path`; returns how many were loaded."""
+        if self.path is None or not self.path.exists():
+            return 0
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                rows = json.load(f).get("entries", [])
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable {self.name} cache file: {type(e).__name__}: {e}")
+            return 0
+
+        now = time.time()
+        loaded = 0
+        for key, value, expires in rows[-self.maxsize:]:
+            if expires > now:
+                self._entries[self.key_type(key)] = (value, expires)
+                loaded += 1
+
+        self._dirty = False
+        return loaded
+
+    def _snapshot(self):
+        now = time.time()
+        rows = [[key, value, expires] for key, (value, expires) in self._entries.items() if expires > now]
+        self._dirty = False
+        return rows
+
+    def _write(self, rows):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"entries": rows}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def save(self, force: bool = False):
+        """Writes unexpired entries to `path` (only when something changed)."""
+        if self.path is None or not (self._dirty or force):
+            return
+        self._write(self._snapshot())
+
+    async def persist(self):
+        """save() with the file write off the event loop."""
+        if self.path is None or not self._dirty:
+            return
+        await asyncio.to_thread(self._write, self._snapshot())
@@ -0,0 +1,92 @@
+import hashlib
+import json
+import time
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+from utils.storage import DATA_DIR, CachedJSONFile
+
+# guild id -> {"hash", "commands", "sync_ms", "synced_at"} of the last successful sync
+COMMAND_SYNC_FILE = CachedJSONFile(DATA_DIR / "command_sync.json")
+
+
+def command_payload(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake]) -> list[dict]:
+    """Exactly what tree.sync(guild=...) would upload: names, options, choices, permissions."""
+    payload = [cmd.to_dict(tree) for cmd in tree.get_commands(guild=guild)]
+    return sorted(payload, key=lambda c: (c.get("type", 1), c["name"]))
+
+
+def command_fingerprint(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake]) -> str:
+    body = {
+        "guild": guild.id if guild else None,
+        "commands": command_payload(tree, guild),
+    }
+    raw = json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _scope_key(guild: Optional[discord.abc.Snowflake]) -> str:
+    return str(guild.id) if guild else "global"
+
+
+def last_sync(guild: Optional[discord.abc.Snowflake]) -> dict:
+    data = COMMAND_SYNC_FILE.get() or {}
+    return data.get(_scope_key(guild)) or {}
+
+
+def _save_sync(guild: Optional[discord.abc.Snowflake], fingerprint: str, count: int, sync_ms: float):
+    data = dict(COMMAND_SYNC_FILE.get() or {})
+    data[_scope_key(guild)] = {
+        "hash": fingerprint,
+        "commands": count,
+        "sync_ms": round(sync_ms, 1),
+        "synced_at": int(time.time()),
+    }
+    COMMAND_SYNC_FILE.write(data)
+
+
+async def sync_if_changed(
+    tree: app_commands.CommandTree,
+    guild: Optional[discord.abc.Snowflake],
+    force: bool = False,
+) -> dict:
+    """
+    Syncs the tree for `guild` only when its fingerprint differs from the one
+    saved after the last successful sync (or when forced). on_ready fires on
+    every reconnect, so most calls end here without an HTTP request.
+
+    Returns {"synced", "commands", "fingerprint", "hash_ms", "sync_ms"};
+    on a skip, sync_ms is what the last real sync cost.
+    """
+    started = time.perf_counter()
+    fingerprint = command_fingerprint(tree, guild)
+    hash_ms = (time.perf_counter() - started) * 1000
+
+    result = {
+        "synced": False,
+        "commands": len(tree.get_commands(guild=guild)),
+        "fingerprint": fingerprint,
+        "hash_ms": hash_ms,
+        "sync_ms": 0.0,
+    }
+
+    previous = last_sync(guild)
+    if not force and previous.get("hash") == fingerprint:
+        result["sync_ms"] = float(previous.get("sync_ms") or 0.0)
+        return result
+
+    started = time.perf_counter()
+    synced = await tree.sync(guild=guild)
+    result["sync_ms"] = (time.perf_counter() - started) * 1000
+    result["synced"] = True
+    result["commands"] = len(synced)
+
+    try:
+        _save_sync(guild, fingerprint, len(synced), result["sync_ms"])
+    except OSError as e:
+        # next start just syncs again
+        print(f"⚠️ Could not save command fingerprint: {type(e).__name__}: {e}")
+
+    return result
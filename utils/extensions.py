@@ -0,0 +1,110 @@
+import asyncio
+import contextvars
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Optional
+
+# the report entry of the extension whose load_extension() is running in this task
+_LOADING: contextvars.ContextVar[dict] = contextvars.ContextVar("loading_extension")
+
+
+@dataclass(frozen=True)
+class Extension:
+    """One cog in the startup manifest; `after` lists extensions it needs loaded first."""
+    name: str
+    after: tuple[str, ...] = ()
+
+
+def _waves(manifest) -> list[list[Extension]]:
+    """Groups the manifest into batches whose `after` deps are all in earlier batches."""
+    names = {ext.name for ext in manifest}
+    done: set[str] = set()
+    pending = list(manifest)
+    waves = []
+
+    while pending:
+        wave = [e for e in pending if all(d in done or d not in names for d in e.after)]
+        if not wave:
+            # a cycle; load the rest together rather than not at all
+            wave = pending
+        waves.append(wave)
+        done.update(e.name for e in wave)
+        pending = [e for e in pending if e not in wave]
+
+    return waves
+
+
+def _mark_setup(add_cog):
+    """
+    Wraps bot.add_cog so the first call from an extension's setup() marks
+    where its module import ended; load_extension does both in one call.
+    """
+
+    async def timed(*args, **kwargs):
+        entry = _LOADING.get(None)
+        if entry is not None and entry["_setup_started"] is None:
+            entry["_setup_started"] = time.perf_counter()
+        return await add_cog(*args, **kwargs)
+
+    return timed
+
+
+async def _load_one(bot, ext: Extension) -> dict:
+    started = time.perf_counter()
+    entry = {"name": ext.name, "import_ms": 0.0, "setup_ms": 0.0, "ok": True, "error": None, "_setup_started": None}
+    _LOADING.set(entry)
+
+    try:
+        await bot.load_extension(ext.name)
+    except Exception as e:
+        entry["ok"] = False
+        entry["error"] = f"{type(e).__name__}: {e}"
+        print(f"❌ Failed to load {ext.name}: {e}")
+        traceback.print_exc()
+
+    finished = time.perf_counter()
+    setup_started = entry.pop("_setup_started") or finished
+    entry["import_ms"] = round((setup_started - started) * 1000, 1)
+    entry["setup_ms"] = round((finished - setup_started) * 1000, 1)
+    return entry
+
+
+async def load_extensions(bot, manifest) -> dict:
+    """
+    Loads every extension in `manifest`, one wave at a time; the cogs in a
+    wave are independent, so they are gathered (in manifest order) and any
+    real awaiting in one cog's setup() doesn't hold up the rest.
+
+    Returns a timing report: {"total_ms", "loaded", "failed", "extensions"},
+    where each extension's import_ms runs up to its first add_cog() call.
+    """
+    started = time.perf_counter()
+    entries = []
+
+    bot.add_cog = _mark_setup(bot.add_cog)
+    try:
+        for wave in _waves(manifest):
+            # each gathered task gets its own copy of _LOADING
+            entries += await asyncio.gather(*(_load_one(bot, e) for e in wave))
+    finally:
+        del bot.add_cog
+
+    return {
+        "total_ms": round((time.perf_counter() - started) * 1000, 1),
+        "loaded": sum(1 for e in entries if e["ok"]),
+        "failed": [e["name"] for e in entries if not e["ok"]],
+        "extensions": entries,
+    }
+
+
+def print_startup_report(report: dict, imports_ms: Optional[float] = None):
+    if imports_ms is not None:
+        print(f"📦 main.py imports: {imports_ms:.0f} ms")
+
+    for e in sorted(report["extensions"], key=lambda e: e["import_ms"] + e["setup_ms"], reverse=True):
+        mark = "✅" if e["ok"] else "❌"
+        print(f"   {mark} {e['name']:<22} import {e['import_ms']:>7.1f} ms   setup {e['setup_ms']:>6.1f} ms")
+
+    total = len(report["extensions"])
+    print(f"⏱️ Loaded {report['loaded']}/{total} cogs in {report['total_ms']:.0f} ms")
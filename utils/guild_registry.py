@@ -0,0 +1,153 @@
+import re
+import unicodedata
+from typing import Dict, Optional
+
+import discord
+
+from utils.config import TEAM_EMOJI_NAME
+
+
+def normalize_channel_name(name: str) -> str:
+    # Handles capitalization + unicode "fancy fonts"
+    name = unicodedata.normalize("NFKD", name or "")
+    name = name.encode("ascii", "ignore").decode("ascii")
+    name = re.sub(r"[^a-z0-9]", "", name.lower())
+    return name
+
+
+def normalize_team_name(name: str) -> str:
+    return (
+        name.replace(" ", "")
+            .replace(".", "")
+            .replace("-", "")
+            .lower()
+    )
+
+
+def _role_key(name: str) -> str:
+    return name.replace(" ", "").lower()
+
+
+class GuildRegistry:
+    """
+    Name -> Role / Emoji / TextChannel maps for one guild, each built on
+    first use after an invalidation. cogs/indexes.py invalidates the
+    matching section on role, emoji and channel events, so lookups are dict
+    hits instead of scans over guild.roles / emojis / text_channels.
+    Where several objects share a key the first in Discord's order wins,
+    as it did with discord.utils.get and the old loops.
+    """
+
+    def __init__(self, guild: discord.Guild):
+        self.guild = guild
+        self._roles: Optional[Dict[str, discord.Role]] = None        # exact name
+        self._role_keys: Optional[Dict[str, discord.Role]] = None    # spaces removed, lowercased
+        self._emojis: Optional[Dict[str, discord.Emoji]] = None      # normalize_team_name(emoji.name)
+        self._emoji_names: Optional[Dict[str, discord.Emoji]] = None # lowercased emoji.name
+        self._channels: Optional[Dict[str, discord.TextChannel]] = None  # normalize_channel_name
+        self._channel_names: list[tuple[str, discord.TextChannel]] = []  # (lowercased name, channel)
+        self.stats = {"builds": 0, "invalidations": 0}
+
+    # ---------- invalidation ----------
+    def invalidate_roles(self):
+        self._roles = self._role_keys = None
+        self.stats["invalidations"] += 1
+
+    def invalidate_emojis(self):
+        self._emojis = self._emoji_names = None
+        self.stats["invalidations"] += 1
+
+    def invalidate_channels(self):
+        self._channels = None
+        self.stats["invalidations"] += 1
+
+    def invalidate(self):
+        self.invalidate_roles()
+        self.invalidate_emojis()
+        self.invalidate_channels()
+
+    # ---------- builds ----------
+    def _build_roles(self):
+        roles, keys = {}, {}
+        for role in self.guild.roles:
+            roles.setdefault(role.name, role)
+            keys.setdefault(_role_key(role.name), role)
+        self._roles, self._role_keys = roles, keys
+        self.stats["builds"] += 1
+
+    def _build_emojis(self):
+        by_team, by_name = {}, {}
+        for emoji in self.guild.emojis:
+            by_team.setdefault(normalize_team_name(emoji.name), emoji)
+            by_name.setdefault(emoji.name.lower(), emoji)
+        self._emojis, self._emoji_names = by_team, by_name
+        self.stats["builds"] += 1
+
+    def _build_channels(self):
+        channels, names = {}, []
+        for ch in self.guild.text_channels:
+            channels.setdefault(normalize_channel_name(ch.name), ch)
+            names.append((ch.name.lower(), ch))
+        self._channels, self._channel_names = channels, names
+        self.stats["builds"] += 1
+
+    # ---------- lookups ----------
+    def role(self, name: str) -> Optional[discord.Role]:
+        """Exact role name, like discord.utils.get(guild.roles, name=...)."""
+        if self._roles is None:
+            self._build_roles()
+        return self._roles.get(name)
+
+    def team_role(self, team_name: str) -> Optional[discord.Role]:
+        """Role name ignoring spaces and case."""
+        if self._role_keys is None:
+            self._build_roles()
+        return self._role_keys.get(_role_key(team_name or ""))
+
+    def team_emoji(self, team_name: str) -> Optional[discord.Emoji]:
+        """The team's emoji via TEAM_EMOJI_NAME, ignoring spaces, dots, dashes and case."""
+        if self._emojis is None:
+            self._build_emojis()
+        lookup = TEAM_EMOJI_NAME.get(team_name, team_name or "")
+        return self._emojis.get(normalize_team_name(lookup))
+
+    def emoji_named(self, name: str) -> Optional[discord.Emoji]:
+        if self._emoji_names is None:
+            self._build_emojis()
+        return self._emoji_names.get((name or "").lower())
+
+    def text_channel(self, name: str) -> Optional[discord.TextChannel]:
+        """Text channel by name, ignoring case, emoji and fancy-font characters."""
+        if self._channels is None:
+            self._build_channels()
+        return self._channels.get(normalize_channel_name(name))
+
+    def text_channel_containing(self, name: str) -> Optional[discord.TextChannel]:
+        """First text channel whose lowercased name contains `name`."""
+        if self._channels is None:
+            self._build_channels()
+        needle = (name or "").lower()
+        return next((ch for lowered, ch in self._channel_names if needle in lowered), None)
+
+
+REGISTRIES: Dict[int, GuildRegistry] = {}
+
+
+def guild_registry(guild: discord.Guild) -> GuildRegistry:
+    """The guild's registry; a new Guild object (after a reconnect) starts a fresh one."""
+    reg = REGISTRIES.get(guild.id)
+    if reg is None or reg.guild is not guild:
+        reg = REGISTRIES[guild.id] = GuildRegistry(guild)
+    return reg
+
+
+def invalidate_guild(guild_id: int, roles=False, emojis=False, channels=False):
+    reg = REGISTRIES.get(guild_id)
+    if reg is None:
+        return
+    if roles:
+        reg.invalidate_roles()
+    if emojis:
+        reg.invalidate_emojis()
+    if channels:
+        reg.invalidate_channels()
@@ -1,7 +1,6 @@
 import discord
-import re
-import unicodedata
 from utils.config import TRANSACTIONS_CHANNEL
+from utils.guild_registry import guild_registry, normalize_channel_name  # noqa: F401 (re-exported)
 
 async def log_transaction(guild: discord.Guild, embed: discord.Embed):
     channel = find_text_channel_fuzzy(guild, TRANSACTIONS_CHANNEL)
@@ -15,49 +14,18 @@ def find_text_channel_fuzzy(guild: discord.Guild, target_name: str) -> discord.T
     if not guild:
         return None
 
-    target = normalize_channel_name(target_name)
-
-    for ch in guild.text_channels:
-        if normalize_channel_name(ch.name) == target:
-            return ch
-
-    return None
-
-def normalize_channel_name(name: str) -> str:
-    # Handles capitalization + unicode "fancy fonts"
-    name = unicodedata.normalize("NFKD", name or "")
-    name = name.encode("ascii", "ignore").decode("ascii")
-    name = re.sub(r"[^a-z0-9]", "", name.lower())
-    return name
+    return guild_registry(guild).text_channel(target_name)
 
 def get_team_role(guild, team_name: str):
-    team_name_clean = team_name.replace(" ", "").lower()
-
-    for role in guild.roles:
-        role_clean = role.name.replace(" ", "").lower()
-
-        if role_clean == team_name_clean:
-            return role
-
-    return None
+    return guild_registry(guild).team_role(team_name)
 
 def find_streams_channel(guild, name: str):
-    name = name.lower()
-
-    for channel in guild.text_channels:
-        if name in channel.name.lower():
-            return channel
-
-    return None
+    return guild_registry(guild).text_channel_containing(name)
 
 def get_member_team_name(member):
     """
     Returns the team name of a member based on their roles.
     """
-    from utils.config import NFL_TEAMS
-
-    for role in member.roles:
-        if role.name in NFL_TEAMS:
-            return role.name
+    from utils.roster_index import ROSTERS
 
-    return None
\ No newline at end of file
+    return ROSTERS.team_of(member)
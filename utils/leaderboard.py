@@ -0,0 +1,77 @@
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, Optional
+
+
+class Leaderboard:
+    """
+    One stat column kept in rank order as totals change.
+
+    Entries are (-value, name, key) in a sorted list, so an update is a
+    bisect out and an insort back in, and the top N is a slice. Ratings
+    can go down as well as up, which rules out a bounded heap.
+    """
+
+    def __init__(self):
+        self._ranked: list[tuple] = []
+        self._entries: Dict[str, tuple] = {}
+
+    def __len__(self):
+        return len(self._ranked)
+
+    def update(self, key: str, value, name: str):
+        entry = (-value, name.casefold(), key)
+        old = self._entries.get(key)
+        if old == entry:
+            return
+
+        if old is not None:
+            del self._ranked[bisect_left(self._ranked, old)]
+        insort(self._ranked, entry)
+        self._entries[key] = entry
+
+    def discard(self, key: str):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            del self._ranked[bisect_left(self._ranked, old)]
+
+    def top(self, n: int) -> list[str]:
+        return [key for _, _, key in self._ranked[:n]]
+
+    def rank(self, key: str) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return bisect_left(self._ranked, entry) + 1
+
+    def clear(self):
+        self._ranked.clear()
+        self._entries.clear()
+
+
+class LeaderboardIndex:
+    """A Leaderboard per (position, stat) over a set of player stores."""
+
+    def __init__(self, columns: Dict[str, Iterable[str]]):
+        self.columns = {pos: tuple(stats) for pos, stats in columns.items()}
+        self.boards = {
+            (pos, stat): Leaderboard()
+            for pos, stats in self.columns.items()
+            for stat in stats
+        }
+
+    def update(self, pos: str, key: str, player: Dict[str, Any]):
+        for stat in self.columns[pos]:
+            self.boards[(pos, stat)].update(key, player[stat], player["player"])
+
+    def rebuild(self, stores: Dict[str, Dict[str, Dict[str, Any]]]):
+        for board in self.boards.values():
+            board.clear()
+        for pos, store in stores.items():
+            for key, player in store.items():
+                self.update(pos, key, player)
+
+    def top(self, pos: str, stat: str, n: int) -> list[str]:
+        return self.boards[(pos, stat)].top(n)
+
+    def rank(self, pos: str, stat: str, key: str) -> Optional[int]:
+        return self.boards[(pos, stat)].rank(key)
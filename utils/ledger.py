@@ -0,0 +1,188 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+LEDGER_FILE = BASE_DIR / "data" / "ledger.jsonl"
+
+# =========================
+# ENTRY TYPES
+# =========================
+# season  -> starts a season; "base" holds the team stats it starts from
+# result  -> one reported game (gamereport, /ffw, ...)
+# void    -> correction that cancels an earlier result by its seq
+SEASON = "season"
+RESULT = "result"
+VOID = "void"
+
+
+class AppendOnlyLog:
+    """
+    Append-only JSON-lines file. Every entry gets an increasing "seq"
+    and a "ts"; readers keep the parsed entries until the file changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: list[Dict[str, Any]] = []
+        self._stamp = None
+
+    def _current_stamp(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _refresh(self):
+        stamp = self._current_stamp()
+        if stamp == self._stamp:
+            return
+
+        entries = []
+        if stamp is not None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        # a torn last line from a crash; everything before it is good
+                        print(f"⚠️ Skipping unreadable ledger line: {line[:80]}")
+
+        self._entries = entries
+        self._stamp = stamp
+
+    def version(self):
+        self._refresh()
+        return self._stamp
+
+    def entries(self) -> list[Dict[str, Any]]:
+        self._refresh()
+        return self._entries
+
+    def last_seq(self) -> int:
+        entries = self.entries()
+        return int(entries[-1]["seq"]) if entries else 0
+
+    def entries_after(self, seq: int) -> list[Dict[str, Any]]:
+        entries = self.entries()
+
+        # seqs are increasing and normally dense, so the tail usually starts at
+        # a fixed offset; a gap (see append_many's `after`) or a hand edit
+        # falls through to the scan
+        if 0 <= seq <= len(entries) and (seq == 0 or int(entries[seq - 1]["seq"]) == seq):
+            return entries[seq:]
+        return [e for e in entries if int(e["seq"]) > seq]
+
+    def get(self, seq: int) -> Optional[Dict[str, Any]]:
+        tail = self.entries_after(seq - 1)
+        if tail and int(tail[0]["seq"]) == seq:
+            return tail[0]
+        return None
+
+    def append(self, entry: Dict[str, Any], after: int = 0) -> Dict[str, Any]:
+        return self.append_many([entry], after=after)[0]
+
+    def append_many(self, entries: Iterable[Dict[str, Any]], after: int = 0) -> list[Dict[str, Any]]:
+        """
+        Appends a batch with a single write + fsync. Numbering continues
+        after the last entry, or after `after` if that is higher (a seq some
+        other record already refers to, e.g. after the file was lost).
+        """
+        seq = max(self.last_seq(), int(after))
+        now = int(time.time())
+
+        added = []
+        for entry in entries:
+            seq += 1
+            added.append({"seq": seq, "ts": now, **entry})
+        if not added:
+            return added
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(e, separators=(",", ":")) + "\n" for e in added))
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._entries.extend(added)
+        self._stamp = self._current_stamp()
+        return added
+
+
+class GameLedger(AppendOnlyLog):
+    """
+    Append-only log of game results, one compact JSON object per line.
+    Standings are a materialized view of this file (see utils.standings).
+    """
+
+
+# =========================
+# REPLAY
+# =========================
+def apply_result(teams: Dict[str, Dict[str, int]], entry: Dict[str, Any]):
+    t1 = teams[entry["t1"]]
+    t2 = teams[entry["t2"]]
+
+    score1 = int(entry["s1"])
+    score2 = int(entry["s2"])
+
+    t1["pf"] += score1
+    t1["pa"] += score2
+    t2["pf"] += score2
+    t2["pa"] += score1
+
+    if score1 > score2:
+        t1["wins"] += 1
+        t2["losses"] += 1
+        t1["streak"] = t1["streak"] + 1 if t1["streak"] >= 0 else 1
+        t2["streak"] = t2["streak"] - 1 if t2["streak"] <= 0 else -1
+    elif score2 > score1:
+        t2["wins"] += 1
+        t1["losses"] += 1
+        t2["streak"] = t2["streak"] + 1 if t2["streak"] >= 0 else 1
+        t1["streak"] = t1["streak"] - 1 if t1["streak"] <= 0 else -1
+
+
+def voided_seqs(entries: Iterable[Dict[str, Any]]) -> set[int]:
+    return {int(e["ref"]) for e in entries if e.get("type") == VOID}
+
+
+def replay_season(
+    entries: list[Dict[str, Any]],
+    season: int,
+    blank_stats,
+    upto_week: Optional[int] = None,
+) -> Optional[Dict[str, Dict[str, int]]]:
+    """
+    Rebuilds a season's team table from its last "season" entry.
+    Returns None if the ledger has no start entry for that season.
+    """
+    start = None
+    for i, e in enumerate(entries):
+        if e.get("type") == SEASON and int(e["season"]) == season:
+            start = i
+    if start is None:
+        return None
+
+    season_entries = [e for e in entries[start + 1:] if int(e.get("season", season)) == season]
+    voided = voided_seqs(season_entries)
+
+    teams = {team: {**blank_stats(), **stats} for team, stats in entries[start]["base"].items()}
+
+    for e in season_entries:
+        if e.get("type") != RESULT or int(e["seq"]) in voided:
+            continue
+        if upto_week is not None and int(e.get("week") or 0) > upto_week:
+            continue
+
+        for team in (e["t1"], e["t2"]):
+            teams.setdefault(team, blank_stats())
+        apply_result(teams, e)
+
+    return teams
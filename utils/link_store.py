@@ -0,0 +1,255 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from utils.trigram import TrigramIndex
+
+# how often linked players picked up between reports are written out
+LINK_FLUSH_SECONDS = 60
+
+# compaction drops links not refreshed for this long
+LINK_MAX_AGE_DAYS = 180
+
+
+def _norm(name: Optional[str]) -> str:
+    return str(name or "").strip().lower()
+
+
+class LinkStore:
+    """
+    Roblox <-> Discord links held in memory with hash indexes on Roblox id,
+    lowercased Roblox username and lowercased Roblox display name.
+
+    upsert() only touches memory and marks the entry dirty; flush() writes
+    every dirty entry in one storage call (once per report, and from the
+    background flusher for anything in between).
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self._lock = threading.RLock()
+
+        self.entries: Dict[str, Dict[str, Any]] = {}    # discord id -> entry
+        self.by_roblox: Dict[str, str] = {}             # roblox id -> discord id
+        self.by_username: Dict[str, list[str]] = {}     # name -> discord ids, newest last
+        self.by_display: Dict[str, list[str]] = {}
+        self.fuzzy = TrigramIndex()     # over the keys of by_username and by_display
+
+        self._dirty: set[str] = set()
+        self._flusher: Optional[asyncio.Task] = None
+
+        self.stats = {"upserts": 0, "flushes": 0, "entries_written": 0, "compacted": 0}
+
+    def __len__(self):
+        return len(self.entries)
+
+    # ---------- loading ----------
+    def load(self):
+        links = self.storage.load_links()
+
+        with self._lock:
+            self.entries.clear()
+            self.by_roblox.clear()
+            self.by_username.clear()
+            self.by_display.clear()
+            self.fuzzy.clear()
+
+            for discord_id, entry in links.get("discord_to_roblox", {}).items():
+                self._index(str(discord_id), dict(entry))
+
+            # older files carry roblox -> discord pairs without a full entry
+            for roblox_id, discord_id in links.get("roblox_to_discord", {}).items():
+                self.by_roblox.setdefault(str(roblox_id), str(discord_id))
+
+        return self
+
+    # ---------- indexes ----------
+    def _add(self, index, key, discord_id):
+        if not key:
+            return
+        self.fuzzy.add(key)
+        ids = index.setdefault(key, [])
+        if discord_id in ids:
+            ids.remove(discord_id)
+        ids.append(discord_id)
+
+    def _remove(self, index, key, discord_id):
+        ids = index.get(key)
+        if not ids:
+            return
+        if discord_id in ids:
+            ids.remove(discord_id)
+        if not ids:
+            del index[key]
+            if key not in self.by_username and key not in self.by_display:
+                self.fuzzy.remove(key)
+
+    def _unindex(self, discord_id: str):
+        old = self.entries.pop(discord_id, None)
+        if old is None:
+            return None
+
+        rid = str(old.get("roblox_id"))
+        if self.by_roblox.get(rid) == discord_id:
+            del self.by_roblox[rid]
+        self._remove(self.by_username, _norm(old.get("roblox_username")), discord_id)
+        self._remove(self.by_display, _norm(old.get("roblox_display_name")), discord_id)
+        return old
+
+    def _index(self, discord_id: str, entry: Dict[str, Any]):
+        self._unindex(discord_id)
+        self.entries[discord_id] = entry
+        self.by_roblox[str(entry.get("roblox_id"))] = discord_id
+        self._add(self.by_username, _norm(entry.get("roblox_username")), discord_id)
+        self._add(self.by_display, _norm(entry.get("roblox_display_name")), discord_id)
+
+    # ---------- lookups ----------
+    def discord_id_for_roblox(self, roblox_id) -> Optional[int]:
+        did = self.by_roblox.get(str(roblox_id))
+        return int(did) if did else None
+
+    def discord_ids_for_name(self, roblox_username=None, roblox_display_name=None) -> list[int]:
+        """Candidates by username first, then display name; newest link first."""
+        out = []
+        for index, name in ((self.by_username, roblox_username), (self.by_display, roblox_display_name)):
+            for did in reversed(index.get(_norm(name), [])):
+                if int(did) not in out:
+                    out.append(int(did))
+        return out
+
+    def similar(self, name: Optional[str], limit: int = 5, min_score: float = 0.0) -> list[tuple[int, float, str]]:
+        """Discord ids whose linked Roblox names look like `name`: (discord id, score, matched name)."""
+        best: Dict[int, tuple[float, str]] = {}
+        for key, score in self.fuzzy.query(_norm(name), limit=limit * 2, min_score=min_score):
+            for did in self.by_username.get(key, []) + self.by_display.get(key, []):
+                did = int(did)
+                if did not in best or score > best[did][0]:
+                    best[did] = (score, key)
+        ranked = sorted(best.items(), key=lambda x: (-x[1][0], x[0]))
+        return [(did, score, key) for did, (score, key) in ranked[:limit]]
+
+    def entry(self, discord_id) -> Optional[Dict[str, Any]]:
+        return self.entries.get(str(discord_id))
+
+    # ---------- writes ----------
+    def upsert(self, discord_member, roblox_id, roblox_username, roblox_display_name=None):
+        discord_id = str(discord_member.id)
+        entry = {
+            "discord_id": discord_member.id,
+            "discord_name": discord_member.name,
+            "discord_display_name": getattr(discord_member, "display_name", discord_member.name),
+            "roblox_id": roblox_id,
+            "roblox_username": roblox_username,
+            "roblox_display_name": roblox_display_name or roblox_username,
+            "updated_at": int(time.time()),
+        }
+
+        with self._lock:
+            old = self.entries.get(discord_id)
+            same = old is not None and {k: v for k, v in old.items() if k != "updated_at"} == {
+                k: v for k, v in entry.items() if k != "updated_at"
+            }
+            # refresh the timestamp at most daily so an unchanged link isn't rewritten every report
+            if same and entry["updated_at"] - int(old.get("updated_at") or 0) < 86400:
+                return
+
+            # a roblox account re-linked to someone else drops the old owner's link
+            previous_owner = self.by_roblox.get(str(roblox_id))
+            if previous_owner and previous_owner != discord_id:
+                self._unindex(previous_owner)
+
+            self._index(discord_id, entry)
+            self._dirty.add(discord_id)
+            self.stats["upserts"] += 1
+
+    def _take_dirty(self) -> list[Dict[str, Any]]:
+        with self._lock:
+            entries = [dict(self.entries[d]) for d in self._dirty if d in self.entries]
+            self._dirty.clear()
+        return entries
+
+    def flush(self) -> int:
+        """Writes every dirty entry in one storage call; returns how many."""
+        entries = self._take_dirty()
+        if not entries:
+            return 0
+
+        try:
+            self.storage.save_link_batch(entries)
+        except Exception:
+            with self._lock:
+                self._dirty.update(str(e["discord_id"]) for e in entries)
+            raise
+
+        self.stats["flushes"] += 1
+        self.stats["entries_written"] += len(entries)
+        return len(entries)
+
+    async def flush_async(self) -> int:
+        if not self._dirty:
+            return 0
+        return await asyncio.to_thread(self.flush)
+
+    # ---------- compaction ----------
+    def compact(self, max_age_days: float = LINK_MAX_AGE_DAYS, keep_discord_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Drops links older than `max_age_days`, and (when `keep_discord_ids`
+        is given, e.g. the guild's members) links of people no longer in it,
+        plus roblox ids whose Discord account has since linked another
+        account. Returns how many were removed.
+        """
+        cutoff = time.time() - max_age_days * 86400
+        keep = {str(i) for i in keep_discord_ids} if keep_discord_ids is not None else None
+
+        with self._lock:
+            stale = [
+                did for did, entry in self.entries.items()
+                # links from before timestamps were kept only go when the member does
+                if (entry.get("updated_at") and entry["updated_at"] < cutoff)
+                or (keep is not None and did not in keep)
+            ]
+            removed = [self._unindex(did) for did in stale]
+            dropped_roblox = [str(e.get("roblox_id")) for e in removed if e]
+
+            orphaned = [
+                rid for rid, did in self.by_roblox.items()
+                if str((self.entries.get(did) or {}).get("roblox_id")) != rid
+            ]
+            for rid in orphaned:
+                del self.by_roblox[rid]
+            dropped_roblox += orphaned
+
+            self._dirty.difference_update(stale)
+
+        if dropped_roblox:
+            self.storage.delete_links(dropped_roblox)
+
+        self.stats["compacted"] += len(dropped_roblox)
+        return len(dropped_roblox)
+
+    # ---------- background flusher ----------
+    async def _flush_loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush_async()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Link store flush failed: {type(e).__name__}: {e}")
+
+    def start_flusher(self, interval: float = LINK_FLUSH_SECONDS):
+        """Must be called from inside the running event loop (SFGBot.setup_hook)."""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop(interval), name="link-store-flush")
+
+    async def close(self):
+        task, self._flusher = self._flusher, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush_async()
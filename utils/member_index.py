@@ -0,0 +1,138 @@
+import re
+import sys
+from typing import Dict, Optional
+
+import discord
+
+from utils.trigram import TrigramIndex
+
+
+def normalize_member_name(s: str) -> str:
+    s = (s or "").strip().lower()
+    s = re.sub(r"\s+", "", s)
+    s = re.sub(r"[^a-z0-9_\.]", "", s)
+    return s
+
+
+def _member_keys(member) -> tuple[str, ...]:
+    names = (member.name, member.display_name, getattr(member, "global_name", None))
+    return tuple(dict.fromkeys(k for k in (normalize_member_name(str(n)) for n in names if n) if k))
+
+
+class MemberNameIndex:
+    """
+    Normalized username / display name / global name -> member ids for one
+    guild. Built once on ready and kept current from member events
+    (cogs/indexes.py), so a name lookup is a dict hit instead of a pass
+    over guild.members.
+    """
+
+    def __init__(self):
+        self.guild_id: Optional[int] = None
+        self.complete = False   # built from a fully chunked member list
+        self.names: Dict[str, set[int]] = {}
+        self.keys_by_member: Dict[int, tuple[str, ...]] = {}
+        self.fuzzy = TrigramIndex()     # over the keys of self.names
+        self.stats = {"builds": 0, "updates": 0, "lookups": 0, "scan_fallbacks": 0, "ambiguous": 0}
+
+    @property
+    def ready(self) -> bool:
+        return self.guild_id is not None
+
+    def __len__(self):
+        return len(self.keys_by_member)
+
+    # ---------- maintenance ----------
+    def build(self, guild: discord.Guild):
+        self.names.clear()
+        self.keys_by_member.clear()
+        self.fuzzy.clear()
+        for member in guild.members:
+            self.add(member)
+
+        self.guild_id = guild.id
+        self.complete = guild.chunked
+        self.stats["builds"] += 1
+
+    def add(self, member):
+        keys = _member_keys(member)
+        self.keys_by_member[member.id] = keys
+        for key in keys:
+            if key not in self.names:
+                self.names[key] = set()
+                self.fuzzy.add(key)
+            self.names[key].add(member.id)
+
+    def remove(self, member_id: int):
+        for key in self.keys_by_member.pop(member_id, ()):
+            ids = self.names.get(key)
+            if ids is not None:
+                ids.discard(member_id)
+                if not ids:
+                    del self.names[key]
+                    self.fuzzy.remove(key)
+
+    def update(self, member):
+        """Re-indexes a member whose name, nickname or global name changed."""
+        if self.keys_by_member.get(member.id) == _member_keys(member):
+            return
+        self.remove(member.id)
+        self.add(member)
+        self.stats["updates"] += 1
+
+    # ---------- lookups ----------
+    def find(self, *names: Optional[str]) -> list[int]:
+        """Member ids matching any of the names, in the order the names were given."""
+        self.stats["lookups"] += 1
+        out: list[int] = []
+        for name in names:
+            key = normalize_member_name(name or "")
+            for member_id in sorted(self.names.get(key, ())):
+                if member_id not in out:
+                    out.append(member_id)
+        return out
+
+    def find_member(self, guild: discord.Guild, *names: Optional[str]) -> Optional[discord.Member]:
+        """
+        The one member any of the names points to. None when nobody matches,
+        or when more than one member does: a shared name is a guess, and
+        callers save what this returns as a link.
+        """
+        if not self.ready or guild.id != self.guild_id:
+            # before on_ready, or another guild: the old scan
+            self.stats["scan_fallbacks"] += 1
+            wanted = {normalize_member_name(n) for n in names if n} - {""}
+            members = [m for m in guild.members if wanted.intersection(_member_keys(m))]
+        else:
+            members = [m for m in map(guild.get_member, self.find(*names)) if m is not None]
+
+        if len(members) > 1:
+            self.stats["ambiguous"] += 1
+            return None
+        return members[0] if members else None
+
+    def similar(self, name: Optional[str], limit: int = 5, min_score: float = 0.0) -> list[tuple[int, float, str]]:
+        """Members whose names look like `name`: (member id, score, matched name), best first."""
+        best: Dict[int, tuple[float, str]] = {}
+        for key, score in self.fuzzy.query(name or "", limit=limit * 2, min_score=min_score):
+            for member_id in self.names.get(key, ()):
+                if member_id not in best or score > best[member_id][0]:
+                    best[member_id] = (score, key)
+        ranked = sorted(best.items(), key=lambda x: (-x[1][0], x[0]))
+        return [(member_id, score, key) for member_id, (score, key) in ranked[:limit]]
+
+    # ---------- metrics ----------
+    def memory_stats(self) -> Dict[str, int]:
+        """Approximate bytes held by the index (containers and key strings)."""
+        size = sys.getsizeof(self.names) + sys.getsizeof(self.keys_by_member)
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in self.names.items())
+        size += sum(sys.getsizeof(v) for v in self.keys_by_member.values())
+        return {
+            "members": len(self.keys_by_member),
+            "names": len(self.names),
+            "trigrams": len(self.fuzzy.postings),
+            "approx_bytes": size,
+        }
+
+
+MEMBER_NAMES = MemberNameIndex()
@@ -0,0 +1,148 @@
+import enum
+from typing import Dict, Optional, Tuple
+
+import discord
+from discord import app_commands
+
+from utils.config import STREAMER_ROLE_NAME
+
+
+class Cap(enum.IntFlag):
+    """What a member may do, as bits so a check is one AND."""
+    SFG = enum.auto()               # the league staff role, any capitalization
+    FRANCHISE_OWNER = enum.auto()
+    TEAM_PRESIDENT = enum.auto()
+    GENERAL_MANAGER = enum.auto()
+    STREAMER = enum.auto()
+    ADMIN = enum.auto()             # Administrator or Manage Server
+    MODERATOR = enum.auto()         # Administrator, Ban Members or Manage Server
+
+    MANAGEMENT = FRANCHISE_OWNER | TEAM_PRESIDENT | GENERAL_MANAGER
+    GAME_REPORTER = FRANCHISE_OWNER | TEAM_PRESIDENT
+    LEAGUE_STAFF = SFG | ADMIN
+
+
+# exact role name -> capability it grants
+ROLE_CAPS: Dict[str, Cap] = {
+    "Franchise Owner": Cap.FRANCHISE_OWNER,
+    "Team President": Cap.TEAM_PRESIDENT,
+    "General Manager": Cap.GENERAL_MANAGER,
+    STREAMER_ROLE_NAME: Cap.STREAMER,
+}
+
+# the staff role has always been matched in any capitalization
+SFG_ROLE_KEY = "sfg"
+
+# management tiers by power, for "who outranks whom" checks
+MANAGEMENT_RANKS = (
+    (Cap.FRANCHISE_OWNER, "Franchise Owner"),
+    (Cap.TEAM_PRESIDENT, "Team President"),
+    (Cap.GENERAL_MANAGER, "General Manager"),
+)
+
+
+def _permission_caps(perms: discord.Permissions) -> Cap:
+    caps = Cap(0)
+    if perms.administrator or perms.manage_guild:
+        caps |= Cap.ADMIN
+    if perms.administrator or perms.ban_members or perms.manage_guild:
+        caps |= Cap.MODERATOR
+    return caps
+
+
+class PermissionResolver:
+    """
+    Role names resolved to ids once per guild, and each member's Cap mask
+    cached until a role, member or guild (owner) update in cogs/indexes.py
+    drops it.
+    """
+
+    def __init__(self):
+        self.role_caps: Dict[int, Dict[int, Cap]] = {}       # guild id -> role id -> caps
+        self.member_caps: Dict[Tuple[int, int], Cap] = {}    # (guild id, member id) -> caps
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _roles(self, guild: discord.Guild) -> Dict[int, Cap]:
+        caps = self.role_caps.get(guild.id)
+        if caps is None:
+            caps = {}
+            for role in guild.roles:
+                cap = ROLE_CAPS.get(role.name)
+                if role.name.casefold() == SFG_ROLE_KEY:
+                    cap = Cap.SFG
+                if cap:
+                    caps[role.id] = cap
+            self.role_caps[guild.id] = caps
+        return caps
+
+    def caps(self, member) -> Cap:
+        guild = getattr(member, "guild", None)
+        if guild is None:
+            return Cap(0)
+
+        key = (guild.id, member.id)
+        cached = self.member_caps.get(key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached
+
+        self.stats["misses"] += 1
+        role_caps = self._roles(guild)
+        caps = Cap(0)
+        for role in member.roles:
+            caps |= role_caps.get(role.id, Cap(0))
+        caps |= _permission_caps(member.guild_permissions)
+
+        self.member_caps[key] = caps
+        return caps
+
+    def invalidate_guild(self, guild_id: int):
+        """A role was created, renamed, re-permissioned or deleted, or the owner changed."""
+        self.role_caps.pop(guild_id, None)
+        for key in [k for k in self.member_caps if k[0] == guild_id]:
+            del self.member_caps[key]
+
+    def invalidate_member(self, guild_id: int, member_id: int):
+        self.member_caps.pop((guild_id, member_id), None)
+
+    def clear(self):
+        self.role_caps.clear()
+        self.member_caps.clear()
+
+
+PERMISSIONS = PermissionResolver()
+
+
+def has_cap(member, cap: Cap) -> bool:
+    """True if the member holds any of the bits in `cap`."""
+    return bool(PERMISSIONS.caps(member) & cap)
+
+
+def management_rank(member) -> Optional[str]:
+    """The member's highest management role name, or None."""
+    caps = PERMISSIONS.caps(member)
+    return next((name for bit, name in MANAGEMENT_RANKS if caps & bit), None)
+
+
+# =========================
+# APP COMMAND CHECKS
+# =========================
+class MissingCapability(app_commands.CheckFailure):
+    """Raised by requires(); the user has already been told why."""
+
+
+def requires(cap: Cap, message: str = "❌ No permission."):
+    """
+    App command check: lets the command run only for members holding any
+    bit of `cap`, otherwise answers `message` ephemerally.
+    """
+
+    async def predicate(interaction: discord.Interaction) -> bool:
+        if isinstance(interaction.user, discord.Member) and has_cap(interaction.user, cap):
+            return True
+
+        if not interaction.response.is_done():
+            await interaction.response.send_message(message, ephemeral=True)
+        raise MissingCapability(message)
+
+    return app_commands.check(predicate)
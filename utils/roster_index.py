@@ -0,0 +1,142 @@
+from typing import Dict, Optional
+
+import discord
+
+from utils.config import NFL_TEAMS
+from utils.guild_registry import guild_registry
+
+# management roles, highest first
+MANAGEMENT_TIERS = ("Franchise Owner", "Team President", "General Manager")
+
+_TEAMS = frozenset(NFL_TEAMS)
+_TIERS = frozenset(MANAGEMENT_TIERS)
+
+
+def _member_teams(member) -> tuple[str, ...]:
+    return tuple(r.name for r in member.roles if r.name in _TEAMS)
+
+
+def _member_tiers(member) -> tuple[str, ...]:
+    return tuple(r.name for r in member.roles if r.name in _TIERS)
+
+
+class RosterIndex:
+    """
+    Team membership for one guild: member id -> team(s), team -> roster
+    and team -> management staff by tier. Built on ready and kept current
+    from member and role events (cogs/indexes.py), so roster commands
+    don't go through Role.members, which walks every cached member.
+
+    Rosters start out in guild.members order, like Role.members; members
+    whose roles change move to the end. The index only goes live from a
+    fully chunked member list; until then (or for another guild) roster and
+    staff lookups fall back to the old scans. A single member's team is
+    always read off their own roles, which are already at hand.
+    """
+
+    def __init__(self):
+        self.guild_id: Optional[int] = None
+        self.teams_by_member: Dict[int, tuple[str, ...]] = {}
+        self.tiers_by_member: Dict[int, tuple[str, ...]] = {}
+        self.rosters: Dict[str, Dict[int, None]] = {}              # team -> member ids, ordered
+        self.staff: Dict[str, Dict[str, Dict[int, None]]] = {}    # team -> tier -> member ids
+        self.stats = {"builds": 0, "updates": 0}
+
+    @property
+    def ready(self) -> bool:
+        return self.guild_id is not None
+
+    def _usable(self, guild: Optional[discord.Guild]) -> bool:
+        return guild is not None and guild.id == self.guild_id
+
+    # ---------- maintenance ----------
+    def build(self, guild: discord.Guild):
+        self.guild_id = None
+        self.teams_by_member.clear()
+        self.tiers_by_member.clear()
+        self.rosters.clear()
+        self.staff.clear()
+        for member in guild.members:
+            self.add(member)
+
+        # a partial member list would make rosters silently short
+        if guild.chunked:
+            self.guild_id = guild.id
+        self.stats["builds"] += 1
+
+    def add(self, member):
+        teams, tiers = _member_teams(member), _member_tiers(member)
+        if teams:
+            self.teams_by_member[member.id] = teams
+        if tiers:
+            self.tiers_by_member[member.id] = tiers
+
+        for team in teams:
+            self.rosters.setdefault(team, {})[member.id] = None
+            for tier in tiers:
+                self.staff.setdefault(team, {}).setdefault(tier, {})[member.id] = None
+
+    def remove(self, member_id: int):
+        teams = self.teams_by_member.pop(member_id, ())
+        tiers = self.tiers_by_member.pop(member_id, ())
+        for team in teams:
+            self.rosters.get(team, {}).pop(member_id, None)
+            for tier in tiers:
+                self.staff.get(team, {}).get(tier, {}).pop(member_id, None)
+
+    def update(self, member):
+        """Re-files a member after a role change; a no-op for nickname/avatar updates."""
+        if (
+            self.teams_by_member.get(member.id, ()) == _member_teams(member)
+            and self.tiers_by_member.get(member.id, ()) == _member_tiers(member)
+        ):
+            return
+        self.remove(member.id)
+        self.add(member)
+        self.stats["updates"] += 1
+
+    # ---------- lookups ----------
+    def teams_of(self, member) -> tuple[str, ...]:
+        # O(roles) on the member we already hold; the index could miss
+        # members it hasn't seen yet
+        return _member_teams(member)
+
+    def team_of(self, member) -> Optional[str]:
+        """The member's team (first team role in Discord's order), or None."""
+        teams = self.teams_of(member)
+        return teams[0] if teams else None
+
+    def roster(self, guild: discord.Guild, team: str) -> list[discord.Member]:
+        if not self._usable(guild):
+            role = guild_registry(guild).role(team)
+            return list(role.members) if role else []
+
+        out = []
+        for member_id in self.rosters.get(team, {}):
+            member = guild.get_member(member_id)
+            if member is not None:
+                out.append(member)
+        return out
+
+    def staff_of(self, guild: discord.Guild, team: str, tier: str) -> list[discord.Member]:
+        """Members holding both the team role and the management tier role."""
+        if not self._usable(guild):
+            reg = guild_registry(guild)
+            team_role, tier_role = reg.role(team), reg.role(tier)
+            if not team_role or not tier_role:
+                return []
+            return [m for m in tier_role.members if team_role in m.roles]
+
+        out = []
+        for member_id in self.staff.get(team, {}).get(tier, {}):
+            member = guild.get_member(member_id)
+            if member is not None:
+                out.append(member)
+        return out
+
+    def active_teams(self, guild: discord.Guild) -> list[str]:
+        """Teams with a Franchise Owner, in NFL_TEAMS order."""
+        return [t for t in NFL_TEAMS if self.staff_of(guild, t, "Franchise Owner")]
+
+
+ROSTERS = RosterIndex()
@@ -0,0 +1,262 @@
+import random
+import statistics
+from collections import Counter, defaultdict
+from typing import Dict, Optional, Sequence
+
+BYE = None
+
+# how many passes the strength-of-schedule repair gets before it settles
+SOS_REPAIR_PASSES = 50
+
+
+# =========================
+# CIRCLE METHOD
+# =========================
+def circle_rounds(teams: Sequence[str]) -> list[list[tuple[str, str]]]:
+    """
+    Every team plays every other team exactly once over n-1 rounds
+    (n rounds with a bye when the team count is odd).
+    """
+    slots = list(teams)
+    if len(slots) % 2:
+        slots.append(BYE)
+
+    n = len(slots)
+    rounds = []
+
+    for _ in range(n - 1):
+        games = []
+        for i in range(n // 2):
+            a, b = slots[i], slots[n - 1 - i]
+            if a is not BYE and b is not BYE:
+                games.append((a, b))
+        rounds.append(games)
+
+        # keep the first slot fixed and rotate the rest one step
+        slots = [slots[0], slots[-1]] + slots[1:-1]
+
+    return rounds
+
+
+# =========================
+# STRENGTH OF SCHEDULE
+# =========================
+def strengths_from_standings(teams_data, teams: Sequence[str]) -> Dict[str, float]:
+    """Win % per team (0.5 before a team has played), from standings["teams"]."""
+    out = {}
+    for team in teams:
+        stats = teams_data.get(team, {})
+        games = int(stats.get("wins", 0)) + int(stats.get("losses", 0))
+        out[team] = int(stats.get("wins", 0)) / games if games else 0.5
+    return out
+
+
+def _variance(totals: list[float], counts: list[int]) -> float:
+    values = [t / c for t, c in zip(totals, counts) if c]
+    if len(values) < 2:
+        return 0.0
+    mean = sum(values) / len(values)
+    return sum((v - mean) ** 2 for v in values) / len(values)
+
+
+def _pick_rounds(rounds, k: int, base_rounds: int, strengths, rng) -> list[int]:
+    """
+    Chooses k of the rounds, then repairs the choice by swapping rounds in
+    and out while that narrows the spread of strength of schedule.
+    `base_rounds` full cycles of every round are played on top of these.
+    """
+    chosen = rng.sample(range(len(rounds)), k)
+    if not strengths or k in (0, len(rounds)):
+        return chosen
+
+    teams = sorted({t for games in rounds for g in games for t in g})
+    pos = {t: i for i, t in enumerate(teams)}
+
+    # per round: opponent strength and games played, per team
+    contrib = []
+    plays = []
+    for games in rounds:
+        c = [0.0] * len(teams)
+        p = [0] * len(teams)
+        for a, b in games:
+            c[pos[a]] = strengths.get(b, 0.5)
+            c[pos[b]] = strengths.get(a, 0.5)
+            p[pos[a]] = p[pos[b]] = 1
+        contrib.append(c)
+        plays.append(p)
+
+    totals = [0.0] * len(teams)
+    counts = [0] * len(teams)
+    for i in range(len(rounds)):
+        weight = base_rounds + (1 if i in chosen else 0)
+        for t in range(len(teams)):
+            totals[t] += contrib[i][t] * weight
+            counts[t] += plays[i][t] * weight
+
+    best = _variance(totals, counts)
+
+    for _ in range(SOS_REPAIR_PASSES):
+        best_swap = None
+        unused = [i for i in range(len(rounds)) if i not in chosen]
+
+        for out_pos, out_i in enumerate(chosen):
+            c_out, p_out = contrib[out_i], plays[out_i]
+            for in_i in unused:
+                c_in, p_in = contrib[in_i], plays[in_i]
+                trial = [x - o + n for x, o, n in zip(totals, c_out, c_in)]
+                trial_counts = [x - o + n for x, o, n in zip(counts, p_out, p_in)]
+
+                score = _variance(trial, trial_counts)
+                if score < best - 1e-12:
+                    best = score
+                    best_swap = (out_pos, in_i, trial, trial_counts)
+
+        if best_swap is None:
+            break
+
+        out_pos, in_i, totals, counts = best_swap
+        chosen[out_pos] = in_i
+
+    return chosen
+
+
+# =========================
+# HOME / AWAY
+# =========================
+def _orient_home_away(games: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """
+    Orients every game along an Euler circuit of the matchup graph, so each
+    team's home and away counts differ by at most one.
+    """
+    teams = {t for g in games for t in g}
+    edges = list(games)
+
+    degree = Counter(t for g in games for t in g)
+    odd = sorted(t for t in teams if degree[t] % 2)
+    dummy = object()
+    edges += [(t, dummy) for t in odd]
+
+    adjacency = defaultdict(list)
+    for i, (a, b) in enumerate(edges):
+        adjacency[a].append(i)
+        adjacency[b].append(i)
+
+    used = [False] * len(edges)
+    oriented: list[Optional[tuple[str, str]]] = [None] * len(games)
+
+    for start in sorted(teams) + ([dummy] if odd else []):
+        stack = [start]
+        while stack:
+            v = stack[-1]
+            while adjacency[v] and used[adjacency[v][-1]]:
+                adjacency[v].pop()
+            if not adjacency[v]:
+                stack.pop()
+                continue
+
+            i = adjacency[v].pop()
+            used[i] = True
+            a, b = edges[i]
+            w = b if a == v else a
+
+            # leaving v means v hosts this one
+            if i < len(games):
+                oriented[i] = (v, w)
+            stack.append(w)
+
+    return oriented
+
+
+# =========================
+# GENERATOR
+# =========================
+def generate_schedule(
+    teams: Sequence[str],
+    weeks: int = 10,
+    seed: Optional[int] = None,
+    strengths: Optional[Dict[str, float]] = None,
+) -> Dict[str, list[list[str]]]:
+    """
+    Builds {"1": [[home, away], ...], ...}.
+
+    No pair meets twice within the first n-1 weeks; past that the full
+    round robin repeats in the same order, so rematches are n-1 weeks apart.
+    Home/away counts are balanced to within one game per team, and when
+    `strengths` is given the rounds that make up a partial cycle are chosen
+    to even out strength of schedule. The same seed gives the same schedule.
+    """
+    rng = random.Random(seed)
+
+    teams = list(teams)
+    rng.shuffle(teams)
+
+    rounds = circle_rounds(teams)
+    rng.shuffle(rounds)
+
+    if not rounds:
+        return {str(w): [] for w in range(1, weeks + 1)}
+
+    full_cycles, remainder = divmod(weeks, len(rounds))
+
+    picked = _pick_rounds(rounds, remainder, full_cycles, strengths, rng)
+
+    # the partial cycle's rounds lead every cycle, so each rematch sits
+    # exactly one cycle after the previous meeting
+    cycle = [rounds[i] for i in picked] + [r for i, r in enumerate(rounds) if i not in picked]
+    ordered = cycle * full_cycles + cycle[:remainder]
+
+    flat = [g for games in ordered for g in games]
+    oriented = iter(_orient_home_away(flat))
+
+    schedule = {}
+    for week, games in enumerate(ordered, start=1):
+        schedule[str(week)] = [list(next(oriented)) for _ in games]
+    return schedule
+
+
+# =========================
+# QUALITY
+# =========================
+def schedule_quality(schedule: Dict[str, list], strengths: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """Rematch, home/away and strength-of-schedule figures for a schedule."""
+    meetings = Counter()
+    last_met: Dict[frozenset, int] = {}
+    min_gap = None
+    home = Counter()
+    away = Counter()
+    opponents = defaultdict(list)
+    doubled_weeks = 0
+
+    for week in sorted(schedule, key=int):
+        seen = Counter()
+        for a, b in schedule[week]:
+            pair = frozenset((a, b))
+            meetings[pair] += 1
+            if pair in last_met:
+                gap = int(week) - last_met[pair]
+                min_gap = gap if min_gap is None else min(min_gap, gap)
+            last_met[pair] = int(week)
+
+            home[a] += 1
+            away[b] += 1
+            seen[a] += 1
+            seen[b] += 1
+            opponents[a].append(b)
+            opponents[b].append(a)
+        if any(c > 1 for c in seen.values()):
+            doubled_weeks += 1
+
+    teams = set(home) | set(away)
+    sos = []
+    if strengths:
+        sos = [statistics.mean(strengths.get(o, 0.5) for o in opponents[t]) for t in teams]
+
+    return {
+        "games": sum(meetings.values()),
+        "rematches": sum(c - 1 for c in meetings.values()),
+        "min_rematch_gap": min_gap or 0,
+        "teams_double_booked_weeks": doubled_weeks,
+        "max_home_away_imbalance": max((abs(home[t] - away[t]) for t in teams), default=0),
+        "sos_stdev": round(statistics.pstdev(sos), 4) if len(sos) > 1 else 0.0,
+        "sos_range": round(max(sos) - min(sos), 4) if sos else 0.0,
+    }
@@ -0,0 +1,102 @@
+from typing import Dict, Any, Optional
+
+from utils.storage import STORAGE
+
+
+def normalize_team(name: str) -> str:
+    return name.strip()
+
+
+def _pair(team_a: str, team_b: str) -> frozenset:
+    return frozenset((normalize_team(team_a), normalize_team(team_b)))
+
+
+class ScheduleIndex:
+    """
+    Lookup tables over one version of the schedule:
+    pair of teams -> (week, played) and team -> this week's opponent.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]]):
+        data = data or {}
+
+        self.current_week = int(data.get("current_week", 1))
+        self.played: set[frozenset] = {_pair(a, b) for a, b in data.get("played", [])}
+        self.pairs: Dict[frozenset, tuple[int, bool]] = {}
+        self.opponents: Dict[str, str] = {}
+
+        for week, games in data.get("weeks", {}).items():
+            week = int(week)
+            for a, b in games:
+                pair = _pair(a, b)
+
+                # a rematch keeps the current week's slot over any other
+                if pair not in self.pairs or week == self.current_week:
+                    self.pairs[pair] = (week, pair in self.played)
+
+                if week == self.current_week:
+                    self.opponents[normalize_team(a)] = normalize_team(b)
+                    self.opponents[normalize_team(b)] = normalize_team(a)
+
+    def lookup(self, team_a: str, team_b: str) -> Optional[tuple[int, bool]]:
+        return self.pairs.get(_pair(team_a, team_b))
+
+    def is_current_week_game(self, team_a: str, team_b: str) -> bool:
+        hit = self.lookup(team_a, team_b)
+        return hit is not None and hit[0] == self.current_week
+
+    def already_played(self, team_a: str, team_b: str) -> bool:
+        return _pair(team_a, team_b) in self.played
+
+    def opponent(self, team: str) -> Optional[str]:
+        return self.opponents.get(normalize_team(team))
+
+    def note_played(self, team_a: str, team_b: str):
+        pair = _pair(team_a, team_b)
+        self.played.add(pair)
+        if pair in self.pairs:
+            self.pairs[pair] = (self.pairs[pair][0], True)
+
+    def note_unplayed(self, team_a: str, team_b: str):
+        pair = _pair(team_a, team_b)
+        self.played.discard(pair)
+        if pair in self.pairs:
+            self.pairs[pair] = (self.pairs[pair][0], False)
+
+
+_INDEX: Optional[ScheduleIndex] = None
+_INDEX_VERSION = None
+
+
+def schedule_index() -> ScheduleIndex:
+    """The index for the current schedule; rebuilt only when the schedule changes."""
+    global _INDEX, _INDEX_VERSION
+
+    version = STORAGE.version("schedule")
+    if _INDEX is None or version != _INDEX_VERSION:
+        _INDEX = ScheduleIndex(STORAGE.load_schedule())
+        _INDEX_VERSION = version
+
+    return _INDEX
+
+
+def mark_played(team_a: str, team_b: str):
+    global _INDEX_VERSION
+
+    index = schedule_index()
+    STORAGE.mark_played(normalize_team(team_a), normalize_team(team_b))
+
+    # our own write; patch the index instead of rebuilding it
+    index.note_played(team_a, team_b)
+    _INDEX_VERSION = STORAGE.version("schedule")
+
+
+def unmark_played(team_a: str, team_b: str):
+    """Reopens a matchup after its result was voided, so it can be re-reported."""
+    global _INDEX_VERSION
+
+    index = schedule_index()
+    STORAGE.unmark_played(normalize_team(team_a), normalize_team(team_b))
+
+    index.note_unplayed(team_a, team_b)
+    _INDEX_VERSION = STORAGE.version("schedule")
@@ -3,24 +3,41 @@ import asyncio
 import json
 import os
 import base64
-import requests
+import copy
+import time
 from dotenv import load_dotenv
-from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Mapping
 
 from utils.config import NFL_TEAMS, STANDINGS_CHANNEL_ID
+from utils.storage import STORAGE
+from utils.schedule_index import unmark_played
+from utils.ledger import (
+    SEASON,
+    RESULT,
+    VOID,
+    apply_result,
+    replay_season,
+    voided_seqs,
+)
 
 load_dotenv()
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 GITHUB_API_URL = "https://api.github.com/repos/landenj927-coder/sfg-bot/contents/data/standings.json"
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-SCHEDULE_FILE = BASE_DIR / "data" / "schedule.json"
-STANDINGS_FILE = BASE_DIR / "data" / "standings.json"
-
 STANDINGS_LOCK = asyncio.Lock()
 
+# Results are appended to the ledger; standings.json is only rewritten as a
+# snapshot once this many ledger entries have piled up since the last one.
+SNAPSHOT_EVERY = 20
+
+# How long the GitHub sync worker waits after a save before pushing, so a
+# burst of reports on game night becomes a single commit.
+GITHUB_PUSH_DEBOUNCE_SECONDS = float(os.getenv("GITHUB_PUSH_DEBOUNCE_SECONDS", "10"))
+# a failed push is retried after 30s, 60s, ... up to this
+GITHUB_PUSH_RETRY_MAX_SECONDS = float(os.getenv("GITHUB_PUSH_RETRY_MAX_SECONDS", "600"))
+
 TEAM_EMOJIS = {
     "Arizona Cardinals": "<:ArizonaCardinals:1488398835481837609>",
     "Atlanta Falcons": "<:AtlantaFalcons:1448881506905751653>",
@@ -57,27 +74,171 @@ TEAM_EMOJIS = {
 }
 
 
-def get_schedule_teams() -> list[str]:
-    if not SCHEDULE_FILE.exists():
-        return list(NFL_TEAMS)
+def _blank_team_stats() -> Dict[str, int]:
+    return {"wins": 0, "losses": 0, "pf": 0, "pa": 0, "streak": 0}
 
-    try:
-        with open(SCHEDULE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+
+def _freeze(obj):
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+class StandingsRepository:
+    """
+    Process-wide, in-memory standings: the last standings snapshot plus
+    any ledger entries appended after it, with the schedule's team list.
+    Readers get shared read-only views; writers get a private copy from
+    load() and hand it back through save_standings().
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+
+        self._teams_key = None
+        self._teams: tuple[str, ...] = ()
+
+        self._snapshot_key = None
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._view: Optional[Mapping[str, Any]] = None
+
+    # ---------- schedule ----------
+    def schedule_teams(self) -> tuple[str, ...]:
+        key = self.storage.version("schedule")
+        if key is not None and key == self._teams_key:
+            return self._teams
 
         teams = []
-        for games in data.get("weeks", {}).values():
-            for team1, team2 in games:
-                if team1 not in teams:
-                    teams.append(team1)
-                if team2 not in teams:
-                    teams.append(team2)
+        try:
+            data = self.storage.load_schedule() or {}
+            for games in data.get("weeks", {}).values():
+                for team1, team2 in games:
+                    if team1 not in teams:
+                        teams.append(team1)
+                    if team2 not in teams:
+                        teams.append(team2)
+        except Exception as e:
+            print(f"Error loading schedule teams: {e}")
+            teams = []
+
+        self._teams = tuple(teams or NFL_TEAMS)
+        self._teams_key = key
+        return self._teams
+
+    def current_week(self) -> int:
+        data = self.storage.load_schedule() or {}
+        return int(data.get("current_week", 1))
+
+    # ---------- standings ----------
+    def snapshot_seq(self) -> int:
+        raw = self.storage.load_standings() or {}
+        return int(raw.get("ledger_seq", 0))
+
+    def _apply_tail(self, data: Dict[str, Any], tail: list[Dict[str, Any]]):
+        for e in tail:
+            kind = e.get("type")
+
+            if kind == SEASON:
+                data["season"] = int(e["season"])
+                data["teams"] = {t: {**_blank_team_stats(), **st} for t, st in e["base"].items()}
+                continue
+
+            if int(e.get("season", data["season"])) != int(data["season"]):
+                continue
+
+            if kind == RESULT:
+                for team in (e["t1"], e["t2"]):
+                    data["teams"].setdefault(team, _blank_team_stats())
+                apply_result(data["teams"], e)
+
+            elif kind == VOID:
+                # streaks can't be un-applied, so corrections replay the season
+                upto = [x for x in self.storage.games() if int(x["seq"]) <= int(e["seq"])]
+                rebuilt = replay_season(upto, int(data["season"]), _blank_team_stats)
+                if rebuilt is None:
+                    print(f"⚠️ Ledger void #{e['seq']} has no season start to replay from")
+                else:
+                    data["teams"] = rebuilt
+
+        data["ledger_seq"] = int(tail[-1]["seq"])
+
+    def _build_snapshot(self, raw: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if raw is None:
+            data = _fresh_standings_data()
+        else:
+            data = copy.deepcopy(raw)
+
+        data.setdefault("season", 1)
+        data.setdefault("standings_message_id", None)
+        data.setdefault("teams", {})
+        data.setdefault("ledger_seq", 0)
+
+        tail = self.storage.games_after(int(data["ledger_seq"]))
+        if tail:
+            self._apply_tail(data, tail)
+
+        for team in self.schedule_teams():
+            stats = data["teams"].setdefault(team, _blank_team_stats())
+            for key, value in _blank_team_stats().items():
+                stats.setdefault(key, value)
+
+        return data
+
+    def _current(self) -> Dict[str, Any]:
+        raw = self.storage.load_standings()
+        key = (
+            self.storage.version("standings"),
+            self.storage.version("schedule"),
+            self.storage.version("games"),
+        )
 
-        return teams or list(NFL_TEAMS)
+        if self._snapshot is None or key != self._snapshot_key:
+            self._snapshot = self._build_snapshot(raw)
+            self._snapshot_key = key
+            self._view = None
+
+        return self._snapshot
+
+    def view(self) -> Mapping[str, Any]:
+        """Read-only standings shared by every reader until the next change."""
+        current = self._current()
+        if self._view is None:
+            self._view = _freeze(current)
+        return self._view
+
+    def load(self) -> Dict[str, Any]:
+        """Private mutable copy for read-modify-write callers."""
+        return copy.deepcopy(self._current())
+
+    def save(self, data: Dict[str, Any]):
+        self.storage.save_standings(data)
+        self._snapshot = None
+        self._view = None
+
+    def invalidate(self):
+        self.storage.invalidate()
+        self._teams_key = None
+        self._snapshot = None
+        self._view = None
+
+    def stats(self) -> Dict[str, Any]:
+        parses = self.storage.parse_counts()
+        return {
+            "backend": self.storage.name,
+            "standings_parses": parses.get("standings", 0),
+            "schedule_parses": parses.get("schedule", 0),
+            "ledger_entries": len(self.storage.games()),
+            "unsnapshotted_entries": self.storage.last_game_seq() - self.snapshot_seq(),
+        }
 
-    except Exception as e:
-        print(f"Error loading schedule teams: {e}")
-        return list(NFL_TEAMS)
+
+STANDINGS_REPO = StandingsRepository(STORAGE)
+
+
+def get_schedule_teams() -> list[str]:
+    return list(STANDINGS_REPO.schedule_teams())
 
 
 def get_active_teams():
@@ -91,48 +252,29 @@ def _fresh_standings_data(season: int = 1, standings_message_id=None) -> Dict[st
         "season": season,
         "standings_message_id": standings_message_id,
         "teams": {
-            team: {"wins": 0, "losses": 0, "pf": 0, "pa": 0, "streak": 0}
+            team: _blank_team_stats()
             for team in teams
         }
     }
 
 
 def load_standings() -> Dict[str, Any]:
-    if not STANDINGS_FILE.exists():
-        return _fresh_standings_data()
-
-    with open(STANDINGS_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    data.setdefault("season", 1)
-    data.setdefault("standings_message_id", None)
-    data.setdefault("teams", {})
-
-    for team in get_schedule_teams():
-        if team not in data["teams"]:
-            data["teams"][team] = {
-                "wins": 0,
-                "losses": 0,
-                "pf": 0,
-                "pa": 0,
-                "streak": 0,
-            }
-        else:
-            data["teams"][team].setdefault("wins", 0)
-            data["teams"][team].setdefault("losses", 0)
-            data["teams"][team].setdefault("pf", 0)
-            data["teams"][team].setdefault("pa", 0)
-            data["teams"][team].setdefault("streak", 0)
+    return STANDINGS_REPO.load()
+
 
-    return data
+def standings_view() -> Mapping[str, Any]:
+    """Read-only standings for display code (no copy, no disk read)."""
+    return STANDINGS_REPO.view()
 
 
-def push_standings_to_github(data: Dict[str, Any]):
+def push_standings_to_github(data: Dict[str, Any]) -> bool:
     if not GITHUB_TOKEN:
         print("⚠️ GITHUB_TOKEN not set. Standings saved locally only.")
-        return
+        return False
 
     try:
+        import requests  # only needed on the sync worker's thread
+
         headers = {
             "Authorization": f"Bearer {GITHUB_TOKEN}",
             "Accept": "application/vnd.github+json",
@@ -165,20 +307,201 @@ def push_standings_to_github(data: Dict[str, Any]):
 
         if put_resp.status_code in (200, 201):
             print("✅ standings.json pushed to GitHub")
-        else:
-            print(f"⚠️ GitHub standings push failed: {put_resp.status_code} {put_resp.text[:300]}")
+            return True
+
+        print(f"⚠️ GitHub standings push failed: {put_resp.status_code} {put_resp.text[:300]}")
+        return False
 
     except Exception as e:
         print(f"⚠️ GitHub standings push error: {type(e).__name__}: {e}")
+        return False
+
+
+# =========================
+# WRITE-BEHIND GITHUB SYNC
+# =========================
+_SYNC_TASK: Optional[asyncio.Task] = None
+_SYNC_WAKE: Optional[asyncio.Event] = None
+_SYNC_IN_FLIGHT: Optional[asyncio.Future] = None
+_PENDING_PUSH: Optional[Dict[str, Any]] = None
+_PUSH_FAILURES = 0  # consecutive failed pushes; drives the retry backoff
+
+SYNC_STATS: Dict[str, Any] = {
+    "queued_saves": 0,     # saves waiting for the next push (queue depth)
+    "pushes": 0,
+    "failed_pushes": 0,
+    "coalesced_saves": 0,  # saves folded into someone else's push
+    "last_push_at": None,
+    "last_push_seconds": None,
+}
+
+
+def _sync_worker_running() -> bool:
+    return _SYNC_TASK is not None and not _SYNC_TASK.done()
+
+
+def _queue_github_push(data: Dict[str, Any]):
+    global _PENDING_PUSH
+
+    if not _sync_worker_running():
+        # no event loop worker (scripts, or before setup_hook) -> push inline
+        push_standings_to_github(data)
+        return
+
+    # only the newest snapshot matters; older queued ones are superseded
+    _PENDING_PUSH = copy.deepcopy(data)
+    SYNC_STATS["queued_saves"] += 1
+    _SYNC_WAKE.set()
+
+
+async def _push_pending():
+    global _PENDING_PUSH, _SYNC_IN_FLIGHT, _PUSH_FAILURES
+
+    data = _PENDING_PUSH
+    if data is None:
+        return
+
+    _PENDING_PUSH = None
+    queued = SYNC_STATS["queued_saves"]
+    SYNC_STATS["queued_saves"] = 0
+    SYNC_STATS["coalesced_saves"] += max(0, queued - 1)
+
+    started = time.perf_counter()
+    _SYNC_IN_FLIGHT = asyncio.ensure_future(asyncio.to_thread(push_standings_to_github, data))
+
+    try:
+        # shielded so a shutdown flush can wait on the same push instead of
+        # abandoning it halfway
+        ok = await asyncio.shield(_SYNC_IN_FLIGHT)
+    finally:
+        if _SYNC_IN_FLIGHT.done():
+            _SYNC_IN_FLIGHT = None
+
+    SYNC_STATS["pushes" if ok else "failed_pushes"] += 1
+    SYNC_STATS["last_push_at"] = time.time()
+    SYNC_STATS["last_push_seconds"] = round(time.perf_counter() - started, 3)
+
+    if ok or not GITHUB_TOKEN:
+        _PUSH_FAILURES = 0
+        return
+
+    # keep it pending until a push lands, unless a newer save superseded it
+    _PUSH_FAILURES += 1
+    if _PENDING_PUSH is None:
+        _PENDING_PUSH = data
+        SYNC_STATS["queued_saves"] += 1
+
+
+def _retry_delay() -> float:
+    return min(GITHUB_PUSH_RETRY_MAX_SECONDS, 30 * 2 ** (_PUSH_FAILURES - 1))
+
+
+async def _github_sync_worker():
+    while True:
+        await _SYNC_WAKE.wait()
+
+        # let the rest of the burst land before committing
+        await asyncio.sleep(GITHUB_PUSH_DEBOUNCE_SECONDS)
+
+        _SYNC_WAKE.clear()
+        try:
+            await _push_pending()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"⚠️ Standings sync worker error: {type(e).__name__}: {e}")
+
+        if _PUSH_FAILURES and _PENDING_PUSH is not None:
+            delay = _retry_delay()
+            print(f"🔁 Retrying standings push in {delay:.0f}s (attempt {_PUSH_FAILURES + 1})")
+            await asyncio.sleep(delay)
+            _SYNC_WAKE.set()
+
+
+def start_standings_sync():
+    """
+    Starts the background GitHub sync worker. Must be called from inside
+    the running event loop (SFGBot.setup_hook).
+    """
+    global _SYNC_TASK, _SYNC_WAKE
+
+    if _sync_worker_running():
+        return
+
+    _SYNC_WAKE = asyncio.Event()
+    _SYNC_TASK = asyncio.create_task(_github_sync_worker(), name="standings-github-sync")
+
+
+async def flush_standings():
+    """
+    Stops the sync worker and pushes whatever is still queued.
+    Call on shutdown so the last reports of the night reach GitHub.
+    """
+    global _SYNC_TASK, _PENDING_PUSH
+
+    task = _SYNC_TASK
+    _SYNC_TASK = None
+
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    if _SYNC_IN_FLIGHT is not None:
+        await _SYNC_IN_FLIGHT
+
+    # fold the ledger tail into the standings snapshot so the next cold start
+    # doesn't have to replay it
+    if STORAGE.last_game_seq() > STANDINGS_REPO.snapshot_seq():
+        data = load_standings()
+        _write_snapshot(data)
+        _PENDING_PUSH = data
+
+    await _push_pending()
+
+
+def standings_queue_depth() -> int:
+    return SYNC_STATS["queued_saves"]
+
+
+def _write_snapshot(data: Dict[str, Any]):
+    # a dict that didn't come from load_standings() is taken to be current
+    data.setdefault("ledger_seq", STORAGE.last_game_seq())
+
+    STANDINGS_REPO.save(data)
 
 
 def save_standings(data: Dict[str, Any]):
-    STANDINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    _write_snapshot(data)
+    _queue_github_push(data)
 
-    with open(STANDINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
 
-    push_standings_to_github(data)
+def _after_ledger_append():
+    data = load_standings()
+
+    if STORAGE.last_game_seq() - STANDINGS_REPO.snapshot_seq() >= SNAPSHOT_EVERY:
+        save_standings(data)
+    else:
+        # the ledger line is the local write; only the GitHub mirror needs the table
+        _queue_github_push(data)
+
+
+def _ensure_season_start(season: int):
+    for e in reversed(STORAGE.games()):
+        if e.get("type") == SEASON:
+            if int(e["season"]) == season:
+                return
+            break
+
+    # first ledger write of this season (or ever): anchor replay on the
+    # table as it stands right now
+    STORAGE.append_game({
+        "type": SEASON,
+        "season": season,
+        "base": load_standings()["teams"],
+    })
 
 
 def reset_standings(season: int = 1, standings_message_id=None):
@@ -186,40 +509,105 @@ def reset_standings(season: int = 1, standings_message_id=None):
         season=season,
         standings_message_id=standings_message_id,
     )
+
+    entry = STORAGE.append_game({"type": SEASON, "season": season, "base": data["teams"]})
+    data["ledger_seq"] = entry["seq"]
+
     save_standings(data)
 
 
-def update_game_result(team1: str, team2: str, score1: int, score2: int):
-    data = load_standings()
+def update_game_result(
+    team1: str,
+    team2: str,
+    score1: int,
+    score2: int,
+    week: Optional[int] = None,
+    source: str = "gamereport",
+) -> Dict[str, Any]:
+    """
+    Records a result in the game ledger and returns its entry
+    (entry["seq"] is the game number used by corrections).
+    """
+    data = standings_view()
 
     if team1 not in data["teams"] or team2 not in data["teams"]:
         raise ValueError(
             f"One or both team names are invalid: '{team1}' vs '{team2}'"
         )
 
-    t1 = data["teams"][team1]
-    t2 = data["teams"][team2]
-
-    score1 = int(score1)
-    score2 = int(score2)
+    season = int(data.get("season", 1))
+    _ensure_season_start(season)
 
-    t1["pf"] += score1
-    t1["pa"] += score2
-    t2["pf"] += score2
-    t2["pa"] += score1
-
-    if score1 > score2:
-        t1["wins"] += 1
-        t2["losses"] += 1
-        t1["streak"] = t1["streak"] + 1 if t1["streak"] >= 0 else 1
-        t2["streak"] = t2["streak"] - 1 if t2["streak"] <= 0 else -1
-    elif score2 > score1:
-        t2["wins"] += 1
-        t1["losses"] += 1
-        t2["streak"] = t2["streak"] + 1 if t2["streak"] >= 0 else 1
-        t1["streak"] = t1["streak"] - 1 if t1["streak"] <= 0 else -1
-
-    save_standings(data)
+    entry = STORAGE.append_game({
+        "type": RESULT,
+        "season": season,
+        "week": int(week) if week is not None else STANDINGS_REPO.current_week(),
+        "t1": team1,
+        "t2": team2,
+        "s1": int(score1),
+        "s2": int(score2),
+        "src": source,
+    })
+
+    _after_ledger_append()
+    return entry
+
+
+def void_game_result(seq: int, source: str = "correction", reason: str = "") -> Dict[str, Any]:
+    """
+    Cancels an earlier result by its game number and reopens the matchup so
+    the corrected result can be reported. Returns the voided entry.
+    """
+    entry = STORAGE.get_game(int(seq))
+    if not entry or entry.get("type") != RESULT:
+        raise ValueError(f"No game #{seq} in the ledger.")
+
+    if int(seq) in voided_seqs(STORAGE.games()):
+        raise ValueError(f"Game #{seq} was already voided.")
+
+    season = int(standings_view().get("season", 1))
+    if int(entry.get("season", season)) != season:
+        raise ValueError(f"Game #{seq} belongs to season {entry.get('season')}, not the current season.")
+
+    STORAGE.append_game({
+        "type": VOID,
+        "season": season,
+        "ref": int(seq),
+        "src": source,
+        "reason": reason[:200],
+    })
+
+    # reopen the matchup for a corrected report, unless another result
+    # between the same two teams still stands this season
+    pair = {entry["t1"], entry["t2"]}
+    games = STORAGE.games()
+    voided = voided_seqs(games)
+    if not any(
+        g.get("type") == RESULT
+        and int(g["seq"]) not in voided
+        and int(g.get("season", season)) == season
+        and {g["t1"], g["t2"]} == pair
+        for g in games
+    ):
+        unmark_played(entry["t1"], entry["t2"])
+
+    _after_ledger_append()
+    return entry
+
+
+def standings_at_week(week: int, season: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Replays the ledger up to and including `week`. Returns None when the
+    season started before the ledger existed.
+    """
+    if season is None:
+        season = int(standings_view().get("season", 1))
+
+    teams = replay_season(STORAGE.games(), int(season), _blank_team_stats, upto_week=int(week))
+    if teams is None:
+        return None
+
+    return {"season": season, "teams": teams}
 
 
 def _rank_display(rank: int) -> str:
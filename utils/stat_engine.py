@@ -0,0 +1,299 @@
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+# Ratings are per-game figures. Season ratings average them, weighted by
+# this column (completions stand in for attempts, which exports don't
+# carry); None weights every game the same.
+RATING_WEIGHTS = {"qbr": "comp", "rtng": None}
+
+# week/season/game of a statline recorded before those were tagged
+UNTAGGED = -1
+
+
+def player_key(roblox_id, name):
+    """Roblox id when we have one, so renames don't split a player's totals."""
+    return str(roblox_id) if roblox_id else f"name:{name}"
+
+
+def _tag(value) -> int:
+    return UNTAGGED if value is None else int(value)
+
+
+class PositionTable:
+    """
+    One position's statlines as columns, one row per statline. Players and
+    teams are interned to integer ids so every aggregate is a bincount.
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = tuple(columns)
+        self.col = {c: i for i, c in enumerate(self.columns)}
+
+        self.keys: list[str] = []
+        self.names: list[str] = []   # latest name per player
+        self.teams: list[str] = []   # latest team per player
+        self.team_names: list[str] = []
+        self._key_ix: Dict[str, int] = {}
+        self._team_ix: Dict[str, int] = {}
+
+        self.player = np.zeros(0, dtype=np.int32)
+        self.team = np.zeros(0, dtype=np.int32)
+        self.game = np.zeros(0, dtype=np.int64)
+        self.week = np.zeros(0, dtype=np.int32)
+        self.season = np.zeros(0, dtype=np.int32)
+        self.values = np.zeros((0, len(self.columns)))
+
+        # batches of rows (as column lists) added since the arrays were built
+        self._pending: list[tuple] = []
+
+    def __len__(self):
+        return len(self.player) + sum(len(batch[0]) for batch in self._pending)
+
+    def extend(self, lines: Sequence[Dict[str, Any]]) -> list[str]:
+        """Adds statlines of this position; returns their player keys."""
+        key_ix, team_ix = self._key_ix, self._team_ix
+        names, teams = self.names, self.teams
+        keys = [player_key(line.get("rid"), line["player"]) for line in lines]
+
+        players = []
+        team_ids = []
+        for key, line in zip(keys, lines):
+            team = line.get("team") or ""
+
+            ix = key_ix.get(key)
+            if ix is None:
+                ix = key_ix[key] = len(self.keys)
+                self.keys.append(key)
+                names.append(line["player"])
+                teams.append(team)
+            else:
+                names[ix] = line["player"]
+                teams[ix] = team
+            players.append(ix)
+
+            t = team_ix.get(team)
+            if t is None:
+                t = team_ix[team] = len(self.team_names)
+                self.team_names.append(team)
+            team_ids.append(t)
+
+        columns = self.columns
+        self._pending.append((
+            players,
+            team_ids,
+            [_tag(line.get("game")) for line in lines],
+            [_tag(line.get("week")) for line in lines],
+            [_tag(line.get("season")) for line in lines],
+            [[line["stats"].get(c) or 0 for c in columns] for line in lines],
+        ))
+        return keys
+
+    def rename(self, key: str, name: str) -> bool:
+        """Shows `key`'s rows under `name` until a newer statline names them."""
+        ix = self._key_ix.get(key)
+        if ix is None or not name or self.names[ix] == name:
+            return False
+        self.names[ix] = name
+        return True
+
+    def _flush(self):
+        if not self._pending:
+            return
+
+        width = len(self.columns)
+        player, team, game, week, season, values = (
+            [x for batch in self._pending for x in batch[i]] for i in range(6)
+        )
+        self._pending.clear()
+
+        self.player = np.concatenate([self.player, np.array(player, dtype=np.int32)])
+        self.team = np.concatenate([self.team, np.array(team, dtype=np.int32)])
+        self.game = np.concatenate([self.game, np.array(game, dtype=np.int64)])
+        self.week = np.concatenate([self.week, np.array(week, dtype=np.int32)])
+        self.season = np.concatenate([self.season, np.array(season, dtype=np.int32)])
+        self.values = np.vstack([self.values, np.array(values, dtype=float).reshape(-1, width)])
+
+    def mask(self, season=None, weeks=None, exclude_games: Iterable[int] = ()) -> np.ndarray:
+        """Rows in `season` (plus untagged ones), weeks lo..hi, not in `exclude_games`."""
+        self._flush()
+        m = np.ones(len(self.player), dtype=bool)
+
+        if season is not None:
+            m &= (self.season == int(season)) | (self.season == UNTAGGED)
+        if weeks is not None:
+            lo, hi = weeks
+            m &= (self.week >= lo) & (self.week <= hi)
+
+        exclude = np.fromiter(exclude_games, dtype=np.int64)
+        if len(exclude):
+            m &= ~np.isin(self.game, exclude)
+        return m
+
+    def games_played(self, m: np.ndarray, by: str = "player") -> np.ndarray:
+        groups, n = self._groups(by)
+        if by == "team":
+            # a team has several players per game; count distinct games
+            games = self.game[m] - UNTAGGED
+            stride = int(games.max(initial=0)) + 1
+            pairs = np.unique(groups[m].astype(np.int64) * stride + games)
+            return np.bincount(pairs // stride, minlength=n)
+        return np.bincount(groups[m], minlength=n)
+
+    def _groups(self, by: str):
+        if by == "team":
+            return self.team, len(self.team_names)
+        return self.player, len(self.keys)
+
+    def totals(self, m: np.ndarray, by: str = "player") -> np.ndarray:
+        """(groups x columns): stat sums, with rating columns as weighted means."""
+        groups, n = self._groups(by)
+        groups = groups[m]
+        values = self.values[m]
+
+        out = np.zeros((n, len(self.columns)))
+        for i, stat in enumerate(self.columns):
+            column = values[:, i]
+
+            if stat not in RATING_WEIGHTS:
+                out[:, i] = np.bincount(groups, weights=column, minlength=n)
+                continue
+
+            weight_col = RATING_WEIGHTS[stat]
+            if weight_col in self.col:
+                weights = np.maximum(values[:, self.col[weight_col]], 1.0)
+            else:
+                weights = np.ones_like(column)
+
+            num = np.bincount(groups, weights=column * weights, minlength=n)
+            den = np.bincount(groups, weights=weights, minlength=n)
+            np.divide(num, den, out=out[:, i], where=den > 0)
+
+        return out
+
+    def averages(self, m: np.ndarray, by: str = "player") -> np.ndarray:
+        """Per-game figures; rating columns are already per game."""
+        totals = self.totals(m, by)
+        games = self.games_played(m, by)[:, None]
+
+        out = np.zeros_like(totals)
+        np.divide(totals, games, out=out, where=games > 0)
+        for stat in RATING_WEIGHTS:
+            if stat in self.col:
+                out[:, self.col[stat]] = totals[:, self.col[stat]]
+        return out
+
+
+def _cell(stat: str, value: float, per_game: bool):
+    if stat in RATING_WEIGHTS:
+        return round(float(value), 1)
+    if per_game:
+        return round(float(value), 2)
+    return int(round(value))
+
+
+class StatEngine:
+    """Per-position PositionTables with a shared set of excluded (voided) games."""
+
+    def __init__(self, columns: Dict[str, Sequence[str]]):
+        self.columns = {pos: tuple(cols) for pos, cols in columns.items()}
+        self.tables: Dict[str, PositionTable] = {}
+        self.excluded: set[int] = set()
+        self.reset()
+
+    def reset(self, exclude_games: Iterable[int] = ()):
+        self.tables = {pos: PositionTable(cols) for pos, cols in self.columns.items()}
+        self.excluded = {int(g) for g in exclude_games}
+
+    def load(self, lines: Iterable[Dict[str, Any]], exclude_games: Iterable[int] = ()):
+        self.reset(exclude_games)
+        self.append(lines)
+
+    def append(self, lines: Iterable[Dict[str, Any]]) -> list[tuple[str, str]]:
+        """Adds statlines; returns the (position, player key) of each."""
+        by_pos: Dict[str, list] = {}
+        for line in lines:
+            by_pos.setdefault(line["pos"], []).append(line)
+
+        return [
+            (pos, key)
+            for pos, batch in by_pos.items()
+            for key in self.tables[pos].extend(batch)
+        ]
+
+    def rename_player(self, roblox_id, name: str) -> list[tuple[str, str]]:
+        """Renames a Roblox player at every position; returns the (position, player key) changed."""
+        key = player_key(roblox_id, name)
+        return [(pos, key) for pos, table in self.tables.items() if table.rename(key, name)]
+
+    def _mask(self, table: PositionTable, season, weeks):
+        return table.mask(season=season, weeks=weeks, exclude_games=self.excluded)
+
+    def _row(self, table: PositionTable, values, games, per_game: bool, name: str, team: str):
+        row = {"player": name, "team": team, "games": int(games)}
+        for i, stat in enumerate(table.columns):
+            row[stat] = _cell(stat, values[i], per_game)
+        return row
+
+    def player_rows(
+        self,
+        pos: str,
+        season=None,
+        weeks=None,
+        keys: Optional[Iterable[str]] = None,
+        per_game: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """key -> {"player", "team", "games", <stat>...} for players with a game in range."""
+        table = self.tables[pos]
+        m = self._mask(table, season, weeks)
+        table_values = table.averages(m) if per_game else table.totals(m)
+        games = table.games_played(m)
+
+        if keys is None:
+            ixs = np.flatnonzero(games)
+        else:
+            ixs = [table._key_ix[k] for k in keys if k in table._key_ix]
+
+        return {
+            table.keys[ix]: self._row(table, table_values[ix], games[ix], per_game, table.names[ix], table.teams[ix])
+            for ix in ixs
+            if games[ix]
+        }
+
+    def leaders(
+        self,
+        pos: str,
+        stat: str,
+        n: int,
+        season=None,
+        weeks=None,
+        per_game: bool = False,
+    ) -> list[tuple[str, Dict[str, Any]]]:
+        table = self.tables[pos]
+        m = self._mask(table, season, weeks)
+        table_values = table.averages(m) if per_game else table.totals(m)
+        games = table.games_played(m)
+
+        column = table_values[:, table.col[stat]]
+        ixs = np.flatnonzero(games)
+        if len(ixs) > n:
+            ixs = ixs[np.argpartition(-column[ixs], n - 1)[:n]]
+
+        ranked = sorted(ixs, key=lambda ix: (-column[ix], table.names[ix].casefold()))
+        return [
+            (table.keys[ix], self._row(table, table_values[ix], games[ix], per_game, table.names[ix], table.teams[ix]))
+            for ix in ranked
+        ]
+
+    def team_rows(self, pos: str, season=None, weeks=None, per_game: bool = False) -> Dict[str, Dict[str, Any]]:
+        """team -> position totals (or per-game figures) for that team's statlines."""
+        table = self.tables[pos]
+        m = self._mask(table, season, weeks)
+        table_values = table.averages(m, by="team") if per_game else table.totals(m, by="team")
+        games = table.games_played(m, by="team")
+
+        return {
+            team: self._row(table, table_values[t], games[t], per_game, team, team)
+            for t, team in enumerate(table.team_names)
+            if games[t]
+        }
@@ -0,0 +1,844 @@
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from utils.ledger import AppendOnlyLog, GameLedger
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / "data"
+
+STANDINGS_FILE = DATA_DIR / "standings.json"
+SCHEDULE_FILE = DATA_DIR / "schedule.json"
+LEDGER_FILE = DATA_DIR / "ledger.jsonl"
+STATLINES_FILE = DATA_DIR / "statlines.jsonl"
+SQLITE_FILE = DATA_DIR / "sfg.sqlite3"
+
+# historically relative to the working directory
+ROBLOX_DISCORD_CACHE_FILE = "roblox_discord_cache.json"
+
+# "json" keeps the original flat files; "sqlite" uses data/sfg.sqlite3 (WAL)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "json").strip().lower()
+
+STAT_POSITIONS = ("QB", "WR", "DB", "DE")
+
+
+def _played_key(team_a: str, team_b: str) -> list[str]:
+    return sorted([team_a.strip(), team_b.strip()])
+
+
+def _snapshot_seq(standings: Optional[Dict[str, Any]]) -> int:
+    """
+    The last game the standings snapshot already includes. New games must
+    number after it: the snapshot can outlive the ledger (it is mirrored to
+    GitHub, the ledger isn't), and replay only reads games past it.
+    """
+    return int((standings or {}).get("ledger_seq", 0))
+
+
+# =========================
+# CACHED JSON FILES
+# =========================
+class CachedJSONFile:
+    """
+    Keeps the parsed contents of a JSON file in memory and only re-reads it
+    when the file's mtime/size changes on disk.
+    """
+
+    def __init__(self, path: Path, indent: int = 4):
+        self.path = Path(path)
+        self.indent = indent
+        self.parses = 0
+        self._stamp = None
+        self._data = None
+
+    def _current_stamp(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def get(self):
+        """Returns the cached parse (or None if the file doesn't exist). Do not mutate it."""
+        stamp = self._current_stamp()
+        if stamp is None:
+            self._stamp = None
+            self._data = None
+            return None
+
+        if stamp != self._stamp:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._data = json.load(f)
+            self._stamp = stamp
+            self.parses += 1
+
+        return self._data
+
+    def version(self):
+        self.get()
+        return self._stamp
+
+    def write(self, data):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temp file and swap it in, so a crash mid-write never
+        # leaves a truncated file behind
+        tmp_file = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=self.indent)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_file, self.path)
+
+        # don't re-parse our own write
+        self._data = copy.deepcopy(data)
+        self._stamp = self._current_stamp()
+
+    def invalidate(self):
+        self._stamp = None
+        self._data = None
+
+
+# =========================
+# JSON BACKEND
+# =========================
+class JSONStorage:
+    """The original layout: whole-file JSON documents plus the ledger file."""
+
+    name = "json"
+
+    def __init__(self):
+        self.standings_file = CachedJSONFile(STANDINGS_FILE)
+        self.schedule_file = CachedJSONFile(SCHEDULE_FILE)
+        self.links_file = CachedJSONFile(Path(ROBLOX_DISCORD_CACHE_FILE), indent=2)
+        self.ledger = GameLedger(LEDGER_FILE)
+        self.statline_log = AppendOnlyLog(STATLINES_FILE)
+
+        # never persisted by this backend (same as before it existed)
+        self._cooldowns: Dict[tuple[str, int], float] = {}
+
+    # ---------- versions ----------
+    def version(self, key: str):
+        if key == "standings":
+            return self.standings_file.version()
+        if key == "schedule":
+            return self.schedule_file.version()
+        if key == "games":
+            return self.ledger.version()
+        raise KeyError(key)
+
+    def parse_counts(self) -> Dict[str, int]:
+        return {
+            "standings": self.standings_file.parses,
+            "schedule": self.schedule_file.parses,
+        }
+
+    def invalidate(self):
+        self.standings_file.invalidate()
+        self.schedule_file.invalidate()
+        self.links_file.invalidate()
+
+    # ---------- standings ----------
+    def load_standings(self) -> Optional[Dict[str, Any]]:
+        return self.standings_file.get()
+
+    def save_standings(self, data: Dict[str, Any]):
+        self.standings_file.write(data)
+
+    # ---------- games (ledger) ----------
+    def games(self) -> list[Dict[str, Any]]:
+        return self.ledger.entries()
+
+    def games_after(self, seq: int) -> list[Dict[str, Any]]:
+        return self.ledger.entries_after(seq)
+
+    def get_game(self, seq: int) -> Optional[Dict[str, Any]]:
+        return self.ledger.get(seq)
+
+    def last_game_seq(self) -> int:
+        return self.ledger.last_seq()
+
+    def append_game(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        return self.ledger.append(entry, after=_snapshot_seq(self.load_standings()))
+
+    # ---------- schedule ----------
+    def load_schedule(self) -> Optional[Dict[str, Any]]:
+        return self.schedule_file.get()
+
+    def save_schedule(self, data: Dict[str, Any]):
+        self.schedule_file.write(data)
+
+    def mark_played(self, team_a: str, team_b: str):
+        data = copy.deepcopy(self.schedule_file.get())
+        if not data:
+            return
+
+        played = data.setdefault("played", [])
+        matchup = _played_key(team_a, team_b)
+        if matchup not in played:
+            played.append(matchup)
+            self.schedule_file.write(data)
+
+    def unmark_played(self, team_a: str, team_b: str):
+        data = copy.deepcopy(self.schedule_file.get())
+        if not data:
+            return
+
+        played = data.get("played", [])
+        matchup = _played_key(team_a, team_b)
+        if matchup in played:
+            data["played"] = [p for p in played if p != matchup]
+            self.schedule_file.write(data)
+
+    # ---------- roblox <-> discord links ----------
+    def load_links(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = self.links_file.get() or {}
+        except Exception:
+            data = {}
+
+        return {
+            "discord_to_roblox": dict(data.get("discord_to_roblox", {})),
+            "roblox_to_discord": dict(data.get("roblox_to_discord", {})),
+        }
+
+    def save_links(self, cache: Dict[str, Dict[str, Any]]):
+        self.links_file.write(cache)
+
+    def save_link(self, entry: Dict[str, Any]):
+        self.save_link_batch([entry])
+
+    def save_link_batch(self, entries: list[Dict[str, Any]]):
+        """Upserts many links with one file write."""
+        cache = self.load_links()
+        for entry in entries:
+            cache["discord_to_roblox"][str(entry["discord_id"])] = entry
+            cache["roblox_to_discord"][str(entry["roblox_id"])] = entry["discord_id"]
+        self.save_links(cache)
+
+    def delete_links(self, roblox_ids: list):
+        drop = {str(r) for r in roblox_ids}
+        cache = self.load_links()
+        cache["roblox_to_discord"] = {r: d for r, d in cache["roblox_to_discord"].items() if r not in drop}
+        cache["discord_to_roblox"] = {
+            d: e for d, e in cache["discord_to_roblox"].items() if str(e.get("roblox_id")) not in drop
+        }
+        self.save_links(cache)
+
+    # ---------- cooldowns ----------
+    def get_cooldown(self, scope: str, user_id: int) -> float:
+        return self._cooldowns.get((scope, int(user_id)), 0)
+
+    def set_cooldown(self, scope: str, user_id: int, ts: float):
+        self._cooldowns[(scope, int(user_id))] = ts
+
+    # ---------- player statlines ----------
+    def statlines(self) -> list[Dict[str, Any]]:
+        return self.statline_log.entries()
+
+    def append_statlines(self, lines: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+        return self.statline_log.append_many(lines)
+
+    def close(self):
+        pass
+
+
+# =========================
+# SQLITE BACKEND
+# =========================
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key     TEXT PRIMARY KEY,
+    value   TEXT,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS teams (
+    team   TEXT PRIMARY KEY,
+    wins   INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    pf     INTEGER NOT NULL DEFAULT 0,
+    pa     INTEGER NOT NULL DEFAULT 0,
+    streak INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS games (
+    seq    INTEGER PRIMARY KEY,
+    type   TEXT NOT NULL,
+    season INTEGER,
+    week   INTEGER,
+    team1  TEXT,
+    team2  TEXT,
+    score1 INTEGER,
+    score2 INTEGER,
+    ref    INTEGER,
+    source TEXT,
+    ts     INTEGER,
+    extra  TEXT
+);
+CREATE INDEX IF NOT EXISTS games_season_week ON games (season, week);
+
+CREATE TABLE IF NOT EXISTS schedule_games (
+    week  INTEGER NOT NULL,
+    slot  INTEGER NOT NULL,
+    team1 TEXT NOT NULL,
+    team2 TEXT NOT NULL,
+    PRIMARY KEY (week, slot)
+);
+CREATE INDEX IF NOT EXISTS schedule_games_team1 ON schedule_games (team1);
+CREATE INDEX IF NOT EXISTS schedule_games_team2 ON schedule_games (team2);
+
+CREATE TABLE IF NOT EXISTS played (
+    team_a TEXT NOT NULL,
+    team_b TEXT NOT NULL,
+    PRIMARY KEY (team_a, team_b)
+);
+
+CREATE TABLE IF NOT EXISTS player_links (
+    roblox_id            INTEGER PRIMARY KEY,
+    discord_id           INTEGER NOT NULL,
+    discord_name         TEXT,
+    discord_display_name TEXT,
+    roblox_username      TEXT,
+    roblox_display_name  TEXT,
+    updated_at           INTEGER
+);
+CREATE INDEX IF NOT EXISTS player_links_discord ON player_links (discord_id);
+CREATE INDEX IF NOT EXISTS player_links_username ON player_links (lower(roblox_username));
+
+CREATE TABLE IF NOT EXISTS cooldowns (
+    scope   TEXT NOT NULL,
+    user_id INTEGER NOT NULL,
+    ts      REAL NOT NULL,
+    PRIMARY KEY (scope, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS statlines (
+    seq       INTEGER PRIMARY KEY,
+    game      INTEGER,
+    season    INTEGER,
+    week      INTEGER,
+    position  TEXT NOT NULL,
+    roblox_id INTEGER,
+    player    TEXT NOT NULL,
+    team      TEXT,
+    stats     TEXT NOT NULL,
+    ts        INTEGER
+);
+CREATE INDEX IF NOT EXISTS statlines_game ON statlines (game);
+CREATE INDEX IF NOT EXISTS statlines_player ON statlines (position, roblox_id);
+"""
+
+_GAME_COLUMNS = {
+    "seq": "seq",
+    "type": "type",
+    "season": "season",
+    "week": "week",
+    "t1": "team1",
+    "t2": "team2",
+    "s1": "score1",
+    "s2": "score2",
+    "ref": "ref",
+    "src": "source",
+    "ts": "ts",
+}
+
+# schedule.json keys that live in their own tables
+_SCHEDULE_TABLE_KEYS = ("weeks", "played")
+
+
+class SQLiteStorage:
+    """
+    Same interface as JSONStorage, backed by one SQLite database in WAL mode.
+    Writes are row-level and transactional; version counters in `meta` let
+    readers keep in-memory copies and notice changes from other processes.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path = SQLITE_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # stats helpers run in worker threads (asyncio.to_thread)
+        self._lock = threading.RLock()
+        self._tx_depth = 0
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+
+        self.parses = {"standings": 0, "schedule": 0}
+        self._cache: Dict[str, tuple[Any, Any]] = {}
+
+        if self._meta_get("imported") is None:
+            self.import_from(JSONStorage())
+
+    # ---------- plumbing ----------
+    def _tx(self):
+        return _Transaction(self)
+
+    def _meta_get(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _meta_set(self, key: str, value):
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, None if value is None else json.dumps(value)),
+        )
+
+    def _bump(self, key: str):
+        self._conn.execute(
+            "INSERT INTO meta (key, version) VALUES (?, 1) "
+            "ON CONFLICT(key) DO UPDATE SET version = version + 1",
+            (f"v.{key}",),
+        )
+
+    def version(self, key: str):
+        with self._lock:
+            row = self._conn.execute("SELECT version FROM meta WHERE key = ?", (f"v.{key}",)).fetchone()
+        return row["version"] if row else 0
+
+    def _cached(self, key: str, build):
+        version = self.version(key)
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+
+        with self._lock:
+            value = build()
+        self._cache[key] = (version, value)
+        if key in self.parses:
+            self.parses[key] += 1
+        return value
+
+    def parse_counts(self) -> Dict[str, int]:
+        return dict(self.parses)
+
+    def invalidate(self):
+        self._cache.clear()
+
+    # ---------- standings ----------
+    def _build_standings(self) -> Optional[Dict[str, Any]]:
+        rows = self._conn.execute("SELECT * FROM teams").fetchall()
+        season = self._meta_get("standings.season")
+        if not rows and season is None:
+            return None
+
+        return {
+            "season": json.loads(season) if season is not None else 1,
+            "standings_message_id": json.loads(self._meta_get("standings.message_id") or "null"),
+            "ledger_seq": json.loads(self._meta_get("standings.ledger_seq") or "0"),
+            "teams": {
+                r["team"]: {
+                    "wins": r["wins"],
+                    "losses": r["losses"],
+                    "pf": r["pf"],
+                    "pa": r["pa"],
+                    "streak": r["streak"],
+                }
+                for r in rows
+            },
+        }
+
+    def load_standings(self) -> Optional[Dict[str, Any]]:
+        return self._cached("standings", self._build_standings)
+
+    def save_standings(self, data: Dict[str, Any]):
+        teams = data.get("teams", {})
+        with self._tx():
+            self._conn.executemany(
+                "INSERT INTO teams (team, wins, losses, pf, pa, streak) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(team) DO UPDATE SET wins = excluded.wins, losses = excluded.losses, "
+                "pf = excluded.pf, pa = excluded.pa, streak = excluded.streak",
+                [
+                    (
+                        team,
+                        int(s.get("wins", 0)),
+                        int(s.get("losses", 0)),
+                        int(s.get("pf", 0)),
+                        int(s.get("pa", 0)),
+                        int(s.get("streak", 0)),
+                    )
+                    for team, s in teams.items()
+                ],
+            )
+            if teams:
+                marks = ",".join("?" * len(teams))
+                self._conn.execute(f"DELETE FROM teams WHERE team NOT IN ({marks})", list(teams))
+            else:
+                self._conn.execute("DELETE FROM teams")
+
+            self._meta_set("standings.season", data.get("season", 1))
+            self._meta_set("standings.message_id", data.get("standings_message_id"))
+            self._meta_set("standings.ledger_seq", data.get("ledger_seq", 0))
+            self._bump("standings")
+
+        self._cache["standings"] = (self.version("standings"), copy.deepcopy(data))
+
+    # ---------- games (ledger) ----------
+    @staticmethod
+    def _row_to_game(row: sqlite3.Row) -> Dict[str, Any]:
+        entry = {key: row[col] for key, col in _GAME_COLUMNS.items() if row[col] is not None}
+        if row["extra"]:
+            entry.update(json.loads(row["extra"]))
+        return entry
+
+    def _build_games(self) -> list[Dict[str, Any]]:
+        rows = self._conn.execute("SELECT * FROM games ORDER BY seq").fetchall()
+        return [self._row_to_game(r) for r in rows]
+
+    def games(self) -> list[Dict[str, Any]]:
+        return self._cached("games", self._build_games)
+
+    def games_after(self, seq: int) -> list[Dict[str, Any]]:
+        games = self.games()
+        if 0 <= seq <= len(games) and (seq == 0 or int(games[seq - 1]["seq"]) == seq):
+            return games[seq:]
+        return [g for g in games if int(g["seq"]) > seq]
+
+    def get_game(self, seq: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM games WHERE seq = ?", (int(seq),)).fetchone()
+        return self._row_to_game(row) if row else None
+
+    def last_game_seq(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(seq) AS seq FROM games").fetchone()
+        return int(row["seq"] or 0)
+
+    def _insert_game(self, entry: Dict[str, Any]):
+        extra = {k: v for k, v in entry.items() if k not in _GAME_COLUMNS}
+        self._conn.execute(
+            "INSERT INTO games (seq, type, season, week, team1, team2, score1, score2, ref, source, ts, extra) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry["seq"],
+                entry["type"],
+                entry.get("season"),
+                entry.get("week"),
+                entry.get("t1"),
+                entry.get("t2"),
+                entry.get("s1"),
+                entry.get("s2"),
+                entry.get("ref"),
+                entry.get("src"),
+                entry.get("ts"),
+                json.dumps(extra, separators=(",", ":")) if extra else None,
+            ),
+        )
+
+    def append_game(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        with self._tx():
+            seq = max(self.last_game_seq(), _snapshot_seq(self.load_standings())) + 1
+            entry = {"seq": seq, "ts": int(time.time()), **entry}
+            self._insert_game(entry)
+            self._bump("games")
+
+        hit = self._cache.get("games")
+        if hit is not None:
+            self._cache["games"] = (self.version("games"), hit[1] + [entry])
+        return entry
+
+    # ---------- schedule ----------
+    def _build_schedule(self) -> Optional[Dict[str, Any]]:
+        doc = self._meta_get("schedule.doc")
+        if doc is None:
+            return None
+
+        data = json.loads(doc)
+        weeks: Dict[str, list] = {}
+        for r in self._conn.execute("SELECT week, team1, team2 FROM schedule_games ORDER BY week, slot"):
+            weeks.setdefault(str(r["week"]), []).append([r["team1"], r["team2"]])
+
+        data["weeks"] = weeks
+        data["played"] = [
+            [r["team_a"], r["team_b"]]
+            for r in self._conn.execute("SELECT team_a, team_b FROM played ORDER BY rowid")
+        ]
+        return data
+
+    def load_schedule(self) -> Optional[Dict[str, Any]]:
+        return self._cached("schedule", self._build_schedule)
+
+    def save_schedule(self, data: Dict[str, Any]):
+        doc = {k: v for k, v in data.items() if k not in _SCHEDULE_TABLE_KEYS}
+
+        with self._tx():
+            self._conn.execute("DELETE FROM schedule_games")
+            self._conn.executemany(
+                "INSERT INTO schedule_games (week, slot, team1, team2) VALUES (?, ?, ?, ?)",
+                [
+                    (int(week), slot, a, b)
+                    for week, games in data.get("weeks", {}).items()
+                    for slot, (a, b) in enumerate(games)
+                ],
+            )
+            self._conn.execute("DELETE FROM played")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO played (team_a, team_b) VALUES (?, ?)",
+                [tuple(_played_key(a, b)) for a, b in data.get("played", [])],
+            )
+            self._meta_set("schedule.doc", doc)
+            self._bump("schedule")
+
+        self._cache["schedule"] = (self.version("schedule"), copy.deepcopy(data))
+
+    def mark_played(self, team_a: str, team_b: str):
+        with self._tx():
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO played (team_a, team_b) VALUES (?, ?)",
+                tuple(_played_key(team_a, team_b)),
+            )
+            if cur.rowcount:
+                self._bump("schedule")
+
+    def unmark_played(self, team_a: str, team_b: str):
+        with self._tx():
+            cur = self._conn.execute(
+                "DELETE FROM played WHERE team_a = ? AND team_b = ?",
+                tuple(_played_key(team_a, team_b)),
+            )
+            if cur.rowcount:
+                self._bump("schedule")
+
+    # ---------- roblox <-> discord links ----------
+    def load_links(self) -> Dict[str, Dict[str, Any]]:
+        cache = {"discord_to_roblox": {}, "roblox_to_discord": {}}
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM player_links ORDER BY updated_at").fetchall()
+
+        for r in rows:
+            cache["discord_to_roblox"][str(r["discord_id"])] = {
+                "discord_id": r["discord_id"],
+                "discord_name": r["discord_name"],
+                "discord_display_name": r["discord_display_name"],
+                "roblox_id": r["roblox_id"],
+                "roblox_username": r["roblox_username"],
+                "roblox_display_name": r["roblox_display_name"],
+                "updated_at": r["updated_at"],
+            }
+            cache["roblox_to_discord"][str(r["roblox_id"])] = r["discord_id"]
+        return cache
+
+    def save_link(self, entry: Dict[str, Any]):
+        with self._tx():
+            self._upsert_link(entry)
+
+    def save_link_batch(self, entries: list[Dict[str, Any]]):
+        with self._tx():
+            for entry in entries:
+                self._upsert_link(entry)
+
+    def delete_links(self, roblox_ids: list):
+        with self._tx():
+            self._conn.executemany(
+                "DELETE FROM player_links WHERE roblox_id = ?",
+                [(int(r),) for r in roblox_ids],
+            )
+
+    def save_links(self, cache: Dict[str, Dict[str, Any]]):
+        with self._tx():
+            for entry in cache.get("discord_to_roblox", {}).values():
+                self._upsert_link(entry)
+
+    def _upsert_link(self, entry: Dict[str, Any]):
+        self._conn.execute(
+            "INSERT INTO player_links (roblox_id, discord_id, discord_name, discord_display_name, "
+            "roblox_username, roblox_display_name, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(roblox_id) DO UPDATE SET discord_id = excluded.discord_id, "
+            "discord_name = excluded.discord_name, discord_display_name = excluded.discord_display_name, "
+            "roblox_username = excluded.roblox_username, roblox_display_name = excluded.roblox_display_name, "
+            "updated_at = excluded.updated_at",
+            (
+                int(entry["roblox_id"]),
+                int(entry["discord_id"]),
+                entry.get("discord_name"),
+                entry.get("discord_display_name"),
+                entry.get("roblox_username"),
+                entry.get("roblox_display_name"),
+                int(entry.get("updated_at") or time.time()),
+            ),
+        )
+
+    # ---------- cooldowns ----------
+    def get_cooldown(self, scope: str, user_id: int) -> float:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT ts FROM cooldowns WHERE scope = ? AND user_id = ?",
+                (scope, int(user_id)),
+            ).fetchone()
+        return row["ts"] if row else 0
+
+    def set_cooldown(self, scope: str, user_id: int, ts: float):
+        with self._tx():
+            self._conn.execute(
+                "INSERT INTO cooldowns (scope, user_id, ts) VALUES (?, ?, ?) "
+                "ON CONFLICT(scope, user_id) DO UPDATE SET ts = excluded.ts",
+                (scope, int(user_id), float(ts)),
+            )
+
+    # ---------- player statlines ----------
+    def statlines(self) -> list[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM statlines ORDER BY seq").fetchall()
+
+        return [
+            {
+                "seq": r["seq"],
+                "ts": r["ts"],
+                "game": r["game"],
+                "season": r["season"],
+                "week": r["week"],
+                "pos": r["position"],
+                "rid": r["roblox_id"],
+                "player": r["player"],
+                "team": r["team"],
+                "stats": json.loads(r["stats"]),
+            }
+            for r in rows
+        ]
+
+    def _insert_statlines(self, lines: list[Dict[str, Any]]):
+        self._conn.executemany(
+            "INSERT INTO statlines (seq, game, season, week, position, roblox_id, player, team, stats, ts) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    line["seq"],
+                    line.get("game"),
+                    line.get("season"),
+                    line.get("week"),
+                    line["pos"],
+                    line.get("rid"),
+                    line["player"],
+                    line.get("team"),
+                    json.dumps(line["stats"], separators=(",", ":")),
+                    line.get("ts"),
+                )
+                for line in lines
+            ],
+        )
+
+    def append_statlines(self, lines: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+        with self._tx():
+            row = self._conn.execute("SELECT MAX(seq) AS seq FROM statlines").fetchone()
+            seq = int(row["seq"] or 0)
+            now = int(time.time())
+
+            added = []
+            for line in lines:
+                seq += 1
+                added.append({"seq": seq, "ts": now, **line})
+            self._insert_statlines(added)
+        return added
+
+    # ---------- import / export ----------
+    def import_from(self, source: JSONStorage):
+        """One-time migration of the JSON files into the database."""
+        with self._tx():
+            standings = source.load_standings()
+            schedule = source.load_schedule()
+            games = source.games()
+            links = source.load_links()
+            statlines = source.statlines()
+
+            if standings:
+                self.save_standings(standings)
+            if schedule:
+                self.save_schedule(schedule)
+            for entry in games:
+                self._insert_game(entry)
+            if games:
+                self._bump("games")
+            self.save_links(links)
+            self._insert_statlines(statlines)
+
+            self._meta_set("imported", int(time.time()))
+
+        self._cache.clear()
+        print(
+            f"✅ Imported JSON data into {self.path.name}: "
+            f"{len(games)} ledger entries, {len(statlines)} statlines, "
+            f"{len(links['roblox_to_discord'])} player links"
+        )
+
+    def export_json(self, out_dir: Path = DATA_DIR) -> list[Path]:
+        """Writes the JSON documents the GitHub mirror and older tooling expect."""
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+
+        for name, data in (
+            ("standings.json", self.load_standings()),
+            ("schedule.json", self.load_schedule()),
+        ):
+            if data is None:
+                continue
+            CachedJSONFile(out_dir / name).write(data)
+            written.append(out_dir / name)
+
+        for name, entries in (("ledger.jsonl", self.games()), ("statlines.jsonl", self.statlines())):
+            path = out_dir / name
+            with open(path, "w", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            written.append(path)
+
+        return written
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class _Transaction:
+    """Nestable BEGIN IMMEDIATE ... COMMIT around the storage lock."""
+
+    def __init__(self, storage: SQLiteStorage):
+        self.storage = storage
+
+    def __enter__(self):
+        s = self.storage
+        s._lock.acquire()
+        s._tx_depth += 1
+        if s._tx_depth == 1:
+            s._conn.execute("BEGIN IMMEDIATE")
+        return s._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        s = self.storage
+        try:
+            s._tx_depth -= 1
+            if s._tx_depth == 0:
+                s._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            s._lock.release()
+        return False
+
+
+# =========================
+# ACTIVE BACKEND
+# =========================
+def _open_storage():
+    if STORAGE_BACKEND == "sqlite":
+        try:
+            return SQLiteStorage()
+        except Exception as e:
+            print(f"⚠️ SQLite storage unavailable, falling back to JSON: {type(e).__name__}: {e}")
+    elif STORAGE_BACKEND != "json":
+        print(f"⚠️ Unknown STORAGE_BACKEND '{STORAGE_BACKEND}', using JSON")
+    return JSONStorage()
+
+
+STORAGE = _open_storage()
@@ -0,0 +1,160 @@
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from utils.config import NFL_TEAMS, TEAM_EMOJI_NAME
+
+
+class AhoCorasick:
+    """
+    Multi-pattern matcher: one pass over a string finds every pattern in
+    it. Built as a full DFA over the patterns' alphabet (failure links
+    folded into the transition table), so the scan is one dict lookup per
+    character; characters outside the alphabet send it back to the root.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        self.delta: list[Dict[str, int]] = [{}]
+        self.out: list[tuple] = [()]
+
+        for pattern, payload in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self.delta[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.delta)
+                    self.delta[state][ch] = nxt
+                    self.delta.append({})
+                    self.out.append(())
+                state = nxt
+            self.out[state] += ((len(pattern), payload),)
+
+        self._link()
+
+    def _link(self):
+        trie = self.delta
+        alphabet = {ch for edges in trie for ch in edges}
+        goto = [dict(edges) for edges in trie]
+        fail = [0] * len(trie)
+
+        # breadth first: a failure target is always shallower, so its
+        # transitions and outputs are complete by the time they're copied
+        queue = deque(trie[0].values())
+        while queue:
+            state = queue.popleft()
+            self.out[state] += self.out[fail[state]]
+            for ch in alphabet:
+                nxt = trie[state].get(ch)
+                if nxt is not None:
+                    fail[nxt] = goto[fail[state]].get(ch, 0)
+                    queue.append(nxt)
+                else:
+                    goto[state][ch] = goto[fail[state]].get(ch, 0)
+
+        # transitions back to the root are implied by .get(ch, 0)
+        self.delta = [{ch: s for ch, s in edges.items() if s} for edges in goto]
+
+    def find_iter(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """(start, end, payload) for every pattern occurrence in `text`."""
+        delta, out = self.delta, self.out
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                for length, payload in out[state]:
+                    yield i + 1 - length, i + 1, payload
+
+
+# =========================
+# TEAM MENTIONS
+# =========================
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def team_aliases(teams: Iterable[str] = NFL_TEAMS, emoji_names: Optional[Dict[str, str]] = None):
+    """
+    (alias, team, whole_word) for every way a team shows up in an export:
+    the full name, the nickname ("Chiefs") and the emoji name
+    ("KansasCityChiefs"). Nicknames must stand alone as a word so "Rams"
+    doesn't fire inside "programs"; full and emoji names match anywhere.
+    """
+    emoji_names = TEAM_EMOJI_NAME if emoji_names is None else emoji_names
+    for team in teams:
+        yield team.lower(), team, False
+        nickname = team.split()[-1]
+        if nickname != team:
+            yield nickname.lower(), team, True
+        emoji = emoji_names.get(team)
+        if emoji and emoji.lower() != team.lower():
+            yield emoji.lower(), team, False
+
+
+def iter_strings(obj: Any) -> Iterator[str]:
+    """Every string value in a decoded JSON document, depth first, without building a list."""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            stack.extend(reversed(list(item.values())))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+
+
+class TeamDetector:
+    """Finds team mentions in report strings with one Aho–Corasick pass per string."""
+
+    def __init__(self, teams: Iterable[str] = NFL_TEAMS, emoji_names: Optional[Dict[str, str]] = None):
+        self.teams = list(teams)
+        self.order = {team: i for i, team in enumerate(self.teams)}
+        aliases = list(team_aliases(self.teams, emoji_names))
+        self.matcher = AhoCorasick((alias, (team, whole_word)) for alias, team, whole_word in aliases)
+        self.min_len = min((len(alias) for alias, _, _ in aliases), default=1)
+
+    def teams_in(self, text: str) -> set[str]:
+        # most export strings are ids, numbers and short names: skip what can't match
+        if len(text) < self.min_len or text.isdigit():
+            return set()
+
+        low = text.lower()
+        delta, out = self.matcher.delta, self.matcher.out
+        found = set()
+        state = 0
+        for i, ch in enumerate(low):
+            state = delta[state].get(ch, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            for length, (team, whole_word) in out[state]:
+                start = end - length
+                if whole_word and (
+                    (start > 0 and _is_word_char(low[start - 1]))
+                    or (end < len(low) and _is_word_char(low[end]))
+                ):
+                    continue
+                found.add(team)
+        return found
+
+    def count(self, strings: Iterable[str]) -> Dict[str, int]:
+        """How many of the strings mention each team (a string counts once per team)."""
+        counts: Dict[str, int] = {}
+        seen: Dict[str, set[str]] = {}   # exports repeat the same team string per player
+        for s in strings:
+            teams = seen.get(s)
+            if teams is None:
+                teams = seen[s] = self.teams_in(s)
+            for team in teams:
+                counts[team] = counts.get(team, 0) + 1
+        return counts
+
+    def top_two(self, report: Any) -> Tuple[Optional[str], Optional[str]]:
+        """The two most-mentioned teams in a decoded report (ties go to NFL_TEAMS order)."""
+        counts = self.count(iter_strings(report))
+        hits = sorted(counts, key=lambda t: (-counts[t], self.order[t]))
+        return (hits[0] if hits else None), (hits[1] if len(hits) > 1 else None)
+
+
+TEAM_DETECTOR = TeamDetector()
@@ -0,0 +1,133 @@
+import re
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+
+def _fold(s: str) -> str:
+    s = (s or "").strip().lower()
+    return re.sub(r"[^a-z0-9]", "", s)
+
+
+def trigrams(s: str) -> set[str]:
+    """Padded character trigrams of the folded name ("ab" -> {"  a", " ab", "ab "})."""
+    s = _fold(s)
+    if not s:
+        return set()
+    padded = f"  {s} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Inverted index of name trigrams. Every name gets an integer slot;
+    query() concatenates the posting arrays of the query's trigrams and
+    counts shared trigrams per slot with one np.bincount, so the cost is a
+    few vector ops over the guild rather than a Python loop per candidate.
+    Scores are Dice coefficients (0..1).
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.grams: Dict[str, set[str]] = {}     # name -> its trigrams
+        self.postings: Dict[str, set[int]] = {}  # trigram -> slots
+        self.slots: Dict[str, int] = {}          # name -> slot
+        self.slot_names: list[Optional[str]] = []
+        self.free: list[int] = []
+        self.sizes = np.zeros(64, dtype=np.float64)  # trigram count per slot, 0 when free
+
+        self._arrays: Dict[str, np.ndarray] = {}  # posting sets as arrays, built on demand
+        for name in names:
+            self.add(name)
+
+    def __len__(self):
+        return len(self.grams)
+
+    def __contains__(self, name):
+        return name in self.grams
+
+    # ---------- maintenance ----------
+    def add(self, name: str):
+        if not name or name in self.grams:
+            return
+        grams = trigrams(name)
+        if not grams:
+            return
+
+        if self.free:
+            slot = self.free.pop()
+            self.slot_names[slot] = name
+        else:
+            slot = len(self.slot_names)
+            self.slot_names.append(name)
+            if slot >= len(self.sizes):
+                self.sizes = np.concatenate([self.sizes, np.zeros(len(self.sizes))])
+
+        self.grams[name] = grams
+        self.slots[name] = slot
+        self.sizes[slot] = len(grams)
+        for g in grams:
+            self.postings.setdefault(g, set()).add(slot)
+            self._arrays.pop(g, None)
+
+    def remove(self, name: str):
+        grams = self.grams.pop(name, None)
+        if grams is None:
+            return
+
+        slot = self.slots.pop(name)
+        self.slot_names[slot] = None
+        self.sizes[slot] = 0
+        self.free.append(slot)
+        for g in grams:
+            self._arrays.pop(g, None)
+            slots = self.postings.get(g)
+            if slots is not None:
+                slots.discard(slot)
+                if not slots:
+                    del self.postings[g]
+
+    def clear(self):
+        self.grams.clear()
+        self.postings.clear()
+        self.slots.clear()
+        self.slot_names.clear()
+        self.free.clear()
+        self.sizes[:] = 0
+        self._arrays.clear()
+
+    def _posting_array(self, g: str) -> np.ndarray:
+        arr = self._arrays.get(g)
+        if arr is None:
+            arr = self._arrays[g] = np.fromiter(self.postings[g], dtype=np.int64)
+        return arr
+
+    # ---------- lookups ----------
+    def query(self, text: str, limit: int = 5, min_score: float = 0.0,
+              exclude: Optional[set[str]] = None) -> list[tuple[str, float]]:
+        """Best `limit` names for `text` as (name, score), highest score first."""
+        wanted = trigrams(text)
+        present = [g for g in wanted if g in self.postings]
+        if not present:
+            return []
+
+        n_slots = len(self.slot_names)
+        hits = np.bincount(
+            np.concatenate([self._posting_array(g) for g in present]), minlength=n_slots
+        )
+        scores = 2.0 * hits / (len(wanted) + self.sizes[:n_slots])
+
+        take = min(n_slots, limit + len(exclude or ()))
+        if take < n_slots:
+            top = np.argpartition(-scores, take - 1)[:take]
+        else:
+            top = np.arange(n_slots)
+        top = top[scores[top] >= max(min_score, 1e-9)]
+
+        out = []
+        for slot in top:
+            name = self.slot_names[slot]
+            if name is not None and not (exclude and name in exclude):
+                out.append((name, float(scores[slot])))
+
+        out.sort(key=lambda x: (-x[1], x[0]))
+        return out[:limit]
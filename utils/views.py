@@ -1,6 +1,8 @@
 import discord
 from datetime import datetime
 
+from utils.guild_registry import guild_registry
+from utils.roster_index import ROSTERS
 from utils.config import (
     TEAM_COLORS,
     TEAM_THUMBNAILS,
@@ -69,7 +71,7 @@ class OfferView(discord.ui.View):
         if interaction.user.id != self.player.id:
             return await interaction.response.send_message("This offer is not for you.", ephemeral=True)
 
-        if len(self.team_role.members) >= ROSTER_LIMIT:
+        if len(ROSTERS.roster(self.team_role.guild, self.team_role.name)) >= ROSTER_LIMIT:
             await interaction.response.edit_message(content="Roster is full.", view=None)
 
             embed = self.build_embed(
@@ -133,7 +135,7 @@ class ApplicationReviewView(discord.ui.View):
     @discord.ui.button(label="✅ Accept", style=discord.ButtonStyle.green)
     async def accept(self, interaction: discord.Interaction, button: discord.ui.Button):
 
-        role = discord.utils.get(interaction.guild.roles, name=self.role_name)
+        role = guild_registry(interaction.guild).role(self.role_name)
 
         if role:
             await self.applicant.add_roles(role)